@@ -1,10 +1,11 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from config.fieldsets import FieldsetSerializerMixin
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     department_name = serializers.CharField(
         source="department.name", read_only=True
     )
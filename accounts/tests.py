@@ -89,3 +89,63 @@ class UserAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["username"], "testuser")
         self.assertEqual(response.data["email"], "test@example.com")
+
+
+class TaskStatisticsTest(APITestCase):
+    def setUp(self):
+        from tasks.models import Task
+
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="admin",
+            password="testpass123",
+            employee_id="ADM001",
+            department=self.department,
+            role="ADMIN",
+        )
+        for status_, due_date in [
+            ("TODO", "2024-03-21T00:00:00Z"),
+            ("DONE", "2024-03-21T00:00:00Z"),
+            ("IN_PROGRESS", "2099-03-21T00:00:00Z"),
+        ]:
+            Task.objects.create(
+                title="작업",
+                description="설명",
+                status=status_,
+                priority="HIGH",
+                assignee=self.user,
+                reporter=self.user,
+                department=self.department,
+                start_date="2024-03-20T00:00:00Z",
+                due_date=due_date,
+            )
+        self.client.force_authenticate(user=self.user)
+
+    def test_tasks_statistics(self):
+        url = reverse("user-tasks-statistics", kwargs={"pk": self.user.pk})
+        # 사용자 조회 1회 + 집계 1회
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data["total_tasks"], 3)
+        self.assertEqual(response.data["delayed_tasks"], 1)
+        self.assertEqual(response.data["tasks_by_priority"]["HIGH"], 3)
+
+    def test_tasks_statistics_detail(self):
+        url = reverse(
+            "user-tasks-statistics-detail", kwargs={"pk": self.user.pk}
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.data["delayed_tasks"], 1)
+        self.assertEqual(
+            response.data["monthly_stats"]["2024-03"],
+            {
+                "total": 3,
+                "completed": 1,
+                "delayed": 1,
+                "avg_completion_time": 0,
+            },
+        )
@@ -7,14 +7,17 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
 from datetime import datetime
-from tasks.models import Task
+from tasks.models import Task, delayed_condition
+from tasks.stats import count_tasks
 from tasks.serializers import TaskSerializer
 from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from rest_framework.pagination import PageNumberPagination
 from organizations.models import Department
-from django.db.models import Case, When, IntegerField, CharField
+from organizations.scope import get_department_tree
+from django.db.models import Case, When, IntegerField, CharField, Count
+from django.db.models.functions import TruncMonth
 from django.db.models.functions import Concat
 from django.db.models import Value
 
@@ -22,6 +25,10 @@ from django.db.models import Value
 
 User = get_user_model()
 
+# 통계 응답의 키 순서
+PRIORITIES = ["URGENT", "HIGH", "MEDIUM", "LOW"]
+DIFFICULTIES = ["VERY_HARD", "HARD", "MEDIUM", "EASY"]
+
 
 # 페이지네이션 클래스 정의
 class StandardResultsSetPagination(PageNumberPagination):
@@ -46,17 +53,14 @@ def get_department_users(
     """
     부서 ID를 받아서 해당 부서와 하위 부서의 ID 목록을 반환
     """
-    try:
-        department = Department.objects.get(id=department_id)
-        dept_ids = [department_id]
+    tree = get_department_tree()
+    if department_id not in tree:
+        return []
 
-        if include_children and department.parent is None:  # 본부인 경우
-            child_depts = Department.objects.filter(parent=department_id)
-            dept_ids.extend(child_depts.values_list("id", flat=True))
+    if include_children:
+        return list(tree.descendants(department_id))
 
-        return dept_ids
-    except Department.DoesNotExist:
-        return []
+    return [department_id]
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -171,7 +175,9 @@ class UserViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def tasks_current(self, request, pk=None):
         user = self.get_object()
-        tasks = Task.objects.filter(assignee=user, status="IN_PROGRESS")
+        tasks = Task.objects.for_detail().filter(
+            assignee=user, status="IN_PROGRESS"
+        )
         serializer = TaskSerializer(tasks, many=True)
         return Response(serializer.data)
 
@@ -182,7 +188,7 @@ class UserViewSet(viewsets.ModelViewSet):
         start_date = request.query_params.get("start_date")
         end_date = request.query_params.get("end_date")
 
-        tasks = Task.objects.filter(assignee=user)
+        tasks = Task.objects.for_detail().filter(assignee=user)
 
         if status:
             tasks = tasks.filter(status=status)
@@ -228,19 +234,27 @@ class UserViewSet(viewsets.ModelViewSet):
         if end_date:
             tasks = tasks.filter(due_date__lte=end_date)
 
-        total_tasks = tasks.count()
-        completed_tasks = tasks.filter(status="DONE").count()
-        in_progress_tasks = tasks.filter(status="IN_PROGRESS").count()
-        delayed_tasks = len([task for task in tasks if task.is_delayed])
+        # 지연 여부를 포함한 모든 수치를 한 번의 집계 쿼리로 계산
+        counts = count_tasks(
+            tasks,
+            total=None,
+            completed=Q(status="DONE"),
+            in_progress=Q(status="IN_PROGRESS"),
+            delayed=delayed_condition(),
+            **{priority: Q(priority=priority) for priority in PRIORITIES},
+        )
+        total_tasks = counts["total"]
+        completed_tasks = counts["completed"]
+        in_progress_tasks = counts["in_progress"]
+        delayed_tasks = counts["delayed"]
 
         completion_rate = (
             (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         )
 
         tasks_by_priority = {
-            "HIGH": tasks.filter(priority="HIGH").count(),
-            "MEDIUM": tasks.filter(priority="MEDIUM").count(),
-            "LOW": tasks.filter(priority="LOW").count(),
+            priority: counts[priority]
+            for priority in ["HIGH", "MEDIUM", "LOW"]
         }
 
         return Response(
@@ -288,20 +302,30 @@ class UserViewSet(viewsets.ModelViewSet):
         if end_date:
             tasks = tasks.filter(due_date__lte=end_date)
 
+        # 분포와 지연 작업 수를 한 번의 집계 쿼리로 계산
+        counts = count_tasks(
+            tasks,
+            total=None,
+            delayed=delayed_condition(),
+            **{
+                f"priority_{priority}": Q(priority=priority)
+                for priority in PRIORITIES
+            },
+            **{
+                f"difficulty_{difficulty}": Q(difficulty=difficulty)
+                for difficulty in DIFFICULTIES
+            },
+        )
+
         # 우선순위 분포
         priority_distribution = {
-            "URGENT": tasks.filter(priority="URGENT").count(),
-            "HIGH": tasks.filter(priority="HIGH").count(),
-            "MEDIUM": tasks.filter(priority="MEDIUM").count(),
-            "LOW": tasks.filter(priority="LOW").count(),
+            priority: counts[f"priority_{priority}"] for priority in PRIORITIES
         }
 
         # 난이도 분포
         difficulty_distribution = {
-            "VERY_HARD": tasks.filter(difficulty="VERY_HARD").count(),
-            "HARD": tasks.filter(difficulty="HARD").count(),
-            "MEDIUM": tasks.filter(difficulty="MEDIUM").count(),
-            "EASY": tasks.filter(difficulty="EASY").count(),
+            difficulty: counts[f"difficulty_{difficulty}"]
+            for difficulty in DIFFICULTIES
         }
 
         # 평균 작업 완료 시간 (완료된 작업만)
@@ -318,29 +342,32 @@ class UserViewSet(viewsets.ModelViewSet):
             avg_completion_time = total_hours / completed_tasks.count()
 
         # 지연된 작업 비율
-        total_tasks = tasks.count()
-        delayed_tasks = len([task for task in tasks if task.is_delayed])
+        total_tasks = counts["total"]
+        delayed_tasks = counts["delayed"]
         delay_rate = (
             (delayed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         )
 
-        # 월별 통계
-        monthly_stats = {}
-        for task in tasks:
-            month_key = task.start_date.strftime("%Y-%m")
-            if month_key not in monthly_stats:
-                monthly_stats[month_key] = {
-                    "total": 0,
-                    "completed": 0,
-                    "delayed": 0,
-                    "avg_completion_time": 0,
-                }
-
-            monthly_stats[month_key]["total"] += 1
-            if task.status == "DONE":
-                monthly_stats[month_key]["completed"] += 1
-            if task.is_delayed:
-                monthly_stats[month_key]["delayed"] += 1
+        # 월별 통계 (시작월 기준 GROUP BY)
+        monthly = (
+            tasks.annotate(month=TruncMonth("start_date"))
+            .values("month")
+            .annotate(
+                total=Count("pk"),
+                completed=Count("pk", filter=Q(status="DONE")),
+                delayed=Count("pk", filter=delayed_condition()),
+            )
+            .order_by("month")
+        )
+        monthly_stats = {
+            row["month"].strftime("%Y-%m"): {
+                "total": row["total"],
+                "completed": row["completed"],
+                "delayed": row["delayed"],
+                "avg_completion_time": 0,
+            }
+            for row in monthly
+        }
 
         # 평균 점수 계산 (평가가 있는 완료된 작업만)
         completed_tasks_with_eval = tasks.filter(
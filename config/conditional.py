@@ -0,0 +1,73 @@
+"""조건부 요청 (ETag / If-None-Match)
+
+대시보드처럼 같은 응답을 주기적으로 다시 받는 엔드포인트용. 응답 본문을
+해시하는 대신 값싼 검증자(조회 범위 작업의 최대 updated_at + 건수, 보고서
+캐시 키 등)로 ETag를 만들고, If-None-Match가 일치하면 집계/직렬화 없이
+304를 돌려준다.
+
+검증자는 응답을 만들기 전에 계산하므로, 그 사이에 데이터가 바뀌면 다음
+요청에서 ETag가 달라져 새 응답을 받는다. (오래된 304는 보내지 않음)
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.response import Response
+
+
+def queryset_validator(queryset, **aggregates):
+    """조회 결과가 바뀌었는지 판단할 값 (최대 updated_at, 건수, 추가 집계)
+
+    한 번의 집계 쿼리로 계산한다. 시각에 따라 달라지는 값(지연 건수 등)은
+    aggregates로 함께 넘긴다.
+    """
+    values = queryset.order_by().aggregate(
+        last_modified=Max("updated_at"), count=Count("pk"), **aggregates
+    )
+    return list(values.values())
+
+
+def make_etag(request, validator):
+    """요청 경로/파라미터, 조회자 권한과 검증자로 만든 ETag"""
+    user = request.user
+    parts = [
+        request.path,
+        request.GET.urlencode(),
+        user.pk,
+        user.role,
+        user.rank,
+        user.department_id,
+        *validator,
+    ]
+    raw = "|".join(str(part) for part in parts)
+    return quote_etag(hashlib.sha1(raw.encode()).hexdigest())
+
+
+def etag_matches(request, etag):
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    # 압축 등으로 약한 ETag(W/"...")가 되어 돌아와도 같은 값으로 본다
+    etags = [value.removeprefix("W/") for value in parse_etags(header)]
+    return "*" in etags or etag in etags
+
+
+def conditional_response(request, validator, build):
+    """If-None-Match가 현재 ETag와 같으면 304, 아니면 build()의 응답
+
+    validator: 응답 내용이 바뀌면 함께 바뀌는 값 목록
+    build: 실제 응답(Response)을 만드는 함수
+    """
+    etag = make_etag(request, validator)
+    if etag_matches(request, etag):
+        response = Response(status=304)
+    else:
+        response = build()
+        if response.status_code != 200:
+            return response
+    response["ETag"] = etag
+    # 브라우저/프록시가 저장하되 매번 ETag로 재검증하도록
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,110 @@
+"""목록 API 전체 개수(count) 계산 전략
+
+settings.PAGINATION_COUNT_STRATEGY로 선택한다.
+- exact: 항상 COUNT
+- cached: 같은 조건(정렬 제외 SQL)의 COUNT 결과를 잠시 캐시
+- estimate: 조건 없는 큰 테이블은 PostgreSQL 통계(pg_class.reltuples) 사용
+- auto: estimate → 작은 결과는 exact → 나머지는 cached 순으로 적용
+
+count_rows()는 (개수, 추정치 여부)를 반환한다.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+EXACT = "exact"
+CACHED = "cached"
+ESTIMATE = "estimate"
+AUTO = "auto"
+STRATEGIES = [EXACT, CACHED, ESTIMATE, AUTO]
+
+CACHE_KEY = "pagination:count:{}"
+
+
+def is_unfiltered(queryset):
+    """WHERE 조건이 없는(테이블 전체) 조회인지"""
+    query = queryset.query
+    return not query.where and not query.is_sliced
+
+
+def estimated_count(queryset):
+    """테이블 통계상 행 수 (PostgreSQL 외에는 None)"""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = to_regclass(%s)",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # 한 번도 ANALYZE되지 않은 테이블은 -1
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+def count_cache_key(queryset):
+    """정렬/표시용 주석을 제외한 SQL과 파라미터로 만든 캐시 키
+
+    조회자 권한 범위도 WHERE 조건에 포함되므로 사용자 간에 섞이지 않는다.
+    (현재 시각이 들어가는 지연 여부 주석 등은 조건에 쓰일 때만 키에 포함)
+    """
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    raw = f"{queryset.db}|{sql}|{params!r}"
+    return CACHE_KEY.format(hashlib.sha1(raw.encode()).hexdigest())
+
+
+def cached_count(queryset):
+    key = count_cache_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def bounded_count(queryset, limit):
+    """limit개까지만 센 개수 (limit 초과 여부 확인용)"""
+    return queryset.order_by()[: limit + 1].count()
+
+
+def count_rows(queryset, strategy=None):
+    """(전체 개수, 추정치 여부)"""
+    strategy = strategy or settings.PAGINATION_COUNT_STRATEGY
+    if queryset.query.is_empty():
+        return 0, False
+
+    if strategy in (ESTIMATE, AUTO) and is_unfiltered(queryset):
+        estimate = estimated_count(queryset)
+        if (
+            estimate is not None
+            and estimate >= settings.PAGINATION_ESTIMATE_MIN_ROWS
+        ):
+            return estimate, True
+
+    if strategy == EXACT:
+        return queryset.count(), False
+
+    if strategy == AUTO:
+        key = count_cache_key(queryset)
+        count = cache.get(key)
+        if count is not None:
+            return count, False
+        limit = settings.PAGINATION_EXACT_COUNT_LIMIT
+        count = bounded_count(queryset, limit)
+        if count <= limit:
+            return count, False
+        # 큰 결과만 캐시 (작은 결과는 매번 세도 저렴)
+        count = queryset.count()
+        cache.set(key, count, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count, False
+
+    if strategy == CACHED:
+        return cached_count(queryset), False
+
+    return queryset.count(), False
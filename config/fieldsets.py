@@ -0,0 +1,107 @@
+"""응답 필드 선택 (?fields= / ?omit= / ?expand=)
+
+- fields: 포함할 필드 목록 (예: ?fields=id,title,status)
+- omit: 제외할 필드 목록 (예: ?omit=description)
+- expand: 기본 응답에 없는 확장 필드 포함 (예: ?expand=comments)
+
+직렬화 클래스에는 FieldsetSerializerMixin을, 뷰셋에는 FieldsetViewSetMixin을
+함께 사용하면 응답에서 빠지는 무거운 컬럼은 쿼리에서도 defer()된다.
+"""
+
+from dataclasses import dataclass, field
+
+# 필드 선택은 조회 요청에만 적용 (쓰기 요청은 검증/응답 모두 전체 필드)
+FIELDSET_METHODS = ("GET", "HEAD")
+
+
+def parse_names(value):
+    """"a, b,,c" -> {"a", "b", "c"}"""
+    if not value:
+        return set()
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    fields: frozenset = None
+    omit: frozenset = field(default_factory=frozenset)
+    expand: frozenset = field(default_factory=frozenset)
+
+    @classmethod
+    def from_request(cls, request):
+        if request is None or request.method not in FIELDSET_METHODS:
+            return cls()
+        params = request.query_params
+        fields = parse_names(params.get("fields"))
+        return cls(
+            fields=frozenset(fields) if fields else None,
+            omit=frozenset(parse_names(params.get("omit"))),
+            expand=frozenset(parse_names(params.get("expand"))),
+        )
+
+    def apply(self, names, expandable=()):
+        """기본 필드 목록(names)에 확장/선택/제외를 적용한 필드 집합"""
+        selected = set(names) | (self.expand & set(expandable))
+        if self.fields is not None:
+            selected &= self.fields | self.expand
+        return selected - self.omit
+
+
+class FieldsetSerializerMixin:
+    """요청 파라미터에 따라 응답 필드를 고르는 직렬화 믹스인
+
+    Meta.expandable_fields = {이름: (직렬화 클래스, 옵션)}
+        ?expand=이름 일 때만 포함되는 필드
+    Meta.deferrable_fields = [모델 필드명, ...]
+        응답에 포함되지 않으면 defer()해도 되는 무거운 컬럼
+
+    뷰에서 context={"request": ...}로 생성한 최상위 직렬화에만 적용되며,
+    중첩 직렬화나 request 없이 생성한 경우에는 기본 필드를 그대로 사용한다.
+    """
+
+    def __init__(self, *args, fieldset=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fieldset is None:
+            fieldset = Fieldset.from_request(self.context.get("request"))
+        self.fieldset = fieldset
+
+        expandable = getattr(self.Meta, "expandable_fields", {})
+        for name in fieldset.expand & expandable.keys():
+            serializer_class, options = expandable[name]
+            self.fields[name] = serializer_class(**options)
+
+        selected = fieldset.apply(self.fields.keys(), expandable)
+        for name in list(self.fields.keys()):
+            if name not in selected:
+                self.fields.pop(name)
+
+    @classmethod
+    def get_deferred_fields(cls, fieldset):
+        """응답에 포함되지 않아 defer()할 수 있는 모델 필드 목록"""
+        selected = fieldset.apply(
+            cls.Meta.fields, getattr(cls.Meta, "expandable_fields", {})
+        )
+        return [
+            name
+            for name in getattr(cls.Meta, "deferrable_fields", [])
+            if name not in selected
+        ]
+
+
+class FieldsetViewSetMixin:
+    """응답에서 빠지는 무거운 컬럼을 쿼리에서 제외하는 뷰셋 믹스인"""
+
+    def get_fieldset(self):
+        return Fieldset.from_request(self.request)
+
+    def prune_queryset(self, queryset, serializer_class=None):
+        # 조회 요청에서만 적용 (수정 후 응답은 전체 필드 필요)
+        if self.request.method not in FIELDSET_METHODS:
+            return queryset
+
+        serializer_class = serializer_class or self.get_serializer_class()
+        if not hasattr(serializer_class, "get_deferred_fields"):
+            return queryset
+
+        deferred = serializer_class.get_deferred_fields(self.get_fieldset())
+        return queryset.defer(*deferred) if deferred else queryset
@@ -0,0 +1,223 @@
+"""목록 API 페이지네이션
+
+기본은 페이지 번호(?page=) 방식이며, ?cursor= 파라미터가 있으면
+정렬 키(예: start_date, id) 기준 keyset 방식으로 동작한다.
+
+keyset 방식은 OFFSET 없이 "마지막으로 본 행 다음"을 WHERE 조건으로
+조회하므로 몇 번째 페이지든 첫 페이지와 같은 비용이 든다.
+- 첫 페이지: ?cursor= (빈 값)
+- 다음/이전 페이지: 응답의 next/previous 링크
+- 전체 개수는 기본 생략, ?count=true 이면 포함
+
+전체 개수는 config.counting의 전략(정확/캐시/추정)으로 계산하며
+추정치인 경우 응답의 count_is_estimate가 true이다.
+"""
+
+import base64
+import json
+import math
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .counting import count_rows
+
+TRUE_VALUES = {"1", "true", "yes"}
+
+
+def get_keyset(queryset):
+    """쿼리셋 정렬 기준을 [(필드명, 내림차순 여부), ...]로 변환
+
+    정렬이 유일하도록 마지막에 기본 키를 추가한다.
+    """
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    pk_name = queryset.model._meta.pk.attname
+
+    keyset = []
+    for term in ordering:
+        if not isinstance(term, str):
+            raise ValueError("keyset 페이지네이션은 필드명 정렬만 지원")
+        name = term.lstrip("-")
+        keyset.append((pk_name if name == "pk" else name, term[0] == "-"))
+
+    if not any(name == pk_name for name, _ in keyset):
+        descending = keyset[-1][1] if keyset else False
+        keyset.append((pk_name, descending))
+    return keyset
+
+
+def keyset_condition(keyset, values, reverse=False):
+    """(a, b, id) > (va, vb, vid) 형태의 조건 (정렬 방향별로 비교 연산 결정)
+
+    a > va OR (a = va AND (b > vb OR (b = vb AND id > vid)))
+    """
+    condition = None
+    for (name, descending), value in reversed(list(zip(keyset, values))):
+        lookup = "lt" if descending != reverse else "gt"
+        after = Q(**{f"{name}__{lookup}": value})
+        if condition is None:
+            condition = after
+        else:
+            condition = after | (Q(**{name: value}) & condition)
+    return condition
+
+
+class CountingPaginator(Paginator):
+    """설정된 개수 계산 전략을 사용하는 Paginator"""
+
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return len(self.object_list)
+        count, self.count_is_estimate = count_rows(self.object_list)
+        return count
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    django_paginator_class = CountingPaginator
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.keyset = None
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_keyset(queryset, request)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.get_keyset_response(data)
+
+        count = self.page.paginator.count
+        return Response(
+            {
+                "count": count,
+                "count_is_estimate": self.page.paginator.count_is_estimate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "total_pages": math.ceil(
+                    count / self.page.paginator.per_page
+                ),
+                "current_page": self.page.number,
+                "results": data,
+            }
+        )
+
+    # keyset(커서) 방식
+
+    def paginate_keyset(self, queryset, request):
+        self.model = queryset.model
+        self.keyset = get_keyset(queryset)
+        page_size = self.get_page_size(request)
+
+        self.total = None
+        if request.query_params.get(self.count_query_param) in TRUE_VALUES:
+            self.total, self.total_is_estimate = count_rows(queryset)
+
+        values, reverse = self.decode_cursor(request)
+        self.has_cursor = values is not None
+        self.reverse = reverse
+        if values is not None:
+            queryset = queryset.filter(
+                keyset_condition(self.keyset, values, reverse)
+            )
+
+        # 이전 페이지는 정렬을 뒤집어 조회한 뒤 다시 뒤집는다
+        order_by = [
+            ("-" if descending != reverse else "") + name
+            for name, descending in self.keyset
+        ]
+        rows = list(queryset.order_by(*order_by)[: page_size + 1])
+        self.has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        self.first_values = self.row_values(rows[0]) if rows else None
+        self.last_values = self.row_values(rows[-1]) if rows else None
+        return rows
+
+    def row_values(self, row):
+        return [getattr(row, name) for name, _ in self.keyset]
+
+    def decode_cursor(self, request):
+        """커서 문자열 -> (정렬 키 값 목록, 이전 페이지 여부)"""
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded))
+            raw_values = data["v"]
+            if len(raw_values) != len(self.keyset):
+                raise ValueError
+            values = [
+                self.to_python(name, value)
+                for (name, _), value in zip(self.keyset, raw_values)
+            ]
+            return values, bool(data.get("r"))
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def to_python(self, name, value):
+        # 모델 필드는 필드 타입으로 변환 (주석 값은 JSON 값 그대로 사용)
+        try:
+            field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return value
+        return field.to_python(value)
+
+    def encode_cursor(self, values, reverse):
+        data = {"v": values}
+        if reverse:
+            data["r"] = 1
+        # 마이크로초까지 보존해야 같은 시각의 행을 정확히 구분할 수 있음
+        raw = json.dumps(data, default=str).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def cursor_link(self, values, reverse):
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.page_query_param
+        )
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values, reverse)
+        )
+
+    def get_keyset_response(self, data):
+        # 이전 페이지 방향으로 왔다면 다음 페이지는 항상 존재
+        has_next = self.has_more if not self.reverse else self.has_cursor
+        has_previous = self.has_cursor if not self.reverse else self.has_more
+
+        response = {
+            "next": (
+                self.cursor_link(self.last_values, False)
+                if has_next and self.last_values
+                else None
+            ),
+            "previous": (
+                self.cursor_link(self.first_values, True)
+                if has_previous and self.first_values
+                else None
+            ),
+            "results": data,
+        }
+        if self.total is not None:
+            response = {
+                "count": self.total,
+                "count_is_estimate": self.total_is_estimate,
+                **response,
+            }
+        return Response(response)
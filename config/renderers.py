@@ -0,0 +1,62 @@
+"""orjson 기반 JSON 렌더러/파서
+
+DRF 기본 JSONRenderer(표준 json + JSONEncoder)와 같은 결과를 내도록
+맞춘 빠른 구현. settings.REST_FRAMEWORK의 기본 렌더러/파서로 등록하며
+미디어 타입(application/json)이 같으므로 클라이언트 변경은 필요 없다.
+
+- datetime/date/time/UUID: orjson 기본 처리 (UTC는 "Z"로 표기)
+- timedelta(Avg(F("completed_at") - F("start_date")) 등), Decimal,
+  지연 번역 문자열, QuerySet 등: DRF JSONEncoder 규칙을 그대로 사용
+"""
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# 정수 키 dict(통계 응답 등)도 표준 json처럼 문자열 키로 출력
+OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_encoder = JSONEncoder()
+
+
+def default(obj):
+    """orjson이 직접 처리하지 못하는 타입 (DRF JSONEncoder와 동일한 변환)"""
+    return _encoder.default(obj)
+
+
+def dumps(data, indent=False):
+    option = (OPTIONS | orjson.OPT_INDENT_2) if indent else OPTIONS
+    # DRF JSONRenderer처럼 U+2028/U+2029를 이스케이프
+    # (JSON에는 허용되지만 <script> 안에 넣으면 JavaScript 문법 오류)
+    return (
+        orjson.dumps(data, default=default, option=option)
+        .replace(b"\xe2\x80\xa8", b"\\u2028")
+        .replace(b"\xe2\x80\xa9", b"\\u2029")
+    )
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # 들여쓰기 폭은 2로 고정 (orjson 제약, 브라우저블 API 등)
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return dumps(data, indent=bool(indent))
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            data = stream.read()
+            if encoding.lower().replace("-", "") != "utf8":
+                data = data.decode(encoding)
+            return orjson.loads(data)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
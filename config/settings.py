@@ -21,6 +21,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "drf_spectacular",
@@ -31,8 +32,9 @@ INSTALLED_APPS = [
     "accounts.apps.AccountsConfig",
     "tasks.apps.TasksConfig",
     "notifications",
-    "reports",
+    "reports.apps.ReportsConfig",
     "activities",
+    "search.apps.SearchConfig",
 ]
 
 MIDDLEWARE = [
@@ -49,6 +51,8 @@ MIDDLEWARE = [
 # CORS 설정 (보안 완화)
 CORS_ORIGIN_ALLOW_ALL = True  # 모든 출처에서의 요청 허용
 CORS_ALLOW_CREDENTIALS = True
+# 캘린더 증분 동기화 헤더를 브라우저에서 읽을 수 있도록
+CORS_EXPOSE_HEADERS = ["X-Sync-Token", "X-Sync-Full"]
 
 # CSRF 및 세션 쿠키 설정 (보안 완화)
 CSRF_COOKIE_SAMESITE = "None"  # 모든 출처에서 쿠키 허용
@@ -144,8 +148,99 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # JSON 입출력은 orjson 사용 (config/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "config.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # 모든 프로세스(노드)가 함께 봐야 하는 무효화 버전/표식 (config/versions.py)
+    # 기본은 DB 캐시 테이블 (배포 시 python manage.py createcachetable 필요)
+    "shared": {
+        "BACKEND": os.getenv(
+            "SHARED_CACHE_BACKEND",
+            "django.core.cache.backends.db.DatabaseCache",
+        ),
+        "LOCATION": os.getenv("SHARED_CACHE_LOCATION", "shared_cache"),
+        "TIMEOUT": None,
+    },
+    # 보고서 결과 캐시 (프로세스 간 공유되도록 기본은 파일 기반)
+    # 테스트에서는 config/test_runner.py가 메모리 캐시로 바꿔 실행
+    "reports": {
+        "BACKEND": os.getenv(
+            "REPORT_CACHE_BACKEND",
+            "django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.getenv(
+            "REPORT_CACHE_LOCATION", os.path.join(BASE_DIR, "cache", "reports")
+        ),
+        "TIMEOUT": int(os.getenv("REPORT_CACHE_TIMEOUT", str(60 * 60 * 24))),
+    },
 }
 
+# 다른 프로세스의 변경(shared 캐시의 무효화 버전, 자동완성 변경 기록)을
+# 다시 확인하기 전까지 프로세스 안에서 재사용할 시간 (초)
+# (config/versions.py, search/index.py) 다른 프로세스의 변경은 최대 이만큼
+# 늦게 반영
+SHARED_VERSION_TTL = float(os.getenv("SHARED_VERSION_TTL", "2"))
+
+# 종료일이 오늘 이후인(진행 중인) 기간의 보고서 캐시 유지 시간 (초)
+REPORT_CACHE_OPEN_PERIOD_TIMEOUT = int(
+    os.getenv("REPORT_CACHE_OPEN_PERIOD_TIMEOUT", "60")
+)
+
+# 목록 API 전체 개수(count) 계산 방식
+# - exact: 항상 COUNT
+# - cached: 같은 조건의 COUNT 결과를 잠시 캐시
+# - estimate: 조건 없는 큰 테이블은 PostgreSQL 통계(pg_class) 추정치 사용
+# - auto: 큰 무조건 조회는 추정치, 작은 결과는 COUNT, 나머지는 캐시
+PAGINATION_COUNT_STRATEGY = os.getenv("PAGINATION_COUNT_STRATEGY", "auto")
+# 이 개수 이하의 결과는 항상 정확히 센다
+PAGINATION_EXACT_COUNT_LIMIT = int(
+    os.getenv("PAGINATION_EXACT_COUNT_LIMIT", "1000")
+)
+# 통계상 행 수가 이 값 이상인 테이블만 추정치를 사용
+PAGINATION_ESTIMATE_MIN_ROWS = int(
+    os.getenv("PAGINATION_ESTIMATE_MIN_ROWS", "100000")
+)
+PAGINATION_COUNT_CACHE_TIMEOUT = int(
+    os.getenv("PAGINATION_COUNT_CACHE_TIMEOUT", "30")
+)
+
+# 알림 실시간 전송(SSE) fan-out 백엔드 (notifications/stream.py)
+# - notifications.stream.InProcessBroker: 단일 노드 (프로세스 내 전달)
+# - notifications.stream.PostgresBroker: 여러 노드 (LISTEN/NOTIFY)
+NOTIFICATION_STREAM_BACKEND = os.getenv(
+    "NOTIFICATION_STREAM_BACKEND", "notifications.stream.InProcessBroker"
+)
+# 변경이 없을 때 연결 유지용 주석을 보내는 간격 (초)
+NOTIFICATION_STREAM_HEARTBEAT = int(
+    os.getenv("NOTIFICATION_STREAM_HEARTBEAT", "15")
+)
+# 스트림 연결용 티켓 유효 시간 (초, EventSource는 JWT 헤더를 보낼 수 없음)
+NOTIFICATION_STREAM_TICKET_TTL = int(
+    os.getenv("NOTIFICATION_STREAM_TICKET_TTL", "60")
+)
+
+# 자동완성 인덱스에 올릴 최근 작업 수 (최근 수정순)
+SEARCH_SUGGEST_TASK_LIMIT = int(
+    os.getenv("SEARCH_SUGGEST_TASK_LIMIT", "5000")
+)
+
+# 대시보드 통합 API의 패널 동시 실행 스레드 수 (1이면 순차 실행)
+# 프로세스마다 하나의 스레드 풀을 쓰며, 스레드마다 DB 연결을 하나씩 유지
+DASHBOARD_MAX_WORKERS = int(os.getenv("DASHBOARD_MAX_WORKERS", "4"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Company Task Manager API",
     "DESCRIPTION": "API for managing company tasks and employee workflows",
@@ -169,6 +264,8 @@ SPECTACULAR_SETTINGS = {
 
 AUTH_USER_MODEL = "accounts.User"
 
+TEST_RUNNER = "config.test_runner.TestRunner"
+
 # Simple JWT 설정 (간소화된 보안 설정)
 SIMPLE_JWT = {
     # 기존 설정 유지
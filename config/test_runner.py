@@ -0,0 +1,29 @@
+"""테스트 실행기 (settings.TEST_RUNNER)
+
+보고서 결과 캐시는 기본이 파일 기반이라 테스트 실행 사이에 결과가 남아
+이전 실행의 데이터로 만든 보고서를 돌려줄 수 있으므로, 테스트 동안만
+메모리 캐시로 바꾼다. shared 캐시(config/versions.py)는 운영과 같은
+백엔드(DB 캐시 테이블, 테스트 DB 생성 시 함께 만들어짐)를 그대로 쓴다.
+"""
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        reports = {
+            **settings.CACHES["reports"],
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "reports",
+        }
+        self.cache_override = override_settings(
+            CACHES={**settings.CACHES, "reports": reports}
+        )
+        self.cache_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.cache_override.disable()
+        super().teardown_test_environment(**kwargs)
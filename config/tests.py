@@ -0,0 +1,302 @@
+"""API 성능 회귀 테스트
+
+합성 조직(tasks.seeding)을 만든 뒤 라우터에 등록된 모든 GET 엔드포인트를
+역할별로 호출하고, 쿼리 수와 응답 시간이 perf_budgets.json의 기준을
+넘지 않는지 확인한다. (N+1 쿼리 회귀 방지)
+
+응답 시간은 실행하는 머신에 따라 달라지므로 PERF_CHECK_TIME=1일 때만
+확인한다. (쿼리 수는 항상 확인)
+
+기준 파일 갱신:
+    PERF_UPDATE_BUDGETS=1 python manage.py test config
+응답 시간 확인:
+    PERF_CHECK_TIME=1 python manage.py test config
+"""
+
+import json
+import os
+import time
+import uuid
+from io import BytesIO
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
+
+from notifications.models import Notification
+from organizations.models import Department
+from tasks.models import Task
+from tasks.seeding import SEEDED_MODELS, OrganizationSeeder, SeedOptions
+from .renderers import ORJSONParser, ORJSONRenderer
+from .urls import router
+
+BUDGET_FILE = Path(__file__).with_name("perf_budgets.json")
+UPDATE_BUDGETS = os.getenv("PERF_UPDATE_BUDGETS") == "1"
+CHECK_TIME = os.getenv("PERF_CHECK_TIME") == "1"
+
+# 본부 3 × 팀 5 × 팀원 100 = 약 1,500명, 작업 약 3,000건
+SEED_OPTIONS = SeedOptions(
+    headquarters=3,
+    teams_per_headquarters=5,
+    members_per_team=100,
+    tasks_per_member=2,
+    seed=19,
+    prefix="P",
+)
+
+# 외부 서비스를 호출하는 라우트 등 측정 대상에서 제외
+EXCLUDED_BASENAMES = {"llm"}
+
+# 필수 파라미터가 있는 엔드포인트 ({start}, {end}는 최근 30일)
+QUERY_PARAMS = {
+    "task-calendar": "start_date={start}&end_date={end}",
+    "report-personal-report": "start_date={start}&end_date={end}",
+    "search-suggest": "q=김",
+}
+
+# 응답 시간 기준 = max(측정값 × TIME_FACTOR, 측정값 + TIME_SLACK_MS)
+# 기준이 측정값에 비례하도록 하고, 아주 빠른 엔드포인트만 최소 여유를 둔다.
+# 측정값은 TIME_REPEAT회 중 가장 빠른 시간 (머신 부하에 따른 편차 제거)
+TIME_FACTOR = 2
+TIME_SLACK_MS = 50
+TIME_REPEAT = 3
+
+
+def analyze_seeded_tables(command):
+    """합성 데이터가 들어가는 테이블만 통계 갱신 (ANALYZE / VACUUM ANALYZE)"""
+    with connection.cursor() as cursor:
+        for model in SEEDED_MODELS:
+            table = connection.ops.quote_name(model._meta.db_table)
+            cursor.execute(f"{command} {table}")
+
+
+def get_endpoints():
+    """(라우트 이름, pk 필요 여부, 모델) 목록"""
+    endpoints = []
+    for pattern in router.urls:
+        actions = getattr(pattern.callback, "actions", None)
+        if not actions or "get" not in actions:
+            continue
+        groups = pattern.pattern.regex.groupindex
+        if "format" in groups:
+            continue
+        # 라우트 이름: "<basename>-<action>" (basename에는 "-"가 없음)
+        if pattern.name.split("-", 1)[0] in EXCLUDED_BASENAMES:
+            continue
+        view = pattern.callback.cls
+        queryset = getattr(view, "queryset", None)
+        serializer_class = getattr(view, "serializer_class", None)
+        if queryset is not None:
+            model = queryset.model
+        elif serializer_class is not None:
+            model = serializer_class.Meta.model
+        else:
+            model = None
+        endpoints.append((pattern.name, "pk" in groups, model))
+    return endpoints
+
+
+# shared 캐시의 무효화 버전 확인은 프로세스마다 재사용 시간에 한 번뿐이므로
+# 측정 도중 재사용 시간이 지나 쿼리 수가 달라지지 않도록 늘려 둔다
+@override_settings(SHARED_VERSION_TTL=3600)
+class EndpointBudgetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seeder = OrganizationSeeder(SEED_OPTIONS)
+        seeder.run()
+
+        team = seeder.teams[0]
+        cls.employee = seeder.members[team.pk][0]
+        cls.roles = {
+            "ADMIN": seeder.admin,
+            "DIRECTOR": seeder.directors[0],
+            "MANAGER": seeder.managers[team.pk],
+            "EMPLOYEE": cls.employee,
+        }
+
+        # 통계 기반 count 추정이 실제 데이터 기준으로 동작하도록
+        analyze_seeded_tables("ANALYZE")
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        # 롤백된 합성 데이터의 통계/빈 페이지가 다른 테스트의
+        # 실행 계획에 영향을 주지 않도록 정리 (트랜잭션 밖에서 실행)
+        analyze_seeded_tables("VACUUM ANALYZE")
+
+    def setUp(self):
+        self.client = APIClient()
+        today = timezone.localdate()
+        self.placeholders = {
+            "start": (today - timedelta(days=30)).isoformat(),
+            "end": today.isoformat(),
+        }
+
+    def probe_object(self, model, user):
+        """상세 조회에 사용할 객체 (팀원 기준 데이터)"""
+        employee = self.employee
+        if model is Notification:
+            return model.objects.filter(recipient=user).first()
+        if model is Department:
+            return employee.department
+        if model is Task:
+            return Task.objects.filter(assignee=employee).first()
+        if model is type(employee):
+            return employee
+        fields = {field.name for field in model._meta.get_fields()}
+        if "task" in fields:
+            return model.objects.filter(task__assignee=employee).first()
+        return None
+
+    def endpoint_path(self, name, needs_pk, model, user):
+        kwargs = {}
+        if needs_pk:
+            probe = self.probe_object(model, user) if model else None
+            if probe is None:
+                return None
+            kwargs["pk"] = probe.pk
+        path = reverse(name, kwargs=kwargs)
+        if name in QUERY_PARAMS:
+            path += "?" + QUERY_PARAMS[name].format(**self.placeholders)
+        return path
+
+    def clear_caches(self):
+        # shared 캐시는 인덱스 무효화 버전만 담으므로 유지 (비우면 매번 재구성)
+        for cache in caches.all():
+            if cache is not caches["shared"]:
+                cache.clear()
+
+    def measure(self, path):
+        # 첫 호출로 지연 초기화(모듈 로딩, 메모리 인덱스 등)를 끝내고
+        # 캐시(보고서 캐시 포함)를 비운 상태에서 다시 호출해 측정한다
+        self.clear_caches()
+        self.client.get(path)
+        timings = []
+        for _ in range(TIME_REPEAT):
+            self.clear_caches()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = self.client.get(path)
+                if response.streaming:
+                    # 내보내기 등 스트리밍 응답은 본문을 모두 읽을 때까지 측정
+                    b"".join(response.streaming_content)
+                timings.append((time.perf_counter() - started) * 1000)
+        return response.status_code, len(queries), min(timings)
+
+    def test_endpoint_budgets(self):
+        budgets = {}
+        if BUDGET_FILE.exists():
+            budgets = json.loads(BUDGET_FILE.read_text())["endpoints"]
+
+        results = {}
+        for name, needs_pk, model in get_endpoints():
+            for role, user in self.roles.items():
+                path = self.endpoint_path(name, needs_pk, model, user)
+                if path is None:
+                    continue
+                self.client.force_authenticate(user=user)
+                status_code, queries, elapsed = self.measure(path)
+                results.setdefault(name, {})[role] = {
+                    "status": status_code,
+                    "queries": queries,
+                    "ms": round(
+                        max(elapsed * TIME_FACTOR, elapsed + TIME_SLACK_MS)
+                    ),
+                }
+
+                with self.subTest(endpoint=name, role=role):
+                    self.assertLess(status_code, 500, path)
+                    if UPDATE_BUDGETS:
+                        continue
+                    budget = budgets.get(name, {}).get(role)
+                    self.assertIsNotNone(
+                        budget,
+                        f"{name} ({role}) 기준 없음: "
+                        "PERF_UPDATE_BUDGETS=1로 기준 파일을 갱신하세요",
+                    )
+                    self.assertEqual(status_code, budget["status"], path)
+                    self.assertLessEqual(
+                        queries, budget["queries"], f"{path} 쿼리 수 초과"
+                    )
+                    if CHECK_TIME:
+                        self.assertLessEqual(
+                            elapsed, budget["ms"], f"{path} 응답 시간 초과"
+                        )
+
+        if UPDATE_BUDGETS:
+            BUDGET_FILE.write_text(
+                json.dumps(
+                    {"seed": asdict(SEED_OPTIONS), "endpoints": results},
+                    ensure_ascii=False,
+                    indent=2,
+                    sort_keys=True,
+                )
+                + "\n"
+            )
+
+
+class ORJSONRendererTest(APITestCase):
+    def test_matches_drf_json_renderer(self):
+        seoul = dt_timezone(timedelta(hours=9))
+        data = {
+            "utc": datetime(2024, 3, 20, 9, 30, 15, 123456, dt_timezone.utc),
+            "seoul": datetime(2024, 3, 20, 18, 30, tzinfo=seoul),
+            "date": datetime(2024, 3, 20).date(),
+            "avg_completion_time": timedelta(days=1, hours=2),
+            "score": Decimal("4.50"),
+            "label": gettext_lazy("완료"),
+            "id": uuid.UUID(int=1),
+            1: "정수 키",
+            "nested": [{"value": None, "flag": True, "ratio": 0.5}],
+        }
+        expected = json.loads(JSONRenderer().render(data))
+        self.assertEqual(json.loads(ORJSONRenderer().render(data)), expected)
+        self.assertEqual(expected["utc"], "2024-03-20T09:30:15.123456Z")
+        self.assertEqual(expected["avg_completion_time"], "93600.0")
+
+        # 줄/문단 구분 문자는 DRF와 같이 이스케이프 (바이트 단위로 동일)
+        data = {"text": "첫 줄\u2028둘째 줄\u2029"}
+        self.assertEqual(
+            ORJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+        self.assertIn(b"\\u2028", ORJSONRenderer().render(data))
+
+    def test_api_uses_orjson(self):
+        department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        user = get_user_model().objects.create_user(
+            username="admin",
+            password="testpass123",
+            employee_id="ADM001",
+            department=department,
+            role="ADMIN",
+        )
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get("/api/users/me/")
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(response.json()["username"], "admin")
+
+        # 잘못된 JSON 본문은 400
+        response = self.client.post(
+            "/api/tasks/", "{invalid", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("JSON parse error", response.data["detail"])
+
+        self.assertEqual(
+            ORJSONParser().parse(BytesIO('{"제목": [1, 2]}'.encode())),
+            {"제목": [1, 2]},
+        )
@@ -40,11 +40,12 @@ from tasks.views import (
     TaskTimeLogViewSet,
     TaskEvaluationViewSet,
 )
-from notifications.views import NotificationViewSet
+from notifications.views import NotificationViewSet, notification_stream
 from accounts.auth_views import logout
 from reports.views import ReportViewSet
 from activities.views import ActivityViewSet
 from experiments.views import LLMAnalysisViewSet
+from search.views import SearchViewSet
 
 router = DefaultRouter()
 router.register(r"users", UserViewSet)
@@ -59,10 +60,17 @@ router.register(r"notifications", NotificationViewSet, basename="notification")
 router.register(r"reports", ReportViewSet, basename="report")
 router.register(r"activities", ActivityViewSet, basename="activity")
 router.register(r"experiments/llm", LLMAnalysisViewSet, basename="llm")
+router.register(r"search", SearchViewSet, basename="search")
 
 urlpatterns = [
     path("", RedirectView.as_view(url="/api/docs/", permanent=False)),
     path("admin/", admin.site.urls),
+    # 라우터의 notifications/<pk>/ 보다 먼저 매칭되도록 앞에 둔다
+    path(
+        "api/notifications/stream/",
+        notification_stream,
+        name="notification-stream",
+    ),
     path("api/", include(router.urls)),
     path(
         "api/schema/",
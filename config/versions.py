@@ -0,0 +1,55 @@
+"""프로세스(노드) 간 공유 버전
+
+부서 트리처럼 프로세스마다 메모리에 두는 인덱스의 무효화 버전을 모든
+프로세스가 함께 보는 "shared" 캐시에 저장한다. (기본 캐시는 프로세스별
+LocMemCache라 다른 워커가 변경을 알 수 없음)
+캘린더 동기화의 삭제 표식(tasks/calendar_sync.py)도 같은 캐시를 쓴다.
+
+버전은 임의 값이므로 키가 삭제/만료된 뒤 새로 발급되어도 이전 버전과
+겹치지 않는다.
+
+shared 캐시는 기본이 DB 캐시 테이블이므로 조회할 때마다 읽지 않고,
+프로세스 안에서 settings.SHARED_VERSION_TTL초 동안 마지막으로 읽은 값을
+재사용한다. 현재 프로세스의 변경은 바로 반영되고, 다른 프로세스의
+변경은 최대 그 시간만큼 늦게 반영된다.
+"""
+
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+_lock = threading.Lock()
+# 키 -> (버전, 읽은 시각)
+_local = {}
+
+
+def get_shared_cache():
+    return caches["shared"]
+
+
+def current_version(key):
+    """공유 버전 (없으면 새로 발급)"""
+    now = time.monotonic()
+    cached = _local.get(key)
+    if cached is not None and now - cached[1] < settings.SHARED_VERSION_TTL:
+        return cached[0]
+
+    cache = get_shared_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    with _lock:
+        _local[key] = (version, now)
+    return version
+
+
+def bump_version(key):
+    """공유 버전 갱신 (이 버전으로 만든 모든 프로세스의 인덱스 무효화)"""
+    version = uuid.uuid4().hex
+    get_shared_cache().set(key, version, None)
+    with _lock:
+        _local[key] = (version, time.monotonic())
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.3 on 2026-10-18 08:46
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 인덱스를 만드는 동안 쓰기가 막히지 않도록 CREATE INDEX CONCURRENTLY
+    # (트랜잭션 안에서 실행할 수 없음)
+    atomic = False
+
+    dependencies = [
+        ('notifications', '0003_notification_expires_at_notification_priority_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at', '-id'], name='notif_recipient_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['recipient', '-created_at'], name='notif_unread_idx'),
+        ),
+    ]
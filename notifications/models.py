@@ -55,3 +55,16 @@ class Notification(models.Model):
     class Meta:
         verbose_name = "알림"
         verbose_name_plural = "알림들"
+        indexes = [
+            # 수신자별 최신순 목록 (커서 페이지네이션)
+            models.Index(
+                fields=["recipient", "-created_at", "-id"],
+                name="notif_recipient_created_idx",
+            ),
+            # 읽지 않은 알림 개수/일괄 읽음 처리
+            models.Index(
+                fields=["recipient", "-created_at"],
+                condition=models.Q(is_read=False),
+                name="notif_unread_idx",
+            ),
+        ]
@@ -0,0 +1,259 @@
+"""알림 실시간 전송 (Server-Sent Events)
+
+GET /api/notifications/stream/ 에 연결한 사용자에게 새 알림과 읽지 않은
+알림 수 변경을 바로 보낸다. (unread-count/목록 폴링 대체)
+
+알림을 만든 프로세스와 스트림이 연결된 프로세스가 다를 수 있으므로
+fan-out 백엔드를 settings.NOTIFICATION_STREAM_BACKEND로 고른다.
+
+- InProcessBroker: 같은 프로세스의 스트림에만 전달 (단일 노드/개발용)
+- PostgresBroker: PostgreSQL LISTEN/NOTIFY로 모든 노드에 전달
+
+브로커는 "이 사용자의 알림이 바뀌었다"는 신호(사용자 id)만 전달하고,
+스트림이 마지막으로 보낸 알림 id 이후의 알림과 읽지 않은 수를 DB에서
+읽어 보낸다. 신호가 여러 번 겹치거나 재연결 중 놓쳐도 다음 조회에서
+빠짐없이 따라잡는다. (Last-Event-ID로 재연결 시에도 같은 방식)
+"""
+
+import asyncio
+import logging
+import select
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+import psycopg2
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.db.models import Max
+from django.utils.module_loading import import_string
+
+from config.renderers import dumps
+
+from .models import Notification
+from .serializers import NotificationSerializer
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "notifications"
+
+# 새 알림을 한 번에 읽는 수 (재연결 후 따라잡을 때 등)
+BATCH_SIZE = 100
+
+# 연결이 끊기면 클라이언트(EventSource)가 다시 연결하기까지 기다릴 시간
+RETRY_MS = 3000
+
+
+class InProcessBroker:
+    """같은 프로세스 안의 스트림에 신호 전달"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # 사용자 id -> {(이벤트 루프, 큐)}
+        self.subscribers = defaultdict(set)
+
+    def publish(self, user_ids):
+        for user_id in user_ids:
+            self.dispatch(user_id)
+
+    def dispatch(self, user_id):
+        with self.lock:
+            targets = list(self.subscribers.get(user_id, ()))
+        # 다른 스레드(동기 뷰, LISTEN 스레드)에서도 호출되므로 루프에 위임
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+            except RuntimeError:
+                # 이미 종료된 루프 (구독 해제 직전)
+                pass
+
+    @asynccontextmanager
+    async def subscribe(self, user_id):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        with self.lock:
+            self.subscribers[user_id].add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self.lock:
+                self.subscribers[user_id].discard(subscriber)
+                if not self.subscribers[user_id]:
+                    del self.subscribers[user_id]
+
+
+class PostgresBroker(InProcessBroker):
+    """PostgreSQL LISTEN/NOTIFY로 여러 노드에 신호 전달
+
+    프로세스마다 전용 DB 연결 하나로 LISTEN하는 스레드를 두고, 받은 신호를
+    그 프로세스의 스트림에 나눠 준다. 연결이 끊기면 다시 연결한 뒤 모든
+    스트림에 신호를 보내 그 사이 놓친 알림을 따라잡게 한다.
+    """
+
+    poll_interval = 1
+    reconnect_delay = 3
+
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+        self.listening = threading.Event()
+        self.stopping = threading.Event()
+
+    def publish(self, user_ids):
+        with connection.cursor() as cursor:
+            for user_id in user_ids:
+                cursor.execute(
+                    "SELECT pg_notify(%s, %s)", [CHANNEL, str(user_id)]
+                )
+
+    @asynccontextmanager
+    async def subscribe(self, user_id):
+        # 구독을 먼저 등록해야 LISTEN 직후의 따라잡기 신호를 받는다
+        async with super().subscribe(user_id) as queue:
+            self.start()
+            yield queue
+
+    def start(self):
+        with self.lock:
+            if self.listener is None or not self.listener.is_alive():
+                self.stopping.clear()
+                self.listener = threading.Thread(
+                    target=self.listen,
+                    name="notification-listener",
+                    daemon=True,
+                )
+                self.listener.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.listener is not None:
+            self.listener.join()
+
+    def listen(self):
+        while not self.stopping.is_set():
+            db = connections[DEFAULT_DB_ALIAS]
+            conn = None
+            try:
+                conn = db.get_new_connection(db.get_connection_params())
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                self.listening.set()
+                self.dispatch_all()
+                while not self.stopping.is_set():
+                    if select.select([conn], [], [], self.poll_interval)[0]:
+                        conn.poll()
+                        while conn.notifies:
+                            notify = conn.notifies.pop(0)
+                            self.dispatch(int(notify.payload))
+            except (psycopg2.Error, OSError):
+                logger.exception("알림 LISTEN 연결 오류, 재연결합니다.")
+                self.stopping.wait(self.reconnect_delay)
+            finally:
+                self.listening.clear()
+                if conn is not None:
+                    conn.close()
+
+    def dispatch_all(self):
+        with self.lock:
+            user_ids = list(self.subscribers)
+        for user_id in user_ids:
+            self.dispatch(user_id)
+
+
+_brokers = {}
+_brokers_lock = threading.Lock()
+
+
+def get_broker():
+    path = settings.NOTIFICATION_STREAM_BACKEND
+    with _brokers_lock:
+        if path not in _brokers:
+            _brokers[path] = import_string(path)()
+        return _brokers[path]
+
+
+def notify_users(user_ids):
+    """사용자들의 알림(새 알림/읽음 상태)이 바뀌었음을 스트림에 알림
+
+    트랜잭션이 커밋된 뒤에 전달해 스트림이 변경된 데이터를 읽도록 한다.
+    """
+    user_ids = sorted(set(user_ids) - {None})
+    if user_ids:
+        transaction.on_commit(lambda: get_broker().publish(user_ids))
+
+
+def format_event(event, data, event_id=None):
+    lines = [f"id: {event_id}\n".encode()] if event_id is not None else []
+    lines.append(f"event: {event}\n".encode())
+    lines.append(b"data: " + dumps(data) + b"\n\n")
+    return b"".join(lines)
+
+
+class NotificationStream:
+    """한 사용자의 SSE 이벤트 생성
+
+    event: notification  (id: 알림 id, data: 알림 목록 항목과 같은 형식)
+    event: unread_count  (data: {"count": n}, 값이 바뀔 때만)
+    """
+
+    def __init__(self, user, last_event_id=None):
+        self.user = user
+        self.last_id = last_event_id
+        self.unread_count = None
+
+    async def events(self):
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        async with get_broker().subscribe(self.user.pk) as queue:
+            if self.last_id is None:
+                # 처음 연결이면 기존 알림은 보내지 않고 읽지 않은 수만
+                latest = await Notification.objects.filter(
+                    recipient=self.user
+                ).aaggregate(last_id=Max("pk"))
+                self.last_id = latest["last_id"] or 0
+            yield await self.changes()
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        queue.get(), settings.NOTIFICATION_STREAM_HEARTBEAT
+                    )
+                except asyncio.TimeoutError:
+                    # 프록시가 유휴 연결을 끊지 않도록
+                    yield b": keepalive\n\n"
+                    continue
+                # 쌓인 신호는 한 번의 조회로 처리
+                while not queue.empty():
+                    queue.get_nowait()
+                chunk = await self.changes()
+                if chunk:
+                    yield chunk
+
+    async def changes(self):
+        """마지막으로 보낸 이후의 새 알림과 바뀐 읽지 않은 수"""
+        queryset = Notification.objects.filter(recipient=self.user)
+        chunks = []
+        while True:
+            notifications = [
+                notification
+                async for notification in queryset.filter(
+                    pk__gt=self.last_id
+                )
+                .select_related("recipient", "task")
+                .order_by("pk")[:BATCH_SIZE]
+            ]
+            serializer = NotificationSerializer(notifications, many=True)
+            chunks += [
+                format_event("notification", data, data["id"])
+                for data in serializer.data
+            ]
+            if notifications:
+                self.last_id = notifications[-1].pk
+            if len(notifications) < BATCH_SIZE:
+                break
+
+        unread_count = await queryset.filter(is_read=False).acount()
+        if unread_count != self.unread_count:
+            self.unread_count = unread_count
+            chunks.append(
+                format_event("unread_count", {"count": unread_count})
+            )
+        return b"".join(chunks)
@@ -1,10 +1,17 @@
-from django.test import TransactionTestCase
+import asyncio
+import threading
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
 from notifications.models import Notification
 from tasks.models import Task
+from notifications.stream import PostgresBroker
+from notifications.views import issue_stream_ticket
 from organizations.models import Department
 
 User = get_user_model()
@@ -75,3 +82,198 @@ class NotificationTests(APITestCase, TransactionTestCase):
             recipient=self.user, is_read=False
         ).count()
         self.assertEqual(unread_count, 0)
+
+    def test_cursor_pagination(self):
+        """커서 페이지네이션 (최신순, 생성 시각이 같으면 id 역순)"""
+        for index in range(4):
+            Notification.objects.create(
+                recipient=self.user,
+                notification_type="TASK_ASSIGNED",
+                task=self.task,
+                message=f"알림 {index}",
+            )
+        expected = list(
+            Notification.objects.order_by("-created_at", "-id").values_list(
+                "id", flat=True
+            )
+        )
+
+        url = reverse("notification-list")
+        response = self.client.get(url, {"cursor": "", "page_size": 2})
+        seen = [item["id"] for item in response.data["results"]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            seen += [item["id"] for item in response.data["results"]]
+
+        self.assertEqual(seen, expected)
+
+
+class NotificationStreamTest(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="assignee",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+        )
+        self.commenter = User.objects.create_user(
+            username="commenter",
+            password="testpass123",
+            employee_id="EMP002",
+            department=self.department,
+        )
+        self.task = Task.objects.create(
+            title="Test Task",
+            description="Test Description",
+            assignee=self.user,
+            reporter=self.user,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+            department=self.department,
+        )
+        self.notification = Notification.objects.create(
+            recipient=self.user,
+            notification_type="TASK_ASSIGNED",
+            task=self.task,
+            message="새로운 작업이 할당되었습니다.",
+        )
+        self.url = reverse("notification-stream")
+
+    def post(self, user, name, data=None):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        with self.captureOnCommitCallbacks(execute=True):
+            return client.post(reverse(name), data)
+
+    async def connect(self, **headers):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(self.url, **headers)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+        return stream
+
+    async def next_event(self, stream):
+        return (await asyncio.wait_for(anext(stream), 5)).decode()
+
+    async def test_push_new_notification_and_unread_count(self):
+        stream = await self.connect()
+        self.assertEqual(
+            await self.next_event(stream),
+            'event: unread_count\ndata: {"count":1}\n\n',
+        )
+
+        response = await sync_to_async(self.post)(
+            self.commenter,
+            "taskcomment-list",
+            {
+                "task": self.task.pk,
+                "content": "코멘트",
+                "author": self.commenter.pk,
+            },
+        )
+        self.assertEqual(response.status_code, 201)
+        notification = await Notification.objects.alatest("pk")
+        event = await self.next_event(stream)
+        self.assertTrue(
+            event.startswith(f"id: {notification.pk}\nevent: notification\n")
+        )
+        self.assertIn('"notification_type":"TASK_COMMENT"', event)
+        self.assertTrue(
+            event.endswith('event: unread_count\ndata: {"count":2}\n\n')
+        )
+
+        await sync_to_async(self.post)(
+            self.user, "notification-mark-all-read"
+        )
+        self.assertEqual(
+            await self.next_event(stream),
+            'event: unread_count\ndata: {"count":0}\n\n',
+        )
+
+    async def test_replay_after_last_event_id(self):
+        stream = await self.connect(headers={"Last-Event-ID": "0"})
+        event = await self.next_event(stream)
+        self.assertTrue(
+            event.startswith(
+                f"id: {self.notification.pk}\nevent: notification\n"
+            )
+        )
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+    def access_token(self):
+        return str(RefreshToken.for_user(self.user).access_token)
+
+    def stream_ticket(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token()}")
+        response = client.post(reverse("notification-stream-ticket"))
+        self.assertEqual(response.status_code, 200)
+        return response.data["ticket"]
+
+    async def assert_stream_opened(self, response):
+        self.assertEqual(response.status_code, 200)
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+        self.assertEqual(
+            await self.next_event(stream),
+            'event: unread_count\ndata: {"count":1}\n\n',
+        )
+
+    async def test_connect_with_jwt(self):
+        access = await sync_to_async(self.access_token)()
+        response = await self.async_client.get(
+            self.url, headers={"Authorization": f"Bearer {access}"}
+        )
+        await self.assert_stream_opened(response)
+
+    async def test_connect_with_ticket(self):
+        # 브라우저(EventSource): JWT로 받은 티켓을 쿼리 파라미터로
+        ticket = await sync_to_async(self.stream_ticket)()
+        response = await self.async_client.get(self.url, {"ticket": ticket})
+        await self.assert_stream_opened(response)
+
+    async def test_invalid_or_expired_ticket(self):
+        ticket = issue_stream_ticket(self.user)
+        response = await self.async_client.get(
+            self.url, {"ticket": ticket + "x"}
+        )
+        self.assertEqual(response.status_code, 401)
+
+        with override_settings(NOTIFICATION_STREAM_TICKET_TTL=-1):
+            response = await self.async_client.get(
+                self.url, {"ticket": ticket}
+            )
+        self.assertEqual(response.status_code, 401)
+
+
+class PostgresBrokerTest(TransactionTestCase):
+    def test_fan_out_with_listen_notify(self):
+        broker = PostgresBroker()
+        subscribed = threading.Event()
+        received = []
+
+        async def receive():
+            async with broker.subscribe(7) as queue:
+                subscribed.set()
+                # LISTEN 직후의 따라잡기 신호 (구독이 먼저 등록되므로 항상
+                # 받는다), 그 다음이 발행 신호
+                await asyncio.wait_for(queue.get(), 5)
+                received.append(await asyncio.wait_for(queue.get(), 5))
+
+        thread = threading.Thread(target=asyncio.run, args=(receive(),))
+        thread.start()
+        try:
+            self.assertTrue(subscribed.wait(5))
+            self.assertTrue(broker.listening.wait(5))
+            broker.publish([7])
+            thread.join(5)
+        finally:
+            broker.stop()
+        self.assertEqual(received, [None])
@@ -1,16 +1,24 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from config.pagination import StandardResultsSetPagination
 from .models import Notification
 from .serializers import NotificationSerializer
+from .stream import NotificationStream, notify_users
 
+User = get_user_model()
 
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = "page_size"
-    max_page_size = 100
+STREAM_TICKET_SALT = "notifications.stream.ticket"
 
 
 class NotificationViewSet(viewsets.ModelViewSet):
@@ -28,7 +36,96 @@ class NotificationViewSet(viewsets.ModelViewSet):
         count = self.get_queryset().filter(is_read=False).count()
         return Response({"count": count})
 
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        notify_users([self.request.user.pk])
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        notify_users([self.request.user.pk])
+
     @action(detail=False, methods=["post"])
     def mark_all_read(self, request):
-        self.get_queryset().filter(is_read=False).update(is_read=True)
+        if self.get_queryset().filter(is_read=False).update(is_read=True):
+            notify_users([request.user.pk])
         return Response({"detail": "모든 알림이 읽음 처리되었습니다."})
+
+    @action(detail=False, methods=["post"], url_path="stream-ticket")
+    def stream_ticket(self, request):
+        """알림 스트림 연결용 단기 티켓 발급
+
+        브라우저 EventSource는 Authorization 헤더를 보낼 수 없으므로
+        JWT로 티켓을 받아 /api/notifications/stream/?ticket= 으로 연결한다.
+        티켓이 만료된 뒤 재연결하면 401이므로 새 티켓을 받아 다시 연결한다.
+        """
+        return Response(
+            {
+                "ticket": issue_stream_ticket(request.user),
+                "expires_in": settings.NOTIFICATION_STREAM_TICKET_TTL,
+            }
+        )
+
+
+def issue_stream_ticket(user):
+    return signing.dumps(user.pk, salt=STREAM_TICKET_SALT)
+
+
+async def user_from_ticket(ticket):
+    """티켓의 사용자 (위조/만료된 티켓이거나 비활성 사용자면 None)"""
+    try:
+        user_id = signing.loads(
+            ticket,
+            salt=STREAM_TICKET_SALT,
+            max_age=settings.NOTIFICATION_STREAM_TICKET_TTL,
+        )
+    except signing.BadSignature:
+        return None
+    return await User.objects.filter(pk=user_id, is_active=True).afirst()
+
+
+async def authenticate_stream(request):
+    """티켓(?ticket=), JWT(Authorization 헤더) 또는 세션으로 인증된 사용자"""
+    if "ticket" in request.GET:
+        return await user_from_ticket(request.GET["ticket"])
+    try:
+        result = await sync_to_async(JWTAuthentication().authenticate)(
+            request
+        )
+    except AuthenticationFailed:
+        return None
+    if result is not None:
+        return result[0]
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+@require_GET
+async def notification_stream(request):
+    """GET /api/notifications/stream/ 알림 실시간 전송 (Server-Sent Events)
+
+    연결을 유지하는 비동기 뷰이므로 ASGI 서버(config.asgi)로 실행해야 한다.
+    브라우저는 stream-ticket으로 받은 티켓을 ?ticket= 으로 넘겨 인증한다.
+    재연결 시 Last-Event-ID 헤더가 있으면 그 이후의 알림부터 다시 보낸다.
+    (notifications/stream.py 참고)
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"detail": "알림 스트림은 ASGI 서버에서만 제공됩니다."}, status=501
+        )
+    user = await authenticate_stream(request)
+    if user is None:
+        return JsonResponse(
+            {"detail": str(NotAuthenticated.default_detail)}, status=401
+        )
+
+    last_event_id = request.headers.get("Last-Event-ID", "")
+    stream = NotificationStream(
+        user, int(last_event_id) if last_event_id.isdigit() else None
+    )
+    response = StreamingHttpResponse(
+        stream.events(), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # nginx 프록시 버퍼링 해제
+    response["X-Accel-Buffering"] = "no"
+    return response
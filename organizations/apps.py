@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class OrganizationsConfig(AppConfig):
@@ -6,4 +7,16 @@ class OrganizationsConfig(AppConfig):
     name = "organizations"
 
     def ready(self):
-        pass
+        from .models import Department
+        from .scope import invalidate_department_tree
+
+        post_save.connect(
+            invalidate_department_tree,
+            sender=Department,
+            dispatch_uid="organizations.department_tree.save",
+        )
+        post_delete.connect(
+            invalidate_department_tree,
+            sender=Department,
+            dispatch_uid="organizations.department_tree.delete",
+        )
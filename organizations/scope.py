@@ -0,0 +1,173 @@
+import threading
+
+from django.db import transaction
+
+from config.versions import bump_version, current_version
+
+from .models import Department
+
+# 부서 트리 버전 키 (shared 캐시, 프로세스 간 무효화 공유용)
+TREE_VERSION_KEY = "organizations:department_tree:version"
+
+# 본부 단위 조회 권한을 가진 직급
+HEADQUARTERS_RANKS = ["DIRECTOR", "GENERAL_MANAGER"]
+
+
+class DepartmentTree:
+    """부서 계층 구조의 메모리 인덱스
+
+    parent_id 매핑 하나로 조상/자손 집합을 미리 계산해 두므로
+    깊이에 관계없이 조회 시 DB 접근이 없다.
+    """
+
+    def __init__(self, parent_map):
+        self.parent_map = dict(parent_map)
+        self.children_map = {dept_id: [] for dept_id in self.parent_map}
+        for dept_id, parent_id in self.parent_map.items():
+            if parent_id in self.children_map:
+                self.children_map[parent_id].append(dept_id)
+
+        self._descendants = {}
+        self._ancestors = {}
+        for dept_id in self.parent_map:
+            self._ancestors[dept_id] = self._collect_ancestors(dept_id)
+        for dept_id in self.parent_map:
+            self._descendants[dept_id] = self._collect_descendants(dept_id)
+
+    @classmethod
+    def build(cls):
+        return cls(Department.objects.values_list("id", "parent_id"))
+
+    def _collect_ancestors(self, dept_id):
+        ancestors = []
+        seen = {dept_id}
+        parent_id = self.parent_map.get(dept_id)
+        # 순환 참조가 있더라도 무한 루프에 빠지지 않도록 방문 기록
+        while parent_id is not None and parent_id not in seen:
+            ancestors.append(parent_id)
+            seen.add(parent_id)
+            parent_id = self.parent_map.get(parent_id)
+        return tuple(ancestors)
+
+    def _collect_descendants(self, dept_id):
+        result = {dept_id}
+        stack = [dept_id]
+        while stack:
+            for child_id in self.children_map.get(stack.pop(), []):
+                if child_id not in result:
+                    result.add(child_id)
+                    stack.append(child_id)
+        return frozenset(result)
+
+    def __contains__(self, dept_id):
+        return dept_id in self.parent_map
+
+    def parent_of(self, dept_id):
+        return self.parent_map.get(dept_id)
+
+    def is_headquarters(self, dept_id):
+        """최상위 부서(본부) 여부"""
+        return dept_id in self.parent_map and self.parent_map[dept_id] is None
+
+    def descendants(self, dept_id):
+        """자신을 포함한 하위 부서 ID 집합"""
+        return self._descendants.get(dept_id, frozenset())
+
+    def ancestors(self, dept_id):
+        """가까운 순서의 상위 부서 ID 목록 (자신 제외)"""
+        return self._ancestors.get(dept_id, ())
+
+    def root_of(self, dept_id):
+        """소속 본부 ID (자신이 본부이면 자신)"""
+        if dept_id not in self.parent_map:
+            return None
+        ancestors = self._ancestors[dept_id]
+        return ancestors[-1] if ancestors else dept_id
+
+
+_lock = threading.Lock()
+_tree = None
+_tree_version = None
+
+
+def _current_version():
+    return current_version(TREE_VERSION_KEY)
+
+
+def get_department_tree():
+    """현재 부서 트리 인덱스 반환 (필요 시에만 재구성)"""
+    global _tree, _tree_version
+
+    version = _current_version()
+    tree = _tree
+    if tree is not None and _tree_version == version:
+        return tree
+
+    with _lock:
+        if _tree is None or _tree_version != version:
+            _tree = DepartmentTree.build()
+            _tree_version = version
+        return _tree
+
+
+def invalidate_department_tree(**kwargs):
+    """부서 변경 시 호출되어 모든 프로세스의 트리 인덱스를 무효화"""
+    _bump_tree_version()
+    # 커밋 전에 다른 프로세스가 이전 데이터로 재구성했을 수 있으므로 한 번 더
+    transaction.on_commit(_bump_tree_version)
+
+
+def _bump_tree_version():
+    global _tree
+
+    bump_version(TREE_VERSION_KEY)
+    with _lock:
+        _tree = None
+
+
+def get_subtree_ids(department_id):
+    """부서와 모든 하위 부서의 ID 집합"""
+    return get_department_tree().descendants(department_id)
+
+
+def get_visible_department_ids(user):
+    """사용자가 조회할 수 있는 부서 ID 집합
+
+    ADMIN은 제한이 없으므로 None을 반환한다.
+    본부장/이사는 소속 부서와 모든 하위 부서, 그 외에는 소속 부서만 포함한다.
+    """
+    if user.role == "ADMIN":
+        return None
+
+    if user.department_id is None:
+        return frozenset()
+
+    if user.rank in HEADQUARTERS_RANKS:
+        return get_subtree_ids(user.department_id)
+
+    return frozenset([user.department_id])
+
+
+def scope_queryset(
+    queryset, user, department_field="department", assignee_field="assignee"
+):
+    """역할/직급에 따른 작업 조회 범위 적용
+
+    - ADMIN: 전체
+    - DIRECTOR/GENERAL_MANAGER: 소속 부서 및 하위 부서
+    - MANAGER: 소속 부서
+    - EMPLOYEE: 본인 담당 작업
+    """
+    if user.role == "ADMIN":
+        return queryset
+
+    if user.rank in HEADQUARTERS_RANKS or user.role == "MANAGER":
+        return queryset.filter(
+            **{
+                f"{department_field}_id__in": get_visible_department_ids(
+                    user
+                )
+            }
+        )
+
+    return queryset.filter(**{assignee_field: user})
@@ -1,9 +1,16 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
 from .models import Department
+from config.versions import get_shared_cache
+from .scope import (
+    TREE_VERSION_KEY,
+    get_department_tree,
+    get_subtree_ids,
+    get_visible_department_ids,
+)
 
 User = get_user_model()
 
@@ -46,3 +53,93 @@ class DepartmentAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["name"], "테스트부서")
+
+
+class DepartmentScopeTest(TestCase):
+    def setUp(self):
+        self.hq = Department.objects.create(name="본부", code="HQ001")
+        self.team = Department.objects.create(
+            name="팀", code="TEAM001", parent=self.hq
+        )
+        self.part = Department.objects.create(
+            name="파트", code="PART001", parent=self.team
+        )
+        self.other = Department.objects.create(name="타본부", code="HQ002")
+
+    def test_descendants_and_ancestors(self):
+        tree = get_department_tree()
+
+        self.assertEqual(
+            tree.descendants(self.hq.id),
+            {self.hq.id, self.team.id, self.part.id},
+        )
+        self.assertEqual(
+            tree.ancestors(self.part.id), (self.team.id, self.hq.id)
+        )
+        self.assertEqual(tree.root_of(self.part.id), self.hq.id)
+        self.assertTrue(tree.is_headquarters(self.hq.id))
+        self.assertFalse(tree.is_headquarters(self.team.id))
+
+    def test_tree_rebuilt_on_save_and_delete(self):
+        self.assertNotIn(self.other.id, get_subtree_ids(self.hq.id))
+
+        self.other.parent = self.hq
+        self.other.save()
+        self.assertIn(self.other.id, get_subtree_ids(self.hq.id))
+
+        self.part.delete()
+        self.assertNotIn(self.part.id, get_subtree_ids(self.hq.id))
+
+    def test_visible_departments_without_queries(self):
+        director = User.objects.create_user(
+            username="director",
+            password="testpass123",
+            employee_id="DIR001",
+            department=self.hq,
+            role="MANAGER",
+            rank="DIRECTOR",
+        )
+        manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=self.team,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        get_department_tree()
+
+        with self.assertNumQueries(0):
+            director_ids = get_visible_department_ids(director)
+            manager_ids = get_visible_department_ids(manager)
+
+        self.assertEqual(
+            director_ids, {self.hq.id, self.team.id, self.part.id}
+        )
+        self.assertEqual(manager_ids, {self.team.id})
+
+    def test_tree_invalidated_by_other_process(self):
+        get_department_tree()
+        # 다른 프로세스의 변경: 이 프로세스에는 시그널이 오지 않고
+        # shared 캐시의 버전만 바뀐다
+        (moved,) = Department.objects.bulk_create(
+            [Department(name="신설팀", code="NEW001", parent=self.hq)]
+        )
+        get_shared_cache().set(TREE_VERSION_KEY, "other-process")
+
+        # 재사용 시간이 지나 shared 캐시의 버전을 다시 읽은 경우
+        with override_settings(SHARED_VERSION_TTL=0):
+            tree = get_department_tree()
+        self.assertIn(moved.id, tree.descendants(self.hq.id))
+
+    def test_version_read_from_shared_cache_once_per_ttl(self):
+        get_department_tree()
+
+        # 재사용 시간 안에는 shared 캐시(DB 캐시 테이블)도 읽지 않는다
+        with self.assertNumQueries(0):
+            for _ in range(10):
+                get_department_tree()
+
+        with override_settings(SHARED_VERSION_TTL=0):
+            with self.assertNumQueries(1):
+                get_department_tree()
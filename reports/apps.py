@@ -0,0 +1,63 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save, pre_save
+
+
+class ReportsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "reports"
+
+    def ready(self):
+        from tasks.models import (
+            Task,
+            TaskEvaluation,
+            TaskHistory,
+            TaskTimeLog,
+        )
+        from .cache import (
+            invalidate_task_related_reports,
+            invalidate_task_reports,
+            remember_task_assignee,
+        )
+        from .leaderboard import update_rankings_for_evaluation
+
+        post_save.connect(
+            update_rankings_for_evaluation,
+            sender=TaskEvaluation,
+            dispatch_uid="reports.leaderboard.evaluation_save",
+        )
+        post_delete.connect(
+            update_rankings_for_evaluation,
+            sender=TaskEvaluation,
+            dispatch_uid="reports.leaderboard.evaluation_delete",
+        )
+
+        # 보고서 캐시 무효화 (담당자 부서의 데이터 버전 갱신)
+        # QuerySet.update()/bulk_create는 시그널을 보내지 않으므로 그런 일괄
+        # 변경에서는 bump_department_versions를 직접 호출한다
+        pre_save.connect(
+            remember_task_assignee,
+            sender=Task,
+            dispatch_uid="reports.cache.task_pre_save",
+        )
+        post_save.connect(
+            invalidate_task_reports,
+            sender=Task,
+            dispatch_uid="reports.cache.task_save",
+        )
+        post_delete.connect(
+            invalidate_task_reports,
+            sender=Task,
+            dispatch_uid="reports.cache.task_delete",
+        )
+        for model in [TaskEvaluation, TaskHistory, TaskTimeLog]:
+            label = model._meta.model_name
+            post_save.connect(
+                invalidate_task_related_reports,
+                sender=model,
+                dispatch_uid=f"reports.cache.{label}_save",
+            )
+            post_delete.connect(
+                invalidate_task_related_reports,
+                sender=model,
+                dispatch_uid=f"reports.cache.{label}_delete",
+            )
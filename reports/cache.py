@@ -0,0 +1,156 @@
+import hashlib
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+
+from organizations.scope import get_department_tree
+from tasks.models import Task
+
+User = get_user_model()
+
+VERSION_KEY = "reports:version:{}"
+
+# 저장 시 이전 담당자를 확인해야 하는 작업 필드
+ASSIGNEE_FIELDS = {"assignee", "assignee_id"}
+
+
+def get_report_cache():
+    return caches["reports"]
+
+
+def with_ancestors(department_ids):
+    """부서와 모든 상위 부서 ID 집합"""
+    tree = get_department_tree()
+    result = set()
+    for dept_id in department_ids:
+        if dept_id is not None:
+            result.add(dept_id)
+            result.update(tree.ancestors(dept_id))
+    return result
+
+
+def department_versions(department_ids):
+    """부서별 데이터 버전 (없으면 새로 발급)"""
+    cache = get_report_cache()
+    keys = {VERSION_KEY.format(dept_id): dept_id for dept_id in department_ids}
+    versions = cache.get_many(keys)
+
+    for key in keys.keys() - versions.keys():
+        # 버전 키가 만료/삭제되어도 이전 결과와 겹치지 않도록 임의 값 사용
+        cache.add(key, uuid.uuid4().hex, None)
+        versions[key] = cache.get(key)
+
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def bump_department_versions(department_ids):
+    """부서와 상위 부서의 데이터 버전 갱신 (해당 부서 보고서 캐시 무효화)"""
+    department_ids = with_ancestors(department_ids)
+    if not department_ids:
+        return
+
+    def bump():
+        get_report_cache().set_many(
+            {
+                VERSION_KEY.format(dept_id): uuid.uuid4().hex
+                for dept_id in department_ids
+            },
+            None,
+        )
+
+    bump()
+    # 커밋 전에 다른 요청이 이전 데이터로 캐시를 채웠을 수 있으므로 한 번 더
+    transaction.on_commit(bump)
+
+
+def report_cache_key(name, report_user, start_date, end_date, viewer_scope):
+    """보고서 캐시 키
+
+    보고 대상자, 기간, 조회자 권한 범위와 대상자 소속 부서(및 상위 부서)의
+    데이터 버전으로 구성되므로 관련 데이터가 바뀌면 키 자체가 달라진다.
+    """
+    versions = department_versions(
+        with_ancestors([report_user.department_id])
+    )
+    version_part = ",".join(
+        f"{dept_id}:{versions[dept_id]}" for dept_id in sorted(versions)
+    )
+    raw = (
+        f"{report_user.pk}|{start_date.isoformat()}|{end_date.isoformat()}"
+        f"|{viewer_scope}|{version_part}"
+    )
+    return f"reports:{name}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def report_timeout(end_date):
+    """진행 중인 기간은 짧게, 종료된 기간은 기본 유지 시간만큼 캐시"""
+    if end_date >= timezone.localdate():
+        return settings.REPORT_CACHE_OPEN_PERIOD_TIMEOUT
+    return get_report_cache().default_timeout
+
+
+def report_validator(key, end_date):
+    """조건부 요청(ETag)용 검증자
+
+    데이터 버전이 포함된 캐시 키를 그대로 쓰고, 진행 중인 기간은 캐시 유지
+    시간 단위로 갱신해 캐시와 같은 주기로 새 보고서를 받게 한다.
+    """
+    if end_date >= timezone.localdate():
+        period = settings.REPORT_CACHE_OPEN_PERIOD_TIMEOUT
+        return [key, int(time.time() // period)]
+    return [key]
+
+
+def cached_report(key, timeout, compute):
+    """캐시된 보고서를 반환하고, 없으면 계산 후 저장"""
+    cache = get_report_cache()
+    data = cache.get(key)
+    if data is None:
+        data = compute()
+        cache.set(key, data, timeout)
+    return data
+
+
+def remember_task_assignee(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """담당자 변경 시 이전 담당자 부서도 무효화할 수 있도록 저장 전 값 기록
+
+    저장 직전에 DB의 담당자를 한 번 조회한다. 새 작업이거나 담당자를
+    저장하지 않는 경우(update_fields)에는 조회하지 않는다.
+    """
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not ASSIGNEE_FIELDS & set(update_fields):
+        return
+    instance._report_cache_assignee_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("assignee_id", flat=True)
+        .first()
+    )
+
+
+def invalidate_task_reports(sender, instance, **kwargs):
+    """작업 저장/삭제 시 (이전/현재) 담당자 부서의 보고서 캐시 무효화"""
+    assignee_ids = {
+        instance.assignee_id,
+        getattr(instance, "_report_cache_assignee_id", None),
+    } - {None}
+    department_ids = User.objects.filter(pk__in=assignee_ids).values_list(
+        "department_id", flat=True
+    )
+    bump_department_versions(department_ids)
+    instance.__dict__.pop("_report_cache_assignee_id", None)
+
+
+def invalidate_task_related_reports(sender, instance, **kwargs):
+    """평가/이력/시간 로그 저장/삭제 시 작업 담당자 부서의 보고서 캐시 무효화"""
+    department_ids = Task.objects.filter(pk=instance.task_id).values_list(
+        "assignee__department_id", flat=True
+    )
+    bump_department_versions(department_ids)
@@ -0,0 +1,268 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.db.models import Exists, OuterRef, Prefetch
+
+from tasks.models import Task, TaskEvaluation, TaskHistory, TaskTimeLog
+
+# 분포 통계 정렬 순서
+DISTRIBUTION_ORDER = {
+    "priority": ["URGENT", "HIGH", "MEDIUM", "LOW"],
+    "difficulty": ["VERY_HARD", "HARD", "MEDIUM", "EASY"],
+    "status": ["TODO", "IN_PROGRESS", "REVIEW", "DONE", "HOLD"],
+}
+
+# 완료 후 다시 진행/검토 상태로 돌아간 이력을 재작업으로 간주
+REWORK_STATUSES = ["IN_PROGRESS", "REVIEW"]
+
+EMPTY_REPORT = {
+    "basic_stats": {
+        "total_tasks": 0,
+        "completed_tasks": 0,
+        "in_progress_tasks": 0,
+        "delayed_tasks": 0,
+    },
+    "time_stats": {
+        "average_completion_time": None,
+        "estimated_vs_actual": 0,
+        "daily_work_hours": [],
+    },
+    "quality_stats": {
+        "average_score": 0,
+        "review_rejection_rate": 0,
+        "rework_rate": 0,
+    },
+    "distribution_stats": {
+        "priority_distribution": [],
+        "difficulty_distribution": [],
+        "status_distribution": [],
+    },
+    # 작업이 없는 경우 comparison_stats도 null로 반환
+    "comparison_stats": None,
+}
+
+
+def average_duration(tasks):
+    """완료 작업의 평균 소요 시간 (시작일 ~ 완료일)"""
+    durations = [task.completed_at - task.start_date for task in tasks]
+    if not durations:
+        return None
+    return sum(durations, timedelta()) // len(durations)
+
+
+def format_duration(duration):
+    """소요 시간을 "3h 20m" 형식으로 변환"""
+    if not duration:
+        return "0h 0m"
+    seconds = duration.total_seconds()
+    return f"{int(seconds // 3600)}h {int((seconds % 3600) // 60)}m"
+
+
+def average_score(tasks):
+    """작업들의 평가 점수 평균 (평가가 없으면 None)"""
+    scores = [
+        evaluation.performance_score
+        for task in tasks
+        for evaluation in task.evaluations.all()
+    ]
+    if not scores:
+        return None
+    return sum(scores) / len(scores)
+
+
+def rate(part, whole):
+    return (part / whole) * 100
+
+
+class PersonalReport:
+    """개인 보고서 계산기
+
+    보고 대상자의 기간 내 작업을 평가/이력/시간 로그와 함께 한 번에 읽어온 뒤
+    모든 통계를 메모리에서 계산한다. 작업 수와 관계없이 쿼리 수가 고정된다.
+
+    visible_tasks는 조회자 권한이 적용된 작업 쿼리셋으로, 개인 통계에는
+    이 범위만 사용하고 비교용 내 통계(my_stats)에는 기간 내 전체 작업을 쓴다.
+    """
+
+    def __init__(
+        self, report_user, start_datetime, end_datetime, visible_tasks
+    ):
+        tasks = (
+            Task.objects.filter(
+                assignee=report_user,
+                start_date__range=[start_datetime, end_datetime],
+                due_date__range=[start_datetime, end_datetime],
+            )
+            .with_delay()
+            .annotate(
+                visible=Exists(visible_tasks.filter(pk=OuterRef("pk")))
+            )
+            .prefetch_related(
+                Prefetch(
+                    "evaluations",
+                    queryset=TaskEvaluation.objects.only(
+                        "task_id", "performance_score"
+                    ),
+                ),
+                Prefetch(
+                    "history",
+                    queryset=TaskHistory.objects.filter(
+                        previous_status="DONE",
+                        new_status__in=REWORK_STATUSES,
+                    ).only("task_id"),
+                    to_attr="rework_history",
+                ),
+                Prefetch(
+                    "time_logs",
+                    queryset=TaskTimeLog.objects.only(
+                        "task_id", "start_time", "end_time"
+                    ).order_by("id"),
+                ),
+            )
+            .order_by("id")
+        )
+
+        self.all_tasks = list(tasks)
+        self.tasks = [task for task in self.all_tasks if task.visible]
+        self.done_tasks = [
+            task for task in self.tasks if task.status == "DONE"
+        ]
+
+    def exists(self):
+        return bool(self.tasks)
+
+    def basic_stats(self):
+        status_counts = Counter(task.status for task in self.tasks)
+        return {
+            "total_tasks": len(self.tasks),
+            "completed_tasks": status_counts["DONE"],
+            "in_progress_tasks": status_counts["IN_PROGRESS"],
+            "delayed_tasks": sum(1 for task in self.tasks if task.is_delayed),
+        }
+
+    def time_stats(self):
+        return {
+            "average_completion_time": average_duration(
+                [task for task in self.done_tasks if task.completed_at]
+            ),
+            "estimated_vs_actual": self.time_efficiency(),
+            "daily_work_hours": self.daily_hours(),
+        }
+
+    def quality_stats(self):
+        return {
+            "average_score": average_score(self.done_tasks) or 0,
+            "review_rejection_rate": self.rejection_rate(),
+            "rework_rate": self.rework_rate(),
+        }
+
+    def distribution_stats(self):
+        return {
+            "priority_distribution": self.distribution("priority"),
+            "difficulty_distribution": self.distribution("difficulty"),
+            "status_distribution": self.distribution("status"),
+        }
+
+    def time_efficiency(self):
+        """작업 시간 효율성 (실제 / 예상 시간 비율)"""
+        completed_tasks = [
+            task for task in self.done_tasks if (task.estimated_hours or 0) > 0
+        ]
+        if not completed_tasks:
+            return 0
+
+        total_estimated = sum(task.estimated_hours for task in completed_tasks)
+        total_actual = sum(
+            task.actual_hours
+            for task in completed_tasks
+            if task.actual_hours is not None
+        )
+        return rate(total_actual, total_estimated)
+
+    def daily_hours(self):
+        """일별 작업 시간 (종료된 시간 로그 기준)"""
+        daily_hours = []
+        for task in self.tasks:
+            for log in task.time_logs.all():
+                if log.end_time:
+                    hours = (log.end_time - log.start_time).total_seconds()
+                    daily_hours.append(
+                        {
+                            "date": log.start_time.date().isoformat(),
+                            "hours": round(hours / 3600, 1),
+                        }
+                    )
+
+        return sorted(daily_hours, key=lambda x: x["date"])
+
+    def rejection_rate(self):
+        """검토 반려율 (평가 점수 3점 미만이 있는 작업 비율)"""
+        evaluated_tasks = [
+            task for task in self.tasks if task.evaluations.all()
+        ]
+        if not evaluated_tasks:
+            return 0
+
+        rejected_count = sum(
+            1
+            for task in evaluated_tasks
+            if any(
+                evaluation.performance_score < 3
+                for evaluation in task.evaluations.all()
+            )
+        )
+        return rate(rejected_count, len(evaluated_tasks))
+
+    def rework_rate(self):
+        """재작업률 (완료 후 다시 진행/검토 상태로 변경된 작업 비율)"""
+        if not self.done_tasks:
+            return 0
+
+        rework_count = sum(
+            1 for task in self.done_tasks if task.rework_history
+        )
+        return rate(rework_count, len(self.done_tasks))
+
+    def distribution(self, field):
+        """필드 값별 작업 수와 비율"""
+        counts = Counter(getattr(task, field) for task in self.tasks)
+        total = len(self.tasks)
+
+        order = DISTRIBUTION_ORDER.get(field, [])
+        result = [
+            {
+                "field": value,
+                "count": count,
+                "percentage": round(count / total * 100, 1),
+            }
+            for value, count in counts.items()
+        ]
+        result.sort(
+            key=lambda x: (
+                order.index(x["field"])
+                if x["field"] in order
+                else len(order)
+            )
+        )
+        return result
+
+    def my_stats(self):
+        """비교 분석용 내 통계 (기간 내 완료된 전체 작업 기준)"""
+        completed_tasks = [
+            task
+            for task in self.all_tasks
+            if task.status == "DONE" and task.completed_at
+        ]
+        if not completed_tasks:
+            return {
+                "completion_time": "0h 0m",
+                "score": 0,
+                "avg_completion_time": None,
+            }
+
+        avg_completion_time = average_duration(completed_tasks)
+        return {
+            "completion_time": format_duration(avg_completion_time),
+            "score": round(average_score(completed_tasks) or 0, 1),
+            "avg_completion_time": avg_completion_time,
+        }
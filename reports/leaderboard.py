@@ -0,0 +1,183 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import (
+    Avg,
+    Case,
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    Q,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Coalesce, Rank
+
+from organizations.scope import get_department_tree
+from tasks.models import Task
+from .models import PerformanceRanking
+
+User = get_user_model()
+
+TEAM = "TEAM"
+HEADQUARTERS = "HEADQUARTERS"
+SCOPES = [TEAM, HEADQUARTERS]
+
+
+def partition_of(department_id, scope):
+    """사용자 소속 부서가 속하는 순위 단위(팀 또는 본부) ID"""
+    if scope == TEAM:
+        return department_id
+    return get_department_tree().root_of(department_id)
+
+
+def ranked_members(scope, partition_ids=None):
+    """팀/본부별 평균 평가 점수와 순위
+
+    점수 집계와 순위 계산(RANK() OVER PARTITION BY)을 한 번의 쿼리로 처리한다.
+    partition_ids를 지정하면 해당 팀/본부 구성원만 계산한다.
+    """
+    members = User.objects.filter(is_active=True, department__isnull=False)
+
+    if scope == TEAM:
+        partition = F("department_id")
+        if partition_ids is not None:
+            members = members.filter(department_id__in=partition_ids)
+    else:
+        tree = get_department_tree()
+        roots = [
+            dept_id
+            for dept_id in tree.parent_map
+            if tree.is_headquarters(dept_id)
+            and (partition_ids is None or dept_id in partition_ids)
+        ]
+        if not roots:
+            return []
+        # 본부 ID는 컬럼이 아니므로 부서 트리로 CASE 식을 만들어 분할 기준으로 사용
+        partition = Case(
+            *[
+                When(
+                    department_id__in=tree.descendants(root),
+                    then=Value(root),
+                )
+                for root in roots
+            ],
+            output_field=IntegerField(),
+        )
+        members = members.filter(
+            department_id__in=set().union(
+                *(tree.descendants(root) for root in roots)
+            )
+        )
+
+    # 평가 점수는 완료된 작업만 대상으로
+    done = Q(assigned_tasks__status="DONE")
+    return (
+        members.annotate(
+            partition_id=partition,
+            score=Coalesce(
+                Avg(
+                    "assigned_tasks__evaluations__performance_score",
+                    filter=done,
+                ),
+                Value(0.0),
+                output_field=FloatField(),
+            ),
+            evaluation_count=Count(
+                "assigned_tasks__evaluations", filter=done
+            ),
+        )
+        .annotate(
+            position=Window(
+                Rank(),
+                partition_by=[partition],
+                order_by=F("score").desc(),
+            ),
+            member_count=Window(Count("id"), partition_by=[partition]),
+        )
+        .values(
+            "id",
+            "partition_id",
+            "score",
+            "evaluation_count",
+            "position",
+            "member_count",
+        )
+    )
+
+
+def refresh_rankings(scopes=SCOPES, partition_ids=None):
+    """순위 테이블 재계산
+
+    partition_ids를 지정하면 해당 팀/본부의 순위만 교체한다.
+    반환값: 저장된 순위 행 수
+    """
+    created = 0
+    with transaction.atomic():
+        for scope in scopes:
+            rows = list(ranked_members(scope, partition_ids))
+
+            stale = PerformanceRanking.objects.filter(scope=scope)
+            if partition_ids is not None:
+                # 다른 팀/본부로 이동한 구성원의 이전 순위도 함께 제거
+                stale = stale.filter(
+                    Q(department_id__in=partition_ids)
+                    | Q(user_id__in=[row["id"] for row in rows])
+                )
+            stale.delete()
+
+            PerformanceRanking.objects.bulk_create(
+                [
+                    PerformanceRanking(
+                        user_id=row["id"],
+                        scope=scope,
+                        department_id=row["partition_id"],
+                        score=row["score"],
+                        evaluation_count=row["evaluation_count"],
+                        rank=row["position"],
+                        member_count=row["member_count"],
+                    )
+                    for row in rows
+                ]
+            )
+            created += len(rows)
+    return created
+
+
+def refresh_rankings_for_department(department_id):
+    """부서가 속한 팀과 본부의 순위만 재계산"""
+    if department_id is None:
+        return
+    for scope in SCOPES:
+        partition_id = partition_of(department_id, scope)
+        if partition_id is not None:
+            refresh_rankings([scope], [partition_id])
+
+
+def get_rank(user, scope):
+    """팀/본부 내 순위 조회 (인덱스 한 번 조회, 읽기 전용)
+
+    순위 대상이 아니거나(비활성, 부서 없음) 아직 계산되지 않은 사용자는
+    None을 반환한다. 재계산은 평가 변경 시(커밋 후)와 refresh_leaderboards
+    명령에서만 한다. (GET 요청에서 쓰기/잠금이 일어나지 않도록)
+    """
+    return (
+        PerformanceRanking.objects.filter(user=user, scope=scope)
+        .values_list("rank", flat=True)
+        .first()
+    )
+
+
+def update_rankings_for_evaluation(sender, instance, **kwargs):
+    """작업 평가 저장/삭제 시 담당자의 팀/본부 순위 갱신 (커밋 후)"""
+    department_id = (
+        Task.objects.filter(pk=instance.task_id)
+        .values_list("assignee__department_id", flat=True)
+        .first()
+    )
+    if department_id is None:
+        return
+    transaction.on_commit(
+        lambda: refresh_rankings_for_department(department_id)
+    )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from reports.leaderboard import SCOPES, refresh_rankings
+
+
+class Command(BaseCommand):
+    help = "팀/본부 성과 순위표 재계산 (주기 실행용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scope",
+            choices=[scope.lower() for scope in SCOPES],
+            help="지정한 범위(team/headquarters)만 재계산",
+        )
+
+    def handle(self, *args, **options):
+        scopes = [options["scope"].upper()] if options["scope"] else SCOPES
+        count = refresh_rankings(scopes)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully refreshed {count} rankings")
+        )
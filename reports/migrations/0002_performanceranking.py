@@ -0,0 +1,40 @@
+# Generated by Django 5.0.3 on 2026-10-18 08:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        ('reports', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerformanceRanking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('TEAM', '팀'), ('HEADQUARTERS', '본부')], max_length=20, verbose_name='순위 범위')),
+                ('score', models.FloatField(default=0, verbose_name='평균 평가 점수')),
+                ('evaluation_count', models.PositiveIntegerField(default=0, verbose_name='평가 수')),
+                ('rank', models.PositiveIntegerField(verbose_name='순위')),
+                ('member_count', models.PositiveIntegerField(verbose_name='인원')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='performance_rankings', to='organizations.department', verbose_name='팀/본부')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='performance_rankings', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '성과 순위',
+                'verbose_name_plural': '성과 순위들',
+                'indexes': [models.Index(fields=['scope', 'department', 'rank'], name='reports_per_scope_e3ba27_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='performanceranking',
+            constraint=models.UniqueConstraint(fields=('user', 'scope'), name='unique_ranking_per_scope'),
+        ),
+    ]
@@ -9,3 +9,54 @@ class ReportTemplate(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE
     )
     created_at = models.DateTimeField(auto_now_add=True)
+
+
+class PerformanceRanking(models.Model):
+    """팀/본부 단위 평가 점수 순위 (리더보드)
+
+    refresh_leaderboards 명령으로 주기적으로 재계산되며, 작업 평가가
+    저장/삭제되면 해당 팀과 본부 순위만 다시 계산된다.
+    """
+
+    SCOPE_CHOICES = [
+        ("TEAM", "팀"),
+        ("HEADQUARTERS", "본부"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="performance_rankings",
+        verbose_name="사용자",
+    )
+    scope = models.CharField(
+        max_length=20, choices=SCOPE_CHOICES, verbose_name="순위 범위"
+    )
+    department = models.ForeignKey(
+        "organizations.Department",
+        on_delete=models.CASCADE,
+        related_name="performance_rankings",
+        verbose_name="팀/본부",
+    )
+    score = models.FloatField(default=0, verbose_name="평균 평가 점수")
+    evaluation_count = models.PositiveIntegerField(
+        default=0, verbose_name="평가 수"
+    )
+    rank = models.PositiveIntegerField(verbose_name="순위")
+    member_count = models.PositiveIntegerField(verbose_name="인원")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "성과 순위"
+        verbose_name_plural = "성과 순위들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "scope"], name="unique_ranking_per_scope"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["scope", "department", "rank"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.get_scope_display()} {self.rank}위"
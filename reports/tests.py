@@ -3,7 +3,13 @@ from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
-from .models import ReportTemplate
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from organizations.models import Department
+from tasks.models import Task, TaskEvaluation
+from .cache import get_report_cache
+from .leaderboard import HEADQUARTERS, TEAM, get_rank, refresh_rankings
+from .models import PerformanceRanking, ReportTemplate
 
 User = get_user_model()
 
@@ -50,3 +56,274 @@ class ReportTemplateAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["name"], "테스트 템플릿")
+
+
+class LeaderboardTest(APITestCase):
+    def setUp(self):
+        self.headquarters = Department.objects.create(
+            name="테스트본부", code="HQ001"
+        )
+        self.team = Department.objects.create(
+            name="테스트팀", code="TEAM001", parent=self.headquarters
+        )
+        self.other_team = Department.objects.create(
+            name="다른팀", code="TEAM002", parent=self.headquarters
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=self.team,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.first = self.add_member(1, self.team, score=5)
+        self.second = self.add_member(2, self.team, score=3)
+        self.other = self.add_member(3, self.other_team, score=4)
+        self.client.force_authenticate(user=self.manager)
+
+    def add_member(self, index, department, score):
+        member = User.objects.create_user(
+            username=f"member{index}",
+            password="testpass123",
+            employee_id=f"EMP{index:03d}",
+            department=department,
+        )
+        self.evaluate(member, score)
+        return member
+
+    def evaluate(self, member, score):
+        task = Task.objects.create(
+            title=f"{member.username} 작업",
+            description="설명",
+            status="DONE",
+            assignee=member,
+            reporter=self.manager,
+            department=member.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        return TaskEvaluation.objects.create(
+            task=task,
+            evaluator=self.manager,
+            difficulty="MEDIUM",
+            performance_score=score,
+            feedback="피드백",
+        )
+
+    def test_rank_lookup_is_single_query(self):
+        refresh_rankings()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_rank(self.second, TEAM), 2)
+        self.assertEqual(get_rank(self.first, TEAM), 1)
+        self.assertEqual(get_rank(self.manager, TEAM), 3)
+        self.assertEqual(get_rank(self.other, TEAM), 1)
+        self.assertEqual(get_rank(self.other, HEADQUARTERS), 2)
+
+        ranking = PerformanceRanking.objects.get(
+            user=self.other, scope=HEADQUARTERS
+        )
+        self.assertEqual(ranking.department, self.headquarters)
+        self.assertEqual(ranking.member_count, 4)
+
+    def test_rank_lookup_does_not_refresh(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertIsNone(get_rank(self.first, TEAM))
+            response = self.client.get(reverse("report-leaderboard"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["my_rank"])
+        self.assertEqual(response.data["results"], [])
+        self.assertTrue(
+            all(query["sql"].startswith("SELECT") for query in queries)
+        )
+        self.assertFalse(PerformanceRanking.objects.exists())
+
+    def test_evaluation_updates_rankings(self):
+        refresh_rankings()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.evaluate(self.first, 1)
+            self.evaluate(self.first, 1)
+
+        self.assertEqual(get_rank(self.second, TEAM), 1)
+        self.assertEqual(get_rank(self.first, TEAM), 2)
+
+    def test_leaderboard(self):
+        refresh_rankings()
+        url = reverse("report-leaderboard")
+
+        response = self.client.get(url, {"scope": "headquarters"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["department_id"], self.headquarters.id)
+        self.assertEqual(response.data["member_count"], 4)
+        self.assertEqual(
+            [row["user_id"] for row in response.data["results"]],
+            [self.first.id, self.other.id, self.second.id, self.manager.id],
+        )
+        self.assertEqual(response.data["my_rank"], 4)
+
+        response = self.client.get(url, {"department": self.other_team.id})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class PersonalReportTest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="testuser",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("report-personal-report")
+        self.params = {"start_date": "2024-03-01", "end_date": "2024-03-31"}
+
+    def add_tasks(self, count):
+        for i in range(count):
+            task = Task.objects.create(
+                title=f"작업 {i}",
+                description="설명",
+                status="DONE" if i % 2 else "IN_PROGRESS",
+                priority="HIGH",
+                assignee=self.user,
+                reporter=self.user,
+                department=self.department,
+                start_date="2024-03-10T00:00:00Z",
+                due_date="2024-03-12T00:00:00Z",
+                completed_at="2024-03-11T06:00:00Z" if i % 2 else None,
+                estimated_hours=4,
+                actual_hours=2,
+            )
+            TaskEvaluation.objects.create(
+                task=task,
+                evaluator=self.user,
+                difficulty="MEDIUM",
+                performance_score=2 if i % 2 else 4,
+                feedback="피드백",
+            )
+            task.time_logs.create(
+                start_time="2024-03-10T09:00:00Z",
+                end_time="2024-03-10T10:30:00Z",
+                logged_by=self.user,
+            )
+
+    def test_query_count_independent_of_tasks(self):
+        self.add_tasks(2)
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(self.url, self.params)
+
+        self.add_tasks(10)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(self.url, self.params)
+
+        self.assertEqual(len(small), 4)
+        self.assertEqual(len(large), len(small))
+
+        data = response.data
+        self.assertEqual(data["basic_stats"]["total_tasks"], 2)
+        self.assertEqual(data["basic_stats"]["completed_tasks"], 1)
+        self.assertEqual(data["time_stats"]["estimated_vs_actual"], 50.0)
+        self.assertEqual(len(data["time_stats"]["daily_work_hours"]), 2)
+        self.assertEqual(data["quality_stats"]["average_score"], 2)
+        self.assertEqual(data["quality_stats"]["review_rejection_rate"], 50)
+        self.assertEqual(
+            data["distribution_stats"]["priority_distribution"],
+            [{"field": "HIGH", "count": 2, "percentage": 100.0}],
+        )
+
+    def test_empty_period(self):
+        response = self.client.get(self.url, self.params)
+
+        self.assertEqual(response.data["basic_stats"]["total_tasks"], 0)
+        self.assertIsNone(response.data["comparison_stats"])
+
+
+class ReportCacheTest(APITestCase):
+    def setUp(self):
+        get_report_cache().clear()
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="testuser",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+        )
+        self.other = User.objects.create_user(
+            username="other",
+            password="testpass123",
+            employee_id="EMP002",
+        )
+        self.task = Task.objects.create(
+            title="테스트 작업",
+            description="설명",
+            status="DONE",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-10T00:00:00Z",
+            due_date="2024-03-12T00:00:00Z",
+            completed_at="2024-03-11T00:00:00Z",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("report-personal-report")
+        self.params = {"start_date": "2024-03-01", "end_date": "2024-03-31"}
+
+    def test_closed_period_served_from_cache(self):
+        self.client.get(self.url, self.params)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, self.params)
+        self.assertEqual(response.data["basic_stats"]["total_tasks"], 1)
+
+    def test_conditional_get(self):
+        etag = self.client.get(self.url, self.params)["ETag"]
+
+        response = self.client.get(
+            self.url, self.params, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+        # 데이터 버전이 바뀌면 새 보고서
+        self.task.title = "제목 변경"
+        self.task.save()
+        response = self.client.get(
+            self.url, self.params, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_related_writes_invalidate(self):
+        self.client.get(self.url, self.params)
+
+        TaskEvaluation.objects.create(
+            task=self.task,
+            evaluator=self.user,
+            difficulty="MEDIUM",
+            performance_score=4,
+            feedback="피드백",
+        )
+        response = self.client.get(self.url, self.params)
+        self.assertEqual(response.data["quality_stats"]["average_score"], 4)
+
+        # 다른 사용자에게 재배정하면 이전 담당자의 보고서도 무효화
+        self.task.assignee = self.other
+        self.task.save()
+        response = self.client.get(self.url, self.params)
+        self.assertEqual(response.data["basic_stats"]["total_tasks"], 0)
+
+    def test_reassign_with_update_fields(self):
+        self.client.get(self.url, self.params)
+
+        task = Task.objects.get(pk=self.task.pk)
+        task.assignee = self.other
+        task.save(update_fields=["assignee"])
+        response = self.client.get(self.url, self.params)
+        self.assertEqual(response.data["basic_stats"]["total_tasks"], 0)
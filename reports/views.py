@@ -1,13 +1,25 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Avg, Q, F, Sum
-from datetime import datetime, timedelta, time
+from django.db.models import Avg, Q, F
+from datetime import datetime, time
 from tasks.models import Task, TaskEvaluation
-from django.db.models.functions import TruncDate
 from django.contrib.auth import get_user_model
 from django.utils import timezone
-from collections import defaultdict
+from organizations.scope import (
+    get_department_tree,
+    get_visible_department_ids,
+)
+from config.conditional import conditional_response
+from .cache import (
+    cached_report,
+    report_cache_key,
+    report_timeout,
+    report_validator,
+)
+from .engine import EMPTY_REPORT, PersonalReport
+from .leaderboard import HEADQUARTERS, SCOPES, TEAM, get_rank, partition_of
+from .models import PerformanceRanking
 
 User = get_user_model()
 
@@ -31,6 +43,20 @@ class ReportViewSet(viewsets.ViewSet):
         # EMPLOYEE는 자신의 보고서만 접근 가능
         return queryset.filter(assignee=user)
 
+    def get_viewer_scope(self):
+        """보고서 캐시 키에 사용할 조회자 권한 범위 (get_queryset과 동일 기준)"""
+        user = self.request.user
+        if user.role == "ADMIN" or user.rank in [
+            "DIRECTOR",
+            "GENERAL_MANAGER",
+        ]:
+            scope = "all"
+        elif user.role == "MANAGER":
+            scope = f"department:{user.department_id}"
+        else:
+            scope = f"user:{user.pk}"
+        return f"{scope}|comparison:{self.can_view_team_stats(user)}"
+
     @action(detail=False, methods=["get"])
     def personal_report(self, request):
         user = request.user
@@ -65,7 +91,7 @@ class ReportViewSet(viewsets.ViewSet):
             # MANAGER는 자신의 팀원 보고서만 접근 가능
             elif (
                 user.role == "MANAGER"
-                and target_user.department == user.department
+                and target_user.department_id == user.department_id
             ):
                 report_user = target_user
             else:
@@ -73,101 +99,43 @@ class ReportViewSet(viewsets.ViewSet):
         else:
             report_user = user
 
-        # 보고서 데이터 조회 로직 수정
-        # 시작일과 종료일이 지정된 기간 내에 있는 작업 필터링
-        tasks = self.get_queryset().filter(
-            assignee=report_user,
-            start_date__range=[start_datetime, end_datetime],
-            due_date__range=[start_datetime, end_datetime]
+        # 같은 대상자/기간/권한 범위의 보고서는 데이터가 바뀌기 전까지 캐시 사용
+        key = report_cache_key(
+            "personal",
+            report_user,
+            start_datetime.date(),
+            end_datetime.date(),
+            self.get_viewer_scope(),
         )
-
-        print(f"Filtering dates - Start: {start_datetime}, End: {end_datetime}")
-        print(f"Tasks count: {tasks.count()}")
-        print(f"Generated SQL: {tasks.query}")
-
-        # 선택된 기간에 작업이 없는 경우
-        if not tasks.exists():
-            return Response(
-                {
-                    "basic_stats": {
-                        "total_tasks": 0,
-                        "completed_tasks": 0,
-                        "in_progress_tasks": 0,
-                        "delayed_tasks": 0,
-                    },
-                    "time_stats": {
-                        "average_completion_time": None,
-                        "estimated_vs_actual": 0,
-                        "daily_work_hours": [],
-                    },
-                    "quality_stats": {
-                        "average_score": 0,
-                        "review_rejection_rate": 0,
-                        "rework_rate": 0,
-                    },
-                    "distribution_stats": {
-                        "priority_distribution": [],
-                        "difficulty_distribution": [],
-                        "status_distribution": [],
-                    },
-                    # 작업이 없는 경우 comparison_stats도 null로 반환
-                    "comparison_stats": None,
-                }
-            )
-
-        # 기본 통계
-        basic_stats = {
-            "total_tasks": tasks.count(),
-            "completed_tasks": tasks.filter(status="DONE").count(),
-            "in_progress_tasks": tasks.filter(status="IN_PROGRESS").count(),
-            "delayed_tasks": len([task for task in tasks if task.is_delayed]),
-        }
-
-        # 시간 관리 통계
-        time_stats = {
-            "average_completion_time": tasks.filter(
-                status="DONE", completed_at__isnull=False
-            ).aggregate(avg_time=Avg(F("completed_at") - F("start_date")))[
-                "avg_time"
-            ],
-            "estimated_vs_actual": self.calculate_time_efficiency(tasks),
-            "daily_work_hours": self.calculate_daily_hours(tasks),
-        }
-
-        # 품질 지표
-        quality_stats = {
-            "average_score": TaskEvaluation.objects.filter(
-                task__in=tasks, task__status="DONE"
-            ).aggregate(avg_score=Avg("performance_score"))["avg_score"]
-            or 0,
-            "review_rejection_rate": self.calculate_rejection_rate(tasks),
-            "rework_rate": self.calculate_rework_rate(tasks),
-        }
-
-        # 작업 분포
-        distribution_stats = {
-            "priority_distribution": self.calculate_distribution(
-                tasks, "priority"
-            ),
-            "difficulty_distribution": self.calculate_distribution(
-                tasks, "difficulty"
-            ),
-            "status_distribution": self.calculate_distribution(
-                tasks, "status"
+        return conditional_response(
+            request,
+            report_validator(key, end_datetime.date()),
+            lambda: Response(
+                cached_report(
+                    key,
+                    report_timeout(end_datetime.date()),
+                    lambda: self.build_personal_report(
+                        report_user, start_datetime, end_datetime
+                    ),
+                )
             ),
-        }
+        )
 
-        # 내 작업 데이터를 한 번만 조회하여 재사용
-        my_tasks = Task.objects.filter(
-            assignee=report_user,
-            start_date__range=[start_datetime, end_datetime],
-            due_date__range=[start_datetime, end_datetime],
-            status="DONE",
-            completed_at__isnull=False
+    def build_personal_report(self, report_user, start_datetime, end_datetime):
+        """개인 보고서 데이터 계산"""
+        user = self.request.user
+
+        # 시작일과 종료일이 지정된 기간 내에 있는 작업을 한 번에 읽어 계산
+        report = PersonalReport(
+            report_user, start_datetime, end_datetime, self.get_queryset()
         )
 
+        # 선택된 기간에 작업이 없는 경우
+        if not report.exists():
+            return EMPTY_REPORT
+
         # 내 통계 계산
-        my_stats = self.calculate_user_stats(my_tasks)
+        my_stats = report.my_stats()
 
         # 비교 분석 (팀장 이상만)
         comparison_stats = {}
@@ -187,13 +155,85 @@ class ReportViewSet(viewsets.ViewSet):
                 )
             }
 
+        return {
+            "basic_stats": report.basic_stats(),
+            "time_stats": report.time_stats(),
+            "quality_stats": report.quality_stats(),
+            "distribution_stats": report.distribution_stats(),
+            "comparison_stats": comparison_stats,
+        }
+
+    @action(detail=False, methods=["get"])
+    def leaderboard(self, request):
+        """팀/본부 평가 점수 순위표
+
+        scope=team|headquarters, department(기본값: 본인 소속 팀/본부),
+        limit(기본 10, 최대 100)
+        """
+        user = request.user
+        scope = request.query_params.get("scope", "team").upper()
+        if scope not in SCOPES:
+            return Response(
+                {"detail": "scope는 team 또는 headquarters여야 합니다."},
+                status=400,
+            )
+
+        try:
+            limit = min(int(request.query_params.get("limit", 10)), 100)
+            department_id = request.query_params.get("department")
+            if department_id:
+                department_id = int(department_id)
+            elif user.department_id:
+                department_id = partition_of(user.department_id, scope)
+        except ValueError:
+            return Response(
+                {"detail": "limit와 department는 정수여야 합니다."},
+                status=400,
+            )
+
+        # 본인 소속 팀/본부 외에는 조회 가능한 부서만 허용
+        visible_ids = get_visible_department_ids(user)
+        own_partition = user.department_id and partition_of(
+            user.department_id, scope
+        )
+        if (
+            visible_ids is not None
+            and department_id != own_partition
+            and department_id not in visible_ids
+        ):
+            return Response({"detail": "권한이 없습니다."}, status=403)
+
+        rankings = (
+            PerformanceRanking.objects.filter(
+                scope=scope, department_id=department_id
+            )
+            .select_related("user")
+            .order_by("rank", "user_id")[: max(limit, 1)]
+        )
+        results = [
+            {
+                "rank": ranking.rank,
+                "user_id": ranking.user_id,
+                "name": f"{ranking.user.last_name}{ranking.user.first_name}",
+                "score": round(ranking.score, 1),
+                "evaluation_count": ranking.evaluation_count,
+            }
+            for ranking in rankings
+        ]
+
         return Response(
             {
-                "basic_stats": basic_stats,
-                "time_stats": time_stats,
-                "quality_stats": quality_stats,
-                "distribution_stats": distribution_stats,
-                "comparison_stats": comparison_stats,
+                "scope": scope,
+                "department_id": department_id,
+                "member_count": (
+                    rankings[0].member_count if results else 0
+                ),
+                "my_rank": (
+                    get_rank(user, scope)
+                    if own_partition == department_id
+                    else None
+                ),
+                "results": results,
             }
         )
 
@@ -229,115 +269,11 @@ class ReportViewSet(viewsets.ViewSet):
 
         return False
 
-    def calculate_time_efficiency(self, tasks):
-        """작업 시간 효율성 계산"""
-        completed_tasks = tasks.filter(status="DONE", estimated_hours__gt=0)
-        if not completed_tasks.exists():
-            return 0
-
-        total_estimated = (
-            completed_tasks.aggregate(Sum("estimated_hours"))[
-                "estimated_hours__sum"
-            ]
-            or 0
-        )
-        total_actual = (
-            completed_tasks.aggregate(Sum("actual_hours"))["actual_hours__sum"]
-            or 0
-        )
-
-        if total_estimated == 0:
-            return 0
-
-        return (total_actual / total_estimated) * 100
-
-    def calculate_daily_hours(self, tasks):
-        """일별 작업 시간 계산"""
-        daily_hours = []
-        tasks_with_logs = tasks.filter(time_logs__isnull=False).distinct()
-
-        for task in tasks_with_logs:
-            logs = task.time_logs.all()
-            for log in logs:
-                date = log.start_time.date()
-                hours = 0
-                if log.end_time:
-                    duration = log.end_time - log.start_time
-                    hours = duration.total_seconds() / 3600
-                    daily_hours.append(
-                        {"date": date.isoformat(), "hours": round(hours, 1)}
-                    )
-
-        return sorted(daily_hours, key=lambda x: x["date"])
-
-    def calculate_rejection_rate(self, tasks):
-        """검토 반려율 계산"""
-        evaluated_tasks = tasks.filter(evaluations__isnull=False).distinct()
-        if not evaluated_tasks.exists():
-            return 0
-
-        rejected_tasks = evaluated_tasks.filter(
-            evaluations__performance_score__lt=3
-        )
-        return (rejected_tasks.count() / evaluated_tasks.count()) * 100
-
-    def calculate_rework_rate(self, tasks):
-        """재작업률 계산"""
-        completed_tasks = tasks.filter(status="DONE")
-        if not completed_tasks.exists():
-            return 0
-
-        # 상태가 DONE에서 다른 상태로 변경된 이력이 있는 작업을 재작업으로 간주
-        rework_tasks = completed_tasks.filter(
-            history__previous_status="DONE",
-            history__new_status__in=["IN_PROGRESS", "REVIEW"],
-        ).distinct()
-
-        return (rework_tasks.count() / completed_tasks.count()) * 100
-
-    def calculate_distribution(self, tasks, field):
-        """작업 분포 계산"""
-        distribution = tasks.values(field).annotate(count=Count(field))
-        total = tasks.count()
-
-        # 필드별 정렬 순서 정의
-        field_order = {
-            "priority": ["URGENT", "HIGH", "MEDIUM", "LOW"],
-            "difficulty": ["VERY_HARD", "HARD", "MEDIUM", "EASY"],
-            "status": ["TODO", "IN_PROGRESS", "REVIEW", "DONE", "HOLD"],
-        }
-
-        # 비율 계산 및 필드명 매핑
-        result = []
-        for item in distribution:
-            field_value = item[field]
-            count = item["count"]
-            percentage = (count / total * 100) if total > 0 else 0
-            result.append(
-                {
-                    "field": field_value,
-                    "count": count,
-                    "percentage": round(percentage, 1),
-                }
-            )
-
-        # 정렬된 결과 반환
-        if field in field_order:
-            result.sort(
-                key=lambda x: (
-                    field_order[field].index(x["field"])
-                    if x["field"] in field_order[field]
-                    else len(field_order[field])
-                )
-            )
-
-        return result
-
     def get_team_comparison(self, user, start_date, end_date, my_stats):
         """팀 비교 통계 계산"""
         # 팀의 전체 작업 (자신 포함)
         team_tasks = Task.objects.filter(
-            assignee__department=user.department,  # 같은 팀의 작업
+            assignee__department_id=user.department_id,  # 같은 팀의 작업
             assignee__is_active=True,  # 활성 사용자만
             start_date__range=[start_date, end_date],
             due_date__range=[start_date, end_date],
@@ -380,14 +316,14 @@ class ReportViewSet(viewsets.ViewSet):
 
     def get_department_comparison(self, user, start_date, end_date, my_stats):
         """부서 비교 통계 계산"""
-        dept = user.department
-        if dept.parent:  # 팀인 경우 상위 부서(본부) 기준
-            dept = dept.parent
+        # 팀인 경우 상위 부서(본부) 기준
+        tree = get_department_tree()
+        dept_id = tree.parent_of(user.department_id) or user.department_id
 
         # 부서의 전체 작업 (자신 포함)
         dept_tasks = Task.objects.filter(
-            Q(assignee__department=dept) |  # 본부 직속 구성원
-            Q(assignee__department__parent=dept),  # 산하 팀 구성원
+            Q(assignee__department_id=dept_id) |  # 본부 직속 구성원
+            Q(assignee__department__parent_id=dept_id),  # 산하 팀 구성원
             assignee__is_active=True,  # 활성 사용자만
             start_date__range=[start_date, end_date],
             due_date__range=[start_date, end_date],
@@ -546,68 +482,9 @@ class ReportViewSet(viewsets.ViewSet):
         return (user_score / comparison_score) * 100
 
     def calculate_rank_in_team(self, user):
-        """팀 내 순위 계산"""
-        team_members = User.objects.filter(department=user.department)
-        rankings = []
-
-        for member in team_members:
-            tasks = Task.objects.filter(assignee=member, status="DONE")
-            score = self.calculate_team_avg_score(tasks)
-            rankings.append((member, score))
-
-        rankings.sort(key=lambda x: x[1], reverse=True)
-        for rank, (member, _) in enumerate(rankings, 1):
-            if member == user:
-                return rank
-
-        return len(rankings)
+        """팀 내 순위 계산 (미리 계산된 순위 테이블 조회)"""
+        return get_rank(user, TEAM)
 
     def calculate_rank_in_department(self, user):
-        """부서 내 순위 계산"""
-        dept_members = User.objects.filter(
-            department__parent=user.department.parent
-        )
-        rankings = []
-
-        for member in dept_members:
-            tasks = Task.objects.filter(assignee=member, status="DONE")
-            score = self.calculate_dept_avg_score(tasks)
-            rankings.append((member, score))
-
-        rankings.sort(key=lambda x: x[1], reverse=True)
-        for rank, (member, _) in enumerate(rankings, 1):
-            if member == user:
-                return rank
-
-        return len(rankings)
-
-    def calculate_user_stats(self, tasks):
-        """사용자 작업 통계 계산"""
-        if not tasks.exists():
-            return {
-                "completion_time": "0h 0m",
-                "score": 0,
-                "avg_completion_time": None
-            }
-
-        # 평균 완료 시간 계산
-        avg_completion_time = tasks.aggregate(
-            avg_time=Avg(F("completed_at") - F("start_date"))
-        )["avg_time"]
-
-        completion_time = "0h 0m"
-        if avg_completion_time:
-            hours = int(avg_completion_time.total_seconds() // 3600)
-            minutes = int((avg_completion_time.total_seconds() % 3600) // 60)
-            completion_time = f"{hours}h {minutes}m"
-
-        # 평가 점수 계산
-        score = TaskEvaluation.objects.filter(
-            task__in=tasks
-        ).aggregate(avg_score=Avg("performance_score"))["avg_score"] or 0
-
-        return {
-            "completion_time": completion_time,
-            "score": round(score, 1),
-            "avg_completion_time": avg_completion_time
-        }
+        """부서(본부) 내 순위 계산 (미리 계산된 순위 테이블 조회)"""
+        return get_rank(user, HEADQUARTERS)
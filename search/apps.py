@@ -0,0 +1,40 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "search"
+
+    def ready(self):
+        from django.contrib.auth import get_user_model
+
+        from organizations.models import Department
+        from tasks.models import Task
+        from .index import (
+            index_department,
+            index_task,
+            index_user,
+            unindex_department,
+            unindex_task,
+            unindex_user,
+        )
+
+        # 자동완성 인덱스 갱신
+        handlers = [
+            (get_user_model(), index_user, unindex_user),
+            (Department, index_department, unindex_department),
+            (Task, index_task, unindex_task),
+        ]
+        for model, on_save, on_delete in handlers:
+            label = model._meta.model_name
+            post_save.connect(
+                on_save,
+                sender=model,
+                dispatch_uid=f"search.index.{label}_save",
+            )
+            post_delete.connect(
+                on_delete,
+                sender=model,
+                dispatch_uid=f"search.index.{label}_delete",
+            )
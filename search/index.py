@@ -0,0 +1,498 @@
+"""검색어 자동완성(suggest) 메모리 인덱스
+
+활성 사용자, 부서, 최근 작업 제목을 프로세스 메모리에 올려 두고
+DB 접근 없이 접두어/부분 일치 후보를 찾는다.
+
+- 접두어: 정렬된 키 목록에서 이분 탐색
+- 부분 일치: 2글자 단위(bigram) 역색인 교집합 후 확인
+  (한글 이름/제목 중간 글자로도 찾을 수 있도록)
+
+모델 저장/삭제 시그널로 커밋 후 현재 프로세스의 인덱스를 갱신하고
+변경 기록(SuggestChange)을 남긴다. 다른 프로세스는 재구성하지 않고
+settings.SHARED_VERSION_TTL초마다 한 번 이후의 기록만 읽어, 바뀐 항목만
+다시 조회해 반영한다. 그 사이의 조회는 DB에 접근하지 않는다.
+"""
+
+import bisect
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from organizations.models import Department
+from organizations.scope import (
+    HEADQUARTERS_RANKS,
+    get_visible_department_ids,
+)
+from tasks.models import Task
+
+from .models import SuggestChange
+
+User = get_user_model()
+
+USER = "user"
+DEPARTMENT = "department"
+TASK = "task"
+TYPES = [USER, DEPARTMENT, TASK]
+
+# 전체 재구성 요청 (SuggestChange.kind)
+ALL = "all"
+
+# 변경 기록을 이 시간만큼 겹쳐 읽는다 (노드 간 시계 차이, 기록 시각과
+# 커밋 사이에 읽은 경우). 이미 반영한 기록은 id로 건너뛴다
+CHANGE_SKEW = timedelta(seconds=5)
+# 변경 기록 보관 기간 (이보다 오래 확인하지 않은 프로세스는 재구성)
+CHANGE_RETENTION = timedelta(hours=1)
+
+# 같은 점수일 때 표시 순서
+TYPE_ORDER = {kind: index for index, kind in enumerate(TYPES)}
+
+# 일치 종류별 점수 (낮을수록 우선)
+EXACT, PREFIX, INFIX = 0, 1, 2
+
+# 후보를 이 개수까지만 모은 뒤 정렬 (키가 매우 흔한 접두어일 때 상한)
+MAX_CANDIDATES = 500
+
+USER_FIELDS = {
+    "username",
+    "last_name",
+    "first_name",
+    "employee_id",
+    "email",
+    "department_id",
+    "is_active",
+}
+TASK_FIELDS = {"title", "department_id", "assignee_id", "status"}
+
+
+def normalize(text):
+    """소문자, 공백 제거"""
+    return "".join((text or "").lower().split())
+
+
+def bigrams(text):
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+@dataclass(frozen=True)
+class Entry:
+    kind: str
+    id: int
+    label: str
+    description: str = ""
+    keys: tuple = ()
+    department_id: int = None
+    assignee_id: int = None
+
+    @property
+    def ref(self):
+        return (self.kind, self.id)
+
+    def as_dict(self):
+        return {
+            "type": self.kind,
+            "id": self.id,
+            "label": self.label,
+            "description": self.description,
+        }
+
+
+def user_entry(user):
+    full_name = f"{user.last_name}{user.first_name}"
+    return Entry(
+        kind=USER,
+        id=user.pk,
+        label=full_name or user.username,
+        description=user.employee_id or "",
+        keys=(
+            full_name,
+            user.first_name,
+            user.username,
+            user.employee_id,
+            user.email,
+        ),
+        department_id=user.department_id,
+    )
+
+
+def department_entry(department):
+    return Entry(
+        kind=DEPARTMENT,
+        id=department.pk,
+        label=department.name,
+        description=department.code,
+        keys=(department.name, department.code),
+        department_id=department.pk,
+    )
+
+
+def task_entry(task):
+    # 제목 전체와 단어별 키 (중간 단어 접두어로도 찾을 수 있도록)
+    return Entry(
+        kind=TASK,
+        id=task.pk,
+        label=task.title,
+        description=task.status,
+        keys=(task.title, *task.title.split()),
+        department_id=task.department_id,
+        assignee_id=task.assignee_id,
+    )
+
+
+class SuggestIndex:
+    def __init__(self, entries=()):
+        self.entries = {}
+        self.keys = []  # (정규화된 키, 종류, id) 정렬 목록
+        self.grams = defaultdict(set)
+        self.lock = threading.Lock()
+        for entry in entries:
+            self._add(entry)
+
+    @classmethod
+    def build(cls):
+        users = User.objects.filter(is_active=True).only(*USER_FIELDS)
+        departments = Department.objects.only("name", "code")
+        tasks = Task.objects.only(*TASK_FIELDS).order_by("-updated_at")[
+            : settings.SEARCH_SUGGEST_TASK_LIMIT
+        ]
+        return cls(
+            [user_entry(user) for user in users]
+            + [department_entry(department) for department in departments]
+            + [task_entry(task) for task in tasks]
+        )
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, entry):
+        with self.lock:
+            self._remove(entry.ref)
+            self._add(entry)
+
+    def remove(self, kind, pk):
+        with self.lock:
+            self._remove((kind, pk))
+
+    def _add(self, entry):
+        self.entries[entry.ref] = entry
+        for key in self.normalized_keys(entry):
+            bisect.insort(self.keys, (key, *entry.ref))
+            for gram in bigrams(key):
+                self.grams[gram].add(entry.ref)
+
+    def _remove(self, ref):
+        entry = self.entries.pop(ref, None)
+        if entry is None:
+            return
+        for key in self.normalized_keys(entry):
+            position = bisect.bisect_left(self.keys, (key, *ref))
+            if position < len(self.keys) and self.keys[position] == (
+                key,
+                *ref,
+            ):
+                del self.keys[position]
+            for gram in bigrams(key):
+                self.grams[gram].discard(ref)
+                if not self.grams[gram]:
+                    del self.grams[gram]
+
+    @staticmethod
+    def normalized_keys(entry):
+        return {normalize(key) for key in entry.keys if key}
+
+    def search(self, text, limit=10, types=None, visible=None):
+        """검색어와 일치하는 상위 limit개 항목
+
+        types로 종류를 제한하고, visible(entry) -> bool 로
+        조회자 권한 범위를 적용한다.
+        """
+        query = normalize(text)
+        if not query:
+            return []
+
+        def accept(ref):
+            if types is not None and ref[0] not in types:
+                return False
+            return visible is None or visible(self.entries[ref])
+
+        scores = {}
+        with self.lock:
+            # 접두어 일치
+            position = bisect.bisect_left(self.keys, (query,))
+            while position < len(self.keys) and len(scores) < MAX_CANDIDATES:
+                key, kind, pk = self.keys[position]
+                if not key.startswith(query):
+                    break
+                position += 1
+                ref = (kind, pk)
+                score = EXACT if key == query else PREFIX
+                if ref in scores:
+                    scores[ref] = min(score, scores[ref])
+                elif accept(ref):
+                    scores[ref] = score
+
+            # 부분 일치 (2글자 이상)
+            grams = bigrams(query)
+            if grams and len(scores) < MAX_CANDIDATES:
+                sets = sorted(
+                    (self.grams.get(gram, set()) for gram in grams), key=len
+                )
+                for ref in set.intersection(*sets):
+                    if ref in scores or not accept(ref):
+                        continue
+                    keys = self.normalized_keys(self.entries[ref])
+                    if any(query in key for key in keys):
+                        scores[ref] = INFIX
+                        if len(scores) >= MAX_CANDIDATES:
+                            break
+
+            entries = [self.entries[ref] for ref in scores]
+
+        entries.sort(
+            key=lambda entry: (
+                scores[entry.ref],
+                TYPE_ORDER[entry.kind],
+                len(entry.label),
+                entry.label,
+            )
+        )
+        return entries[:limit]
+
+
+_lock = threading.Lock()
+_index = None
+# 마지막으로 변경 기록을 읽은 시각 (재구성 포함)
+_synced_at = None
+_checked_at = None
+# 겹쳐 읽는 구간에서 이미 반영한 기록 (id -> 기록 시각)
+_applied = {}
+_pruned_at = None
+
+# 종류별 (모델, 조회 필드, 항목 생성 함수)
+SOURCES = {
+    USER: (User, USER_FIELDS, user_entry),
+    DEPARTMENT: (Department, {"name", "code"}, department_entry),
+    TASK: (Task, TASK_FIELDS, task_entry),
+}
+
+
+def get_suggest_index():
+    """현재 자동완성 인덱스 반환
+
+    다른 프로세스의 변경은 SHARED_VERSION_TTL초마다 한 번 반영한다.
+    """
+    index = _index
+    if (
+        index is not None
+        and time.monotonic() - _checked_at < settings.SHARED_VERSION_TTL
+    ):
+        return index
+
+    with _lock:
+        if _index is None or (
+            time.monotonic() - _checked_at >= settings.SHARED_VERSION_TTL
+        ):
+            _sync()
+        return _index
+
+
+def _sync():
+    """다른 프로세스의 변경 기록 반영 (_lock 안에서 호출)"""
+    global _index, _synced_at, _checked_at, _applied
+
+    now = timezone.now()
+    if _index is None or _synced_at < now - CHANGE_RETENTION:
+        _rebuild(now)
+    else:
+        changes = [
+            change
+            for change in SuggestChange.objects.filter(
+                changed_at__gte=_synced_at - CHANGE_SKEW
+            ).order_by("pk")
+            if change.pk not in _applied
+        ]
+        if any(change.kind == ALL for change in changes):
+            _rebuild(now)
+        else:
+            ids = defaultdict(set)
+            for change in changes:
+                ids[change.kind].add(change.object_id)
+            for kind, pks in ids.items():
+                _refresh(_index, kind, pks)
+            _applied.update(
+                (change.pk, change.changed_at) for change in changes
+            )
+            _synced_at = now
+
+    # 겹쳐 읽는 구간을 벗어난 기록은 더 기억할 필요 없음
+    _applied = {
+        pk: changed_at
+        for pk, changed_at in _applied.items()
+        if changed_at >= _synced_at - CHANGE_SKEW
+    }
+    _checked_at = time.monotonic()
+    _prune_changes()
+
+
+def _rebuild(now):
+    global _index, _synced_at
+
+    _index = SuggestIndex.build()
+    _synced_at = now
+
+
+def _refresh(index, kind, pks):
+    """해당 항목들을 DB에서 다시 읽어 인덱스에 반영 (없어졌으면 제거)"""
+    if kind not in SOURCES:
+        return
+    model, fields, build_entry = SOURCES[kind]
+    queryset = model.objects.filter(pk__in=pks).only(*fields)
+    if kind == USER:
+        queryset = queryset.filter(is_active=True)
+    found = {obj.pk: obj for obj in queryset}
+    for pk in pks:
+        if pk in found:
+            index.add(build_entry(found[pk]))
+        else:
+            index.remove(kind, pk)
+
+
+def _prune_changes():
+    """보관 기간이 지난 변경 기록 삭제 (프로세스마다 보관 기간에 한 번)"""
+    global _pruned_at
+
+    now = time.monotonic()
+    if (
+        _pruned_at is not None
+        and now - _pruned_at < CHANGE_RETENTION.total_seconds()
+    ):
+        return
+    _pruned_at = now
+    SuggestChange.objects.filter(
+        changed_at__lt=timezone.now() - CHANGE_RETENTION
+    ).delete()
+
+
+def _record(kind, pk=None):
+    """변경 기록 (현재 프로세스는 이미 반영했으므로 건너뛰도록 표시)"""
+    change = SuggestChange.objects.create(kind=kind, object_id=pk)
+    _applied[change.pk] = change.changed_at
+
+
+def _apply(kind, pk, entry=None):
+    """커밋 후 현재 프로세스 인덱스에 반영하고 다른 프로세스에 알림
+
+    entry가 없으면(삭제, 비활성화) 인덱스에서 제거한다.
+    """
+
+    def apply():
+        index = _index
+        if index is not None:
+            if entry is None:
+                index.remove(kind, pk)
+            else:
+                index.add(entry)
+        _record(kind, pk)
+
+    transaction.on_commit(apply)
+
+
+def _refresh_after_commit(kind, pk):
+    """일부 필드만 조회한 객체: 커밋 후 DB에서 다시 읽어 반영"""
+
+    def refresh():
+        index = _index
+        if index is not None:
+            _refresh(index, kind, {pk})
+        _record(kind, pk)
+
+    transaction.on_commit(refresh)
+
+
+def _indexed_fields_loaded(instance, fields):
+    return not fields & instance.get_deferred_fields()
+
+
+def _changed(update_fields, fields):
+    if update_fields is None:
+        return True
+    # update_fields에는 "department" / "department_id" 모두 올 수 있음
+    names = {name.removesuffix("_id") for name in update_fields}
+    return bool(names & {name.removesuffix("_id") for name in fields})
+
+
+def index_user(sender, instance, update_fields=None, **kwargs):
+    if not _changed(update_fields, USER_FIELDS):
+        return
+    if not _indexed_fields_loaded(instance, USER_FIELDS):
+        return _refresh_after_commit(USER, instance.pk)
+    if instance.is_active:
+        _apply(USER, instance.pk, user_entry(instance))
+    else:
+        _apply(USER, instance.pk)
+
+
+def index_department(sender, instance, **kwargs):
+    _apply(DEPARTMENT, instance.pk, department_entry(instance))
+
+
+def index_task(sender, instance, update_fields=None, **kwargs):
+    if not _changed(update_fields, TASK_FIELDS):
+        return
+    if not _indexed_fields_loaded(instance, TASK_FIELDS):
+        return _refresh_after_commit(TASK, instance.pk)
+    _apply(TASK, instance.pk, task_entry(instance))
+
+
+def unindex(kind):
+    def handler(sender, instance, **kwargs):
+        _apply(kind, instance.pk)
+
+    return handler
+
+
+unindex_user = unindex(USER)
+unindex_department = unindex(DEPARTMENT)
+unindex_task = unindex(TASK)
+
+
+def invalidate_suggest_index(**kwargs):
+    """모든 프로세스의 인덱스를 다음 조회 때 재구성 (대량 변경 후)"""
+    global _index
+
+    _record(ALL)
+    with _lock:
+        _index = None
+
+
+def can_see(user):
+    """조회자 권한 범위 (사용자 목록/작업 목록 API와 동일한 기준)"""
+    department_ids = None
+    if user.role != "ADMIN" and (
+        user.rank in HEADQUARTERS_RANKS or user.role == "MANAGER"
+    ):
+        department_ids = get_visible_department_ids(user)
+
+    def visible(entry):
+        if entry.kind == DEPARTMENT:
+            return True
+        if entry.kind == USER:
+            if user.role == "EMPLOYEE":
+                return entry.id == user.pk
+            if user.role == "MANAGER" and user.rank not in HEADQUARTERS_RANKS:
+                return entry.department_id == user.department_id
+            return True
+        # 작업
+        if user.role == "ADMIN":
+            return True
+        if department_ids is not None:
+            return entry.department_id in department_ids
+        return entry.assignee_id == user.pk
+
+    return visible
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SuggestChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20, verbose_name='종류')),
+                ('object_id', models.BigIntegerField(null=True, verbose_name='대상 ID')),
+                ('changed_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='변경 시각')),
+            ],
+            options={
+                'verbose_name': '자동완성 변경 기록',
+                'verbose_name_plural': '자동완성 변경 기록들',
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class SuggestChange(models.Model):
+    """자동완성 인덱스 변경 기록
+
+    사용자/부서/작업이 바뀐 프로세스가 커밋 후 남기고, 다른 프로세스는
+    주기적으로 이후 기록만 읽어 해당 항목만 다시 조회해 반영한다.
+    (search/index.py, 오래된 기록은 정리)
+    """
+
+    kind = models.CharField(max_length=20, verbose_name="종류")
+    # 전체 재구성 요청이면 비어 있음
+    object_id = models.BigIntegerField(null=True, verbose_name="대상 ID")
+    changed_at = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name="변경 시각"
+    )
+
+    class Meta:
+        verbose_name = "자동완성 변경 기록"
+        verbose_name_plural = "자동완성 변경 기록들"
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} ({self.changed_at})"
@@ -0,0 +1,163 @@
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from organizations.models import Department
+from tasks.models import Task
+from .index import (
+    ALL,
+    TASK,
+    USER,
+    SuggestIndex,
+    get_suggest_index,
+    invalidate_suggest_index,
+    user_entry,
+)
+from .models import SuggestChange
+
+User = get_user_model()
+
+
+class SuggestIndexTest(APITestCase):
+    def setUp(self):
+        invalidate_suggest_index()
+        self.department = Department.objects.create(
+            name="플랫폼개발팀", code="PLT001"
+        )
+        self.admin = User.objects.create_user(
+            username="admin",
+            password="testpass123",
+            employee_id="ADM001",
+            department=self.department,
+            role="ADMIN",
+        )
+        self.member = User.objects.create_user(
+            username="gildong",
+            password="testpass123",
+            employee_id="EMP001",
+            email="gildong@example.com",
+            last_name="홍",
+            first_name="길동",
+            department=self.department,
+            role="EMPLOYEE",
+        )
+        self.task = Task.objects.create(
+            title="배포 자동화 스크립트",
+            assignee=self.member,
+            reporter=self.admin,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        self.url = reverse("search-suggest")
+
+    def suggest(self, user, **params):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        return [(item["type"], item["id"]) for item in results]
+
+    def test_prefix_and_infix(self):
+        index = SuggestIndex([user_entry(self.member)])
+        self.assertEqual(len(index.search("홍길")), 1)
+        self.assertEqual(len(index.search("길동")), 1)
+        self.assertEqual(len(index.search("EMP0")), 1)
+        self.assertEqual(len(index.search("길순")), 0)
+
+    def test_suggest_without_queries(self):
+        self.suggest(self.admin, q="warm-up")
+        with self.assertNumQueries(0):
+            results = self.suggest(self.admin, q="플랫폼")
+        self.assertEqual(results, [("department", self.department.id)])
+
+        results = self.suggest(self.admin, q="자동화")
+        self.assertEqual(results, [("task", self.task.id)])
+
+        # 정확히 일치하는 항목이 먼저
+        results = self.suggest(self.admin, q="gildong")
+        self.assertEqual(results[0], ("user", self.member.id))
+
+    def test_index_follows_changes(self):
+        self.suggest(self.admin, q="warm-up")
+        index = get_suggest_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.title = "모니터링 대시보드"
+            self.task.save()
+        self.assertEqual(self.suggest(self.admin, q="자동화"), [])
+        self.assertEqual(
+            self.suggest(self.admin, q="대시보드"), [("task", self.task.id)]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.is_active = False
+            self.member.save()
+        self.assertEqual(self.suggest(self.admin, q="홍길동"), [])
+
+        # 다른 프로세스용 변경 기록을 남기고, 현재 프로세스는 재구성하지 않음
+        self.assertEqual(
+            list(
+                SuggestChange.objects.exclude(kind=ALL)
+                .order_by("pk")
+                .values_list("kind", "object_id")
+            ),
+            [(TASK, self.task.pk), (USER, self.member.pk)],
+        )
+        self.assertIs(get_suggest_index(), index)
+
+    def test_changes_from_other_process(self):
+        self.suggest(self.admin, q="warm-up")
+        index = get_suggest_index()
+        # 다른 프로세스의 변경: 이 프로세스에는 시그널이 오지 않고
+        # 변경 기록만 남는다
+        User.objects.filter(pk=self.member.pk).update(is_active=False)
+        Task.objects.filter(pk=self.task.pk).update(title="모니터링 대시보드")
+        SuggestChange.objects.create(kind=USER, object_id=self.member.pk)
+        SuggestChange.objects.create(kind=TASK, object_id=self.task.pk)
+
+        # 확인 주기 안에는 DB에 접근하지 않는다
+        with self.assertNumQueries(0):
+            results = self.suggest(self.admin, q="홍길동")
+        self.assertEqual(results, [("user", self.member.id)])
+
+        # 주기가 지나면 변경 기록과 바뀐 항목만 읽어 반영 (재구성 없음)
+        with override_settings(SHARED_VERSION_TTL=0):
+            with self.assertNumQueries(3):
+                results = self.suggest(self.admin, q="홍길동")
+            self.assertEqual(results, [])
+            self.assertEqual(
+                self.suggest(self.admin, q="대시보드"),
+                [("task", self.task.id)],
+            )
+        self.assertIs(get_suggest_index(), index)
+
+    def test_rebuild_requested_by_other_process(self):
+        index = get_suggest_index()
+        SuggestChange.objects.create(kind=ALL)
+
+        self.assertIs(get_suggest_index(), index)
+        with override_settings(SHARED_VERSION_TTL=0):
+            self.assertIsNot(get_suggest_index(), index)
+
+    def test_scope_and_types(self):
+        other = User.objects.create_user(
+            username="other",
+            password="testpass123",
+            employee_id="EMP002",
+            department=self.department,
+            role="EMPLOYEE",
+        )
+        # 직원은 자신의 작업만
+        self.assertEqual(self.suggest(other, q="배포"), [])
+        self.assertEqual(
+            self.suggest(self.member, q="배포"), [("task", self.task.id)]
+        )
+        self.assertEqual(
+            self.suggest(self.admin, q="플랫폼", types="task"), []
+        )
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url, {"q": "a", "types": "project"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,48 @@
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .index import TYPES, can_see, get_suggest_index
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+
+class SearchViewSet(viewsets.ViewSet):
+    permission_classes = [IsAuthenticated]
+
+    @action(detail=False, methods=["get"])
+    def suggest(self, request):
+        """검색어 자동완성 (사용자/부서/최근 작업, DB 조회 없음)
+
+        - q: 검색어 (이름/사번/이메일/부서명/작업 제목의 접두어 또는 일부)
+        - types: user,department,task 중 쉼표 구분 (기본 전체)
+        - limit: 최대 결과 수 (기본 10, 최대 50)
+        """
+        query = request.query_params.get("q", "")
+
+        types = None
+        if request.query_params.get("types"):
+            types = set(request.query_params["types"].split(","))
+            if not types <= set(TYPES):
+                return Response(
+                    {"detail": f"types는 {', '.join(TYPES)} 중에서 선택"},
+                    status=400,
+                )
+
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_LIMIT))
+        except ValueError:
+            return Response({"detail": "limit은 숫자여야 합니다."}, status=400)
+        limit = max(1, min(limit, MAX_LIMIT))
+
+        results = get_suggest_index().search(
+            query, limit=limit, types=types, visible=can_see(request.user)
+        )
+        return Response(
+            {
+                "query": query,
+                "results": [entry.as_dict() for entry in results],
+            }
+        )
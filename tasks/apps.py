@@ -1,6 +1,49 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_init, post_save
 
 
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tasks'
+
+    def ready(self):
+        from django.contrib.auth import get_user_model
+
+        from .calendar_sync import mark_removal
+        from .models import Task
+        from .search import (
+            remember_search_name,
+            remember_search_values,
+            update_assignee_search_vectors,
+            update_task_search_vector,
+        )
+
+        # 검색 벡터 갱신 (작업 저장, 담당자 이름 변경)
+        User = get_user_model()
+        post_init.connect(
+            remember_search_values,
+            sender=Task,
+            dispatch_uid="tasks.search.task_init",
+        )
+        post_save.connect(
+            update_task_search_vector,
+            sender=Task,
+            dispatch_uid="tasks.search.task_save",
+        )
+        post_init.connect(
+            remember_search_name,
+            sender=User,
+            dispatch_uid="tasks.search.user_init",
+        )
+        post_save.connect(
+            update_assignee_search_vectors,
+            sender=User,
+            dispatch_uid="tasks.search.user_save",
+        )
+
+        # 삭제된 작업은 캘린더 증분 동기화로 알 수 없으므로 전체 동기화 표시
+        post_delete.connect(
+            mark_removal,
+            sender=Task,
+            dispatch_uid="tasks.calendar_sync.task_delete",
+        )
@@ -0,0 +1,80 @@
+"""캘린더 증분 동기화 토큰
+
+캘린더 응답의 X-Sync-Token 헤더로 토큰을 돌려주고, 클라이언트가 같은
+기간을 ?sync_token= 과 함께 다시 요청하면 토큰 발급 이후 변경된
+작업(updated_at 기준)만 반환한다.
+
+- 기간을 벗어나도록 변경된 작업은 {"id": ..., "removed": true}로 알린다.
+- 삭제/담당자·부서 변경(조회 범위 밖으로 이동)은 updated_at으로 알 수
+  없으므로 발생 시각을 모든 프로세스가 보는 shared 캐시에 기록하고, 그 이후에 발급된 토큰이 아니면
+  전체 목록을 다시 보낸다. (X-Sync-Full: true)
+"""
+
+import base64
+import json
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from config.versions import get_shared_cache
+
+REMOVAL_KEY = "tasks:calendar:removed_at"
+
+# 토큰 시각을 조금 앞당겨 요청 처리 중 커밋된 변경도 다음 동기화에 포함
+# (중복으로 받은 작업은 클라이언트가 id로 덮어쓴다)
+SYNC_SKEW = timedelta(seconds=5)
+
+
+def encode_token(user, start, end, issued_at):
+    payload = {
+        "u": user.pk,
+        "s": start.isoformat() if start else None,
+        "e": end.isoformat() if end else None,
+        "t": issued_at.isoformat(),
+    }
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_token(token, user, start, end):
+    """토큰 발급 시각 (다른 사용자/기간의 토큰이거나 형식이 잘못되면 None)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        issued_at = parse_datetime(payload["t"])
+    except (ValueError, TypeError, KeyError):
+        return None
+    if payload.get("u") != user.pk or issued_at is None:
+        return None
+    if payload.get("s") != (start.isoformat() if start else None):
+        return None
+    if payload.get("e") != (end.isoformat() if end else None):
+        return None
+    return issued_at
+
+
+def new_issued_at():
+    return timezone.now() - SYNC_SKEW
+
+
+def mark_removal(**kwargs):
+    """작업 삭제/범위 이동 시각 기록 (이전 토큰은 전체 동기화로 처리)"""
+    get_shared_cache().set(REMOVAL_KEY, timezone.now().isoformat(), None)
+
+
+def removal_marker():
+    """마지막 삭제/범위 이동 시각 (조건부 요청 검증자에 포함)
+
+    기록이 없어졌으면(캐시 초기화 등) 이후 발급될 토큰 시각 직전으로 다시
+    기록해, 그 전에 발급된 토큰은 전체 동기화하도록 한다.
+    """
+    cache = get_shared_cache()
+    removed_at = cache.get(REMOVAL_KEY)
+    if removed_at is None:
+        cache.add(REMOVAL_KEY, new_issued_at().isoformat(), None)
+        removed_at = cache.get(REMOVAL_KEY)
+    return removed_at
+
+
+def needs_full_sync(issued_at):
+    return parse_datetime(removal_marker()) >= issued_at
@@ -0,0 +1,395 @@
+import math
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.db.models import (
+    Avg,
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce, NullIf, TruncDate
+from django.utils import timezone
+
+from organizations.scope import get_visible_department_ids, scope_queryset
+from .models import Task, TaskEvaluation, TaskHistory, day_start
+from .serializers import TaskSerializer
+from .stats import priority_summary, task_summary
+
+User = get_user_model()
+
+# 패널 동시 실행용 스레드 풀 (프로세스마다 하나)
+# 작업 스레드의 DB 연결은 요청이 끝나도 닫지 않고 다음 요청에서 다시 쓴다.
+# (요청마다 스레드/연결을 새로 만드는 비용이 가벼운 집계보다 크므로)
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None:
+            _executor_workers = settings.DASHBOARD_MAX_WORKERS
+            _executor = ThreadPoolExecutor(
+                max_workers=_executor_workers,
+                thread_name_prefix="dashboard",
+            )
+        return _executor
+
+
+def close_worker_connections(timeout=10):
+    """스레드 풀의 모든 작업 스레드에서 DB 연결 닫기 (테스트 DB 삭제 전 등)
+
+    모든 작업 스레드가 하나씩 맡도록 같은 수의 작업을 동시에 대기시킨다.
+    """
+    executor = get_executor()
+    barrier = threading.Barrier(_executor_workers)
+
+    def close():
+        barrier.wait(timeout)
+        connections.close_all()
+
+    futures = [executor.submit(close) for _ in range(barrier.parties)]
+    for future in futures:
+        future.result()
+
+
+# 팀 성과 집계 대상 직급 (본부장/이사 제외)
+TEAM_MEMBER_RANKS = [
+    "STAFF",
+    "SENIOR",
+    "ASSISTANT_MANAGER",
+    "MANAGER",
+    "DEPUTY_GENERAL_MANAGER",
+]
+
+
+class Dashboard:
+    """대시보드 패널 계산기
+
+    사용자의 조회 범위를 한 번만 계산하고, 각 패널은 같은 기본 쿼리셋을
+    공유한다. 개별 대시보드 API와 통합 API가 모두 이 클래스를 사용한다.
+    """
+
+    PANELS = [
+        "stats",
+        "workload_stats",
+        "priority_stats",
+        "upcoming_deadlines",
+        "team_performance",
+        "recent",
+    ]
+
+    # 작업 부하 통계 기간 (일)
+    MIN_WORKLOAD_DAYS = 7
+    MAX_WORKLOAD_DAYS = 90
+
+    def __init__(self, user, today=None, workload_days=MIN_WORKLOAD_DAYS):
+        self.user = user
+        self.today = today or timezone.now().date()
+        self.workload_days = workload_days
+        self.department_ids = get_visible_department_ids(user)
+        self.tasks = scope_queryset(Task.objects.all(), user)
+
+    def stats(self):
+        """작업 전반적인 통계"""
+        return task_summary(self.tasks, today=self.today)
+
+    def workload_stats(self):
+        """최근 N일(기본 7일) 일별 작업 부하 통계
+
+        시작일/완료일/마감일 기준 일별 집계를 UNION으로 묶어
+        기간 길이와 관계없이 한 번의 쿼리로 계산한다.
+        """
+        start_date = self.today - timedelta(days=self.workload_days)
+        # 날짜 변환 없이 인덱스를 탈 수 있도록 시각 범위로 조회
+        window_start = timezone.make_aware(
+            datetime.combine(start_date, time.min)
+        )
+        window_end = timezone.make_aware(
+            datetime.combine(self.today, time.min)
+        )
+        zero = Value(0, output_field=IntegerField())
+
+        def daily(date_field, **counts):
+            columns = {
+                name: counts.get(name, zero)
+                for name in ["total", "in_progress", "completed", "delayed"]
+            }
+            return (
+                self.tasks.filter(
+                    **{
+                        f"{date_field}__gte": window_start,
+                        f"{date_field}__lt": window_end,
+                    }
+                )
+                .annotate(day=TruncDate(date_field))
+                .values("day")
+                .annotate(**columns)
+                .order_by()
+            )
+
+        rows = daily(
+            "start_date",
+            total=Count("pk"),
+            in_progress=Count("pk", filter=Q(status="IN_PROGRESS")),
+        ).union(
+            daily(
+                "completed_at",
+                completed=Count("pk", filter=Q(status="DONE")),
+            ),
+            daily(
+                "due_date",
+                delayed=Count(
+                    "pk", filter=Q(status__in=["TODO", "IN_PROGRESS"])
+                ),
+            ),
+            all=True,
+        )
+
+        counts = defaultdict(lambda: defaultdict(int))
+        for row in rows:
+            for name in ["total", "in_progress", "completed", "delayed"]:
+                counts[row["day"]][name] += row[name]
+
+        daily_stats = []
+        for i in range(self.workload_days):
+            date = start_date + timedelta(days=i)
+            day_counts = counts.get(date, {})
+            daily_stats.append(
+                {
+                    "date": date.strftime("%Y-%m-%d"),
+                    "total": day_counts.get("total", 0),
+                    "completed": day_counts.get("completed", 0),
+                    "inProgress": day_counts.get("in_progress", 0),
+                    "delayed": day_counts.get("delayed", 0),
+                }
+            )
+
+        return daily_stats
+
+    def priority_stats(self):
+        """우선순위별 작업 통계"""
+        return priority_summary(self.tasks)
+
+    def upcoming_deadlines(self):
+        """일주일 이내 마감 예정 작업 상위 5개"""
+        end_date = self.today + timedelta(days=7)
+
+        upcoming_tasks = self.tasks.for_detail().filter(
+            due_date__gte=day_start(self.today),
+            due_date__lt=day_start(end_date + timedelta(days=1)),
+            status__in=["TODO", "IN_PROGRESS"],
+        ).order_by("due_date")[:5]
+
+        return TaskSerializer(upcoming_tasks, many=True).data
+
+    # 팀 성과 정렬 기준 (파라미터 값 -> 정렬 필드)
+    TEAM_PERFORMANCE_ORDERING = {
+        "name": ["last_name", "first_name"],
+        "task_count": ["task_count"],
+        "completion_rate": ["completion_rate"],
+        "average_score": ["average_score"],
+    }
+
+    def team_performance(self, ordering=None, page=None, page_size=None):
+        """팀원별 완료율과 평균 평가 점수
+
+        작업 수/완료 수는 GROUP BY, 평균 점수는 상관 서브쿼리로 계산하여
+        팀원 수와 관계없이 한 번의 쿼리로 처리한다.
+        page_size를 지정하면 팀원 목록을 페이지 단위로 잘라 반환한다.
+        """
+        team_members = User.objects.filter(
+            is_active=True, rank__in=TEAM_MEMBER_RANKS
+        )
+        if self.department_ids is not None:
+            team_members = team_members.filter(
+                department_id__in=self.department_ids
+            )
+
+        # 평가 점수는 완료된 작업만 대상으로
+        average_score = (
+            TaskEvaluation.objects.filter(
+                task__assignee=OuterRef("pk"), task__status="DONE"
+            )
+            .values("task__assignee")
+            .annotate(score=Avg("performance_score"))
+            .values("score")
+        )
+        members = team_members.annotate(
+            task_count=Count("assigned_tasks"),
+            completed_count=Count(
+                "assigned_tasks", filter=Q(assigned_tasks__status="DONE")
+            ),
+        ).annotate(
+            completion_rate=Coalesce(
+                F("completed_count")
+                * Value(100.0)
+                / NullIf(F("task_count"), 0),
+                Value(0.0),
+                output_field=FloatField(),
+            ),
+            average_score=Coalesce(
+                Subquery(average_score, output_field=FloatField()),
+                Value(0.0),
+            ),
+        )
+
+        order_by = []
+        for term in (ordering or "").split(","):
+            term = term.strip()
+            descending = term.startswith("-")
+            for field in self.TEAM_PERFORMANCE_ORDERING.get(
+                term.lstrip("-"), []
+            ):
+                order_by.append(f"-{field}" if descending else field)
+        members = members.order_by(*order_by, "id").values(
+            "id",
+            "first_name",
+            "last_name",
+            "task_count",
+            "completion_rate",
+            "average_score",
+        )
+
+        result = {}
+        if page_size:
+            page = max(page or 1, 1)
+            count = team_members.count()
+            offset = (page - 1) * page_size
+            members = members[offset : offset + page_size]
+            result.update(
+                {
+                    "count": count,
+                    "total_pages": math.ceil(count / page_size),
+                    "current_page": page,
+                }
+            )
+
+        result["members"] = [
+            {
+                "user_id": member["id"],
+                "name": f"{member['last_name']}{member['first_name']}",
+                "completion_rate": round(member["completion_rate"], 1),
+                "task_count": member["task_count"],
+                "average_score": round(member["average_score"], 1),
+            }
+            for member in members
+        ]
+        return result
+
+    def recent(self):
+        """최근 작업 상태 변경 내역 10건"""
+        if self.user.role == "ADMIN":
+            queryset = TaskHistory.objects.all()
+        elif self.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
+            queryset = TaskHistory.objects.filter(
+                task__department_id__in=self.department_ids
+            )
+        else:
+            queryset = TaskHistory.objects.filter(
+                Q(task__assignee=self.user) | Q(changed_by=self.user)
+            )
+
+        recent_activities = queryset.select_related(
+            "task", "changed_by"
+        ).order_by("-created_at")[:10]
+
+        def get_status_text(status):
+            return dict(Task.STATUS_CHOICES).get(status, status)
+
+        return [
+            {
+                "id": activity.id,
+                "type": "STATUS_CHANGED",
+                "description": (
+                    "작업 상태가"
+                    f" {get_status_text(activity.previous_status)}에서"
+                    f" {get_status_text(activity.new_status)}로"
+                    " 변경되었습니다."
+                ),
+                "created_at": activity.created_at,
+                "task_id": activity.task.id,
+                "task_title": activity.task.title,
+            }
+            for activity in recent_activities
+        ]
+
+    def build(self, panels=None):
+        """선택한 패널들을 계산해 {패널명: 데이터}로 반환
+
+        각 패널은 서로 독립적인 집계 쿼리이므로 공유 스레드 풀에서 동시에
+        실행한다. 트랜잭션 안에서는 다른 연결이 커밋되지 않은 데이터를 볼 수
+        없으므로 순차 실행한다.
+        """
+        panels = panels or self.PANELS
+        if (
+            settings.DASHBOARD_MAX_WORKERS <= 1
+            or len(panels) <= 1
+            or connection.in_atomic_block
+        ):
+            return {panel: getattr(self, panel)() for panel in panels}
+
+        executor = get_executor()
+        futures = {
+            panel: executor.submit(self._run_panel, panel) for panel in panels
+        }
+        return {panel: future.result() for panel, future in futures.items()}
+
+    def _run_panel(self, panel):
+        try:
+            return getattr(self, panel)()
+        finally:
+            # 연결은 유지하고, 오류로 쓸 수 없게 된 연결만 닫아 다음 패널에서
+            # 다시 연결한다 (close_if_unusable_or_obsolete와 같은 판단)
+            for conn in connections.all(initialized_only=True):
+                if conn.errors_occurred:
+                    if conn.is_usable():
+                        conn.errors_occurred = False
+                    else:
+                        conn.close()
+
+    @classmethod
+    def parse_workload_days(cls, value):
+        """days 쿼리 파라미터 해석
+
+        정수가 아니거나 허용 범위를 벗어나면 ValueError를 발생시킨다.
+        """
+        if value in (None, ""):
+            return cls.MIN_WORKLOAD_DAYS
+
+        days = int(value)
+        if not cls.MIN_WORKLOAD_DAYS <= days <= cls.MAX_WORKLOAD_DAYS:
+            raise ValueError(value)
+        return days
+
+    @classmethod
+    def parse_panels(cls, value):
+        """panels 쿼리 파라미터 해석 (예: "stats,priority-stats")
+
+        알 수 없는 패널 이름이 있으면 ValueError를 발생시킨다.
+        """
+        if not value:
+            return list(cls.PANELS)
+
+        panels = []
+        for name in value.split(","):
+            name = name.strip().replace("-", "_")
+            if not name:
+                continue
+            if name not in cls.PANELS:
+                raise ValueError(name)
+            if name not in panels:
+                panels.append(name)
+        return panels
@@ -12,9 +12,27 @@ class TaskFilter(filters.FilterSet):
     status = filters.ChoiceFilter(choices=Task.STATUS_CHOICES)
     priority = filters.ChoiceFilter(choices=Task.PRIORITY_CHOICES)
     assignee = filters.NumberFilter()
-    department = filters.NumberFilter()
-    search = filters.CharFilter(field_name="title", lookup_expr="icontains")
+    is_delayed = filters.BooleanFilter(method="filter_is_delayed")
+    ordering = filters.OrderingFilter(
+        fields=(
+            ("start_date", "start_date"),
+            ("due_date", "due_date"),
+            ("created_at", "created_at"),
+            ("priority", "priority"),
+            ("delayed", "is_delayed"),
+        )
+    )
 
     class Meta:
         model = Task
-        fields = ["status", "priority", "assignee", "department"]
+        fields = ["status", "priority", "assignee"]
+
+    def filter_is_delayed(self, queryset, name, value):
+        return queryset.with_delay().filter(delayed=value)
+
+    def filter_queryset(self, queryset):
+        # 지연 여부 정렬은 주석이 필요하므로 미리 추가
+        ordering = self.form.cleaned_data.get("ordering") or []
+        if any(term.lstrip("-") == "is_delayed" for term in ordering):
+            queryset = queryset.with_delay()
+        return super().filter_queryset(queryset)
@@ -0,0 +1,84 @@
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from config.renderers import ORJSONParser, ORJSONRenderer
+from tasks.models import Task
+from tasks.seeding import SeedOptions, seed_organization
+from tasks.serializers import TaskListSerializer
+
+RENDERERS = [
+    ("json (DRF)", JSONRenderer, JSONParser),
+    ("orjson", ORJSONRenderer, ORJSONParser),
+]
+
+
+def best_of(repeat, func):
+    """repeat회 실행 중 가장 빠른 시간 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+class Command(BaseCommand):
+    help = (
+        "작업 목록 응답(기본 1만 건)의 JSON 렌더링/파싱 시간을 "
+        "표준 json과 orjson으로 비교"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=10000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        # 작업이 부족하면 합성 데이터를 만들어 측정 후 되돌린다
+        with transaction.atomic():
+            if Task.objects.count() < count:
+                self.stdout.write(f"Seeding {count} tasks (rolled back)")
+                seed_organization(
+                    SeedOptions(
+                        headquarters=1,
+                        teams_per_headquarters=10,
+                        members_per_team=10,
+                        tasks_per_member=-(-count // 100),
+                        prefix="Q",
+                    )
+                )
+            tasks = Task.objects.for_list().with_delay().order_by("id")
+            data = TaskListSerializer(tasks[:count], many=True).data
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Payload: {len(data)} tasks")
+        results = {}
+        for name, renderer_class, parser_class in RENDERERS:
+            renderer = renderer_class()
+            body = renderer.render(data)
+            render_ms = best_of(
+                options["repeat"], lambda: renderer.render(data)
+            )
+            parse_ms = best_of(
+                options["repeat"],
+                lambda: parser_class().parse(BytesIO(body)),
+            )
+            results[name] = (render_ms, parse_ms)
+            self.stdout.write(
+                f"  {name:<12} render {render_ms:8.1f} ms  "
+                f"parse {parse_ms:8.1f} ms  ({len(body) / 1024:.0f} KiB)"
+            )
+
+        baseline, fast = results["json (DRF)"], results["orjson"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully benchmarked: orjson render "
+                f"{baseline[0] / fast[0]:.1f}x, parse "
+                f"{baseline[1] / fast[1]:.1f}x faster"
+            )
+        )
@@ -0,0 +1,157 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from tasks.models import Task
+
+User = get_user_model()
+
+# 조회 API 목록 ({department}, {task}는 조회 사용자 기준으로 채움)
+DEFAULT_ENDPOINTS = [
+    "/api/tasks/",
+    "/api/tasks/?cursor=",
+    "/api/tasks/?department={department}&status=TODO",
+    "/api/tasks/?search=작업",
+    "/api/tasks/{task}/",
+    "/api/tasks/today_tasks/",
+    "/api/tasks/delayed_tasks/",
+    "/api/tasks/dashboard/",
+    "/api/tasks/workload/",
+    "/api/task-history/?task={task}",
+    "/api/task-history/?cursor=",
+    "/api/task-time-logs/?task={task}",
+    "/api/task-evaluations/",
+    "/api/notifications/",
+    "/api/notifications/?cursor=",
+    "/api/notifications/unread-count/",
+    "/api/users/",
+]
+
+
+def seq_scans(plan):
+    """실행 계획 트리의 Seq Scan 노드 (relation 이름, 예상 행 수)"""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"], plan.get("Plan Rows", 0)
+    for child in plan.get("Plans", []):
+        yield from seq_scans(child)
+
+
+class Command(BaseCommand):
+    help = (
+        "조회 API를 실제로 호출해 실행된 쿼리를 EXPLAIN하고 "
+        "큰 테이블의 순차 스캔(Seq Scan)을 보고"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="API를 호출할 사용자 (기본: 첫 번째 활성 ADMIN)",
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            dest="endpoints",
+            help="확인할 경로 (여러 번 지정 가능, 기본: 주요 조회 API)",
+        )
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=1000,
+            help="통계상 행 수가 이 값 이상인 테이블의 순차 스캔만 보고",
+        )
+        parser.add_argument(
+            "--fail",
+            action="store_true",
+            help="순차 스캔이 있으면 오류로 종료 (CI용)",
+        )
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["user"])
+        task = (
+            Task.objects.filter(assignee=user).first()
+            or Task.objects.first()
+        )
+        placeholders = {
+            "department": user.department_id or "",
+            "task": task.pk if task else 0,
+        }
+        endpoints = options["endpoints"] or DEFAULT_ENDPOINTS
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        table_rows = self.table_rows()
+
+        findings = 0
+        # 조회 중 발생하는 쓰기(순위/캐시 갱신 등)는 모두 되돌린다
+        with transaction.atomic(), override_settings(
+            ALLOWED_HOSTS=["testserver"]
+        ):
+            for endpoint in endpoints:
+                path = endpoint.format(**placeholders)
+                findings += self.explain_endpoint(
+                    client, path, table_rows, options["min_rows"]
+                )
+            transaction.set_rollback(True)
+
+        if findings and options["fail"]:
+            raise CommandError(f"{findings} sequential scan(s) found")
+        style = self.style.WARNING if findings else self.style.SUCCESS
+        self.stdout.write(style(f"{findings} sequential scan(s) found"))
+
+    def get_user(self, username):
+        users = User.objects.filter(is_active=True)
+        if username:
+            user = users.filter(username=username).first()
+        else:
+            user = users.filter(role="ADMIN").order_by("id").first()
+        if user is None:
+            raise CommandError("API를 호출할 사용자가 없습니다.")
+        return user
+
+    def table_rows(self):
+        """테이블별 통계상 행 수"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, reltuples::bigint FROM pg_class "
+                "WHERE relkind = 'r'"
+            )
+            return dict(cursor.fetchall())
+
+    def explain_endpoint(self, client, path, table_rows, min_rows):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path)
+
+        selects = [
+            query["sql"]
+            for query in queries
+            if query["sql"].lstrip().upper().startswith("SELECT")
+        ]
+        self.stdout.write(
+            f"{path} -> {response.status_code}, {len(selects)} queries"
+        )
+
+        findings = 0
+        for sql in selects:
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+                plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            for relation, plan_rows in seq_scans(plan[0]["Plan"]):
+                if table_rows.get(relation, 0) < min_rows:
+                    continue
+                findings += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  Seq Scan on {relation} "
+                        f"(table rows {table_rows[relation]}, "
+                        f"estimated {plan_rows})"
+                    )
+                )
+                self.stdout.write(f"    {sql[:300]}")
+        return findings
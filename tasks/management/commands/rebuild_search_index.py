@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from tasks.models import Task
+from tasks.search import update_search_vectors
+
+
+class Command(BaseCommand):
+    help = "작업 검색 벡터 재계산 (일괄 수정/데이터 이관 후 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="검색 벡터가 없는 작업만 재계산",
+        )
+
+    def handle(self, *args, **options):
+        tasks = Task.objects.order_by("id")
+        if options["missing"]:
+            tasks = tasks.filter(search_vector__isnull=True)
+        count = update_search_vectors(tasks)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully rebuilt {count} search vectors")
+        )
@@ -0,0 +1,102 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from organizations.models import Department
+from search.index import invalidate_suggest_index
+from tasks.seeding import SEEDED_MODELS, SeedOptions, seed_organization
+
+
+class Command(BaseCommand):
+    help = (
+        "벤치마크/인덱스 검증용 합성 조직 데이터 생성 "
+        "(scale=1: 사용자 약 1만 명, 작업 200만 건)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=0.01,
+            help="규모 배율 (기본 0.01: 사용자 약 100명, 작업 2만 건)",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="난수 seed (같으면 같은 데이터)"
+        )
+        parser.add_argument(
+            "--prefix",
+            default="S",
+            help="사용자명/사번/부서코드 접두어 (기존 데이터와 구분)",
+        )
+        parser.add_argument(
+            "--base-date",
+            type=date.fromisoformat,
+            help="작업 일정 기준일 YYYY-MM-DD (기본: 오늘)",
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--headquarters", type=int, help="본부 수")
+        parser.add_argument(
+            "--teams", type=int, dest="teams_per_headquarters", help="본부별 팀 수"
+        )
+        parser.add_argument(
+            "--members", type=int, dest="members_per_team", help="팀별 팀원 수"
+        )
+        parser.add_argument(
+            "--tasks-per-member", type=int, help="팀원별 작업 수"
+        )
+
+    def handle(self, *args, **options):
+        if options["scale"] <= 0:
+            raise CommandError("--scale은 0보다 커야 합니다.")
+        overrides = {
+            name: options[name]
+            for name in [
+                "headquarters",
+                "teams_per_headquarters",
+                "members_per_team",
+                "tasks_per_member",
+            ]
+            if options[name] is not None
+        }
+        seed_options = SeedOptions.for_scale(
+            options["scale"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            base_date=options["base_date"],
+            batch_size=options["batch_size"],
+            **overrides,
+        )
+
+        prefix = seed_options.prefix
+        if Department.objects.filter(code__startswith=f"{prefix}H").exists():
+            raise CommandError(
+                f"접두어 '{prefix}'로 생성된 데이터가 이미 있습니다. "
+                "--prefix를 바꿔 실행하세요."
+            )
+
+        self.stdout.write(
+            f"Seeding {seed_options.user_count} users, "
+            f"{seed_options.task_count} tasks (seed {seed_options.seed})"
+        )
+        with transaction.atomic():
+            counts = seed_organization(seed_options, self.report_progress)
+
+        # bulk_create는 시그널을 보내지 않으므로 자동완성 인덱스를 직접 무효화
+        invalidate_suggest_index()
+        with connection.cursor() as cursor:
+            for model in SEEDED_MODELS:
+                table = connection.ops.quote_name(model._meta.db_table)
+                cursor.execute(f"ANALYZE {table}")
+
+        for label, count in counts.items():
+            self.stdout.write(f"  {label}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully seeded {counts.get('task', 0)} tasks"
+            )
+        )
+
+    def report_progress(self, label, count):
+        if label == "task":
+            self.stdout.write(f"  tasks: {count}")
@@ -0,0 +1,89 @@
+# Generated by Django 5.0.3 on 2026-10-18 08:40
+
+import re
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import TextField, Value
+
+# 이 마이그레이션 시점의 tasks/search.py 색인 규칙 (이후 변경과 무관하도록
+# 앱 코드를 가져오지 않고 고정)
+TOKEN_RE = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+HANGUL_RE = re.compile(r"[가-힣]+")
+BATCH_SIZE = 500
+
+
+def search_document(text):
+    tokens = [token.lower() for token in TOKEN_RE.findall(text or "")]
+    grams = [
+        token[i : i + 2]
+        for token in tokens
+        if HANGUL_RE.fullmatch(token) and len(token) > 2
+        for i in range(len(token) - 1)
+    ]
+    return " ".join(tokens + grams)
+
+
+def search_vector(task):
+    assignee = task.assignee
+    name = f"{assignee.last_name}{assignee.first_name}" if assignee else ""
+    parts = [(task.title, "A"), (name, "B"), (task.description, "C")]
+    vector = None
+    for text, weight in parts:
+        part = SearchVector(
+            Value(search_document(text), output_field=TextField()),
+            config="simple",
+            weight=weight,
+        )
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def populate_search_vectors(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    tasks = (
+        Task.objects.select_related("assignee")
+        .only(
+            "id",
+            "title",
+            "description",
+            "assignee__last_name",
+            "assignee__first_name",
+        )
+        .order_by("pk")
+    )
+    batch = []
+    for task in tasks.iterator(chunk_size=BATCH_SIZE):
+        task.search_vector = search_vector(task)
+        batch.append(task)
+        if len(batch) == BATCH_SIZE:
+            Task.objects.bulk_update(batch, ["search_vector"])
+            batch = []
+    Task.objects.bulk_update(batch, ["search_vector"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        ('tasks', '0002_task_dependencies_task_is_milestone_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='task_search_vector_idx'),
+        ),
+        migrations.RunPython(
+            populate_search_vectors, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.3 on 2026-10-18 08:46
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 인덱스를 만드는 동안 쓰기가 막히지 않도록 CREATE INDEX CONCURRENTLY
+    # (트랜잭션 안에서 실행할 수 없음)
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0003_task_search_vector'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['department', 'status'], name='task_dept_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['start_date', 'id'], name='task_start_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'DONE'), _negated=True), fields=['due_date'], name='task_open_due_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='taskhistory',
+            index=models.Index(fields=['task', '-created_at'], name='history_task_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='taskhistory',
+            index=models.Index(fields=['-created_at', '-id'], name='history_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='tasktimelog',
+            index=models.Index(fields=['task', '-start_time'], name='timelog_task_start_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:07
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import tasks.models
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 인덱스를 만드는 동안 쓰기가 막히지 않도록 CREATE INDEX CONCURRENTLY
+    # (트랜잭션 안에서 실행할 수 없음)
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0004_query_pattern_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=django.contrib.postgres.indexes.GistIndex(tasks.models.TsTzRange(django.db.models.functions.comparison.Least('start_date', 'due_date'), django.db.models.functions.comparison.Greatest('start_date', 'due_date'), models.Value('[]')), name='task_period_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['updated_at'], name='task_updated_idx'),
+        ),
+    ]
@@ -1,10 +1,105 @@
+from datetime import datetime, time
+
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.db.models.functions import Greatest, Least
 from django.utils import timezone
 
 # Create your models here.
 
 
+def delayed_condition(now=None):
+    """지연 작업 조건: 완료되지 않았고 마감일이 지남 (Task.is_delayed와 동일)
+
+    집계 필터에 사용할 수 있다. 예) Count("pk", filter=delayed_condition())
+    """
+    return ~models.Q(status="DONE") & models.Q(
+        due_date__lt=now or timezone.now()
+    )
+
+
+def day_start(date):
+    """날짜의 시작 시각 (현재 시간대 기준)
+
+    field__date 비교는 컬럼에 함수를 씌워 인덱스를 쓰지 못하므로
+    field__gte=day_start(date) 처럼 범위 비교에 사용한다.
+    """
+    return timezone.make_aware(datetime.combine(date, time.min))
+
+
+class TsTzRange(models.Func):
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
+
+
+def task_period():
+    """작업 기간 [시작일, 마감일] 범위 식 (GiST 인덱스 task_period_idx와 동일)
+
+    마감일이 시작일보다 앞선 잘못된 데이터도 범위 오류가 나지 않도록
+    LEAST/GREATEST로 경계를 정한다.
+    """
+    return TsTzRange(
+        Least("start_date", "due_date"),
+        Greatest("start_date", "due_date"),
+        models.Value("[]"),
+    )
+
+
+class TaskQuerySet(models.QuerySet):
+    def with_delay(self, now=None):
+        """지연 여부(delayed)를 DB에서 계산해 주석으로 추가"""
+        if "delayed" in self.query.annotations:
+            return self
+        return self.annotate(
+            delayed=models.Case(
+                models.When(delayed_condition(now), then=models.Value(True)),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            )
+        )
+
+    def delayed(self, now=None):
+        """지연된 작업만 조회"""
+        return self.with_delay(now).filter(delayed=True)
+
+    def overlapping(self, start, end):
+        """기간 [start, end]와 겹치는 작업 (start_date <= end AND due_date >= start)
+
+        두 컬럼의 범위 조건 대신 기간 범위 식의 && 연산으로 조회해
+        GiST 인덱스(task_period_idx) 하나로 처리한다.
+        """
+        return self.alias(period=task_period()).filter(
+            period__overlap=DateTimeTZRange(start, end, "[]")
+        )
+
+    def for_list(self):
+        """목록 직렬화용 (TaskListSerializer): 코멘트 본문 대신 개수만 계산"""
+        return (
+            self.select_related("department", "assignee", "reporter")
+            .with_delay()
+            .annotate(comment_count=models.Count("comments", distinct=True))
+        )
+
+    def with_comments(self):
+        """코멘트와 작성자를 미리 조회"""
+        return self.prefetch_related(
+            models.Prefetch(
+                "comments",
+                queryset=TaskComment.objects.select_related("author"),
+            )
+        )
+
+    def for_detail(self):
+        """상세 직렬화용 (TaskSerializer): 코멘트와 작성자를 미리 조회"""
+        return self.select_related(
+            "department", "assignee", "reporter"
+        ).with_comments()
+
+
 class Task(models.Model):
     STATUS_CHOICES = [
         ("TODO", "예정"),
@@ -106,12 +201,37 @@ class Task(models.Model):
         verbose_name="선행 작업",
     )
 
+    # 검색용 (제목/담당자 이름/설명, tasks.search에서 저장 시 갱신)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         verbose_name = "작업"
         verbose_name_plural = "작업들"
         # 시간 충돌 체크를 위한 인덱스 추가
         indexes = [
             models.Index(fields=["assignee", "start_date", "due_date"]),
+            GinIndex(fields=["search_vector"], name="task_search_vector_idx"),
+            # 부서 범위(department_id IN ...) + 상태 필터
+            models.Index(
+                fields=["department", "status"], name="task_dept_status_idx"
+            ),
+            # 목록 기본 정렬/커서 페이지네이션 (start_date, id)
+            models.Index(
+                fields=["start_date", "id"], name="task_start_id_idx"
+            ),
+            # 미완료 작업의 마감일 조회 (지연/오늘/마감 임박 작업)
+            # status <> 'DONE' 조건은 status IN ('TODO', ...) 조회에도 쓰인다
+            models.Index(
+                fields=["due_date"],
+                condition=~models.Q(status="DONE"),
+                name="task_open_due_idx",
+            ),
+            # 캘린더 기간 겹침 조회 (TaskQuerySet.overlapping)
+            GistIndex(task_period(), name="task_period_idx"),
+            # 캘린더 증분 동기화 (updated_at > 동기화 토큰 시각)
+            models.Index(fields=["updated_at"], name="task_updated_idx"),
         ]
 
     def __str__(self):
@@ -119,6 +239,9 @@ class Task(models.Model):
 
     @property
     def is_delayed(self):
+        # with_delay()로 조회한 경우 DB에서 계산된 값 사용
+        if "delayed" in self.__dict__:
+            return self.delayed
         if self.due_date and self.status != "DONE":
             return timezone.now() > self.due_date
         return False
@@ -202,6 +325,15 @@ class TaskHistory(models.Model):
     class Meta:
         verbose_name = "작업 히스토리"
         verbose_name_plural = "작업 히스토리들"
+        indexes = [
+            # 작업별 이력 / 전체 이력 최신순 (커서 페이지네이션)
+            models.Index(
+                fields=["task", "-created_at"], name="history_task_created_idx"
+            ),
+            models.Index(
+                fields=["-created_at", "-id"], name="history_created_idx"
+            ),
+        ]
 
 
 class TaskTimeLog(models.Model):
@@ -227,6 +359,11 @@ class TaskTimeLog(models.Model):
     class Meta:
         verbose_name = "작업 시간 로그"
         verbose_name_plural = "작업 시간 로그들"
+        indexes = [
+            models.Index(
+                fields=["task", "-start_time"], name="timelog_task_start_idx"
+            ),
+        ]
 
 
 class TaskEvaluation(models.Model):
@@ -0,0 +1,240 @@
+"""작업 전문 검색
+
+제목(A), 담당자 이름(B), 설명(C)을 가중치를 둔 tsvector(Task.search_vector,
+GIN 인덱스)로 저장하고, ?search= 검색어를 tsquery로 변환해 조회한다.
+
+PostgreSQL 'simple' 설정은 한국어 형태소를 나누지 못하므로 한글 단어는
+2글자 단위(bigram)로도 색인한다. 검색어의 한글도 bigram으로 나눠
+"작업관리"의 "관리" 처럼 단어 중간 부분도 찾을 수 있다.
+영문/숫자는 접두어 검색(dev → development)을 지원한다.
+"""
+
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db.models import F, FloatField, TextField, Value
+from django.db.models.functions import Cast
+from django.utils.html import escape
+
+SEARCH_CONFIG = "simple"
+
+# 한글과 그 외 문자(영문/숫자)를 별도 토큰으로 분리
+TOKEN_RE = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+HANGUL_RE = re.compile(r"[가-힣]+")
+
+# 저장 시 검색 벡터를 다시 계산해야 하는 작업/사용자 필드
+SEARCH_FIELDS = {"title", "description", "assignee", "assignee_id"}
+NAME_FIELDS = {"last_name", "first_name"}
+TASK_VALUE_FIELDS = {"title", "description", "assignee_id"}
+
+# 검색 벡터 일괄 갱신 시 한 번에 저장하는 작업 수
+SEARCH_BATCH_SIZE = 500
+
+# 하이라이트 요약 길이 (일치 위치 앞뒤 글자 수)
+SNIPPET_RADIUS = 40
+
+
+def tokenize(text):
+    return [token.lower() for token in TOKEN_RE.findall(text or "")]
+
+
+def bigrams(word):
+    return [word[i : i + 2] for i in range(len(word) - 1)]
+
+
+def search_document(text):
+    """색인용 문서: 토큰 + 3글자 이상 한글 단어의 bigram"""
+    tokens = tokenize(text)
+    grams = [
+        gram
+        for token in tokens
+        if HANGUL_RE.fullmatch(token) and len(token) > 2
+        for gram in bigrams(token)
+    ]
+    return " ".join(tokens + grams)
+
+
+def search_vector(title, assignee_name, description):
+    """제목/담당자 이름/설명으로 만든 가중치 tsvector 식"""
+    parts = [(title, "A"), (assignee_name, "B"), (description, "C")]
+    vector = None
+    for text, weight in parts:
+        part = SearchVector(
+            Value(search_document(text), output_field=TextField()),
+            config=SEARCH_CONFIG,
+            weight=weight,
+        )
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def search_terms(text):
+    """검색어의 토큰 목록 (하이라이트용)"""
+    return list(dict.fromkeys(tokenize(text)))
+
+
+def build_search_query(text):
+    """검색어 -> tsquery (모든 토큰 AND)
+
+    - 한글 1글자: 접두어 일치
+    - 한글 2글자 이상: bigram 모두 일치
+    - 영문/숫자: 접두어 일치
+    """
+    lexemes = []
+    for token in search_terms(text):
+        if HANGUL_RE.fullmatch(token) and len(token) > 1:
+            lexemes.extend(bigrams(token))
+        else:
+            lexemes.append(f"{token}:*")
+    if not lexemes:
+        return None
+    # 토큰은 단어 문자만 포함하므로 tsquery 문법 문자가 섞이지 않는다
+    raw = " & ".join(dict.fromkeys(lexemes))
+    return SearchQuery(raw, search_type="raw", config=SEARCH_CONFIG)
+
+
+def search_tasks(queryset, text):
+    """검색어와 일치하는 작업과 관련도(search_rank)"""
+    query = build_search_query(text)
+    if query is None:
+        # 검색할 단어가 없음 (정렬 기준 주석은 유지)
+        return queryset.annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        ).none()
+    return queryset.filter(search_vector=query).annotate(
+        # real -> double precision (커서 페이지네이션에서 값 비교가 정확하도록)
+        search_rank=Cast(
+            SearchRank(F("search_vector"), query), output_field=FloatField()
+        )
+    )
+
+
+def highlight(text, terms, snippet=False):
+    """검색어 위치를 <mark>로 감싼 HTML (snippet이면 첫 일치 주변만)"""
+    if not text or not terms:
+        return escape(text or "")
+
+    pattern = re.compile(
+        "|".join(
+            re.escape(term) for term in sorted(terms, key=len, reverse=True)
+        ),
+        re.IGNORECASE,
+    )
+    if snippet:
+        match = pattern.search(text)
+        start = max((match.start() if match else 0) - SNIPPET_RADIUS, 0)
+        end = start + SNIPPET_RADIUS * 2 + (
+            len(match.group()) if match else 0
+        )
+        text = (
+            ("…" if start else "")
+            + text[start:end]
+            + ("…" if end < len(text) else "")
+        )
+
+    result = []
+    position = 0
+    for match in pattern.finditer(text):
+        result.append(escape(text[position : match.start()]))
+        result.append(f"<mark>{escape(match.group())}</mark>")
+        position = match.end()
+    result.append(escape(text[position:]))
+    return "".join(result)
+
+
+def full_name(user):
+    if user is None:
+        return ""
+    return f"{user.last_name}{user.first_name}"
+
+
+def save_search_vector(task):
+    type(task).objects.filter(pk=task.pk).update(
+        search_vector=search_vector(
+            task.title, full_name(task.assignee), task.description
+        )
+    )
+
+
+def update_search_vectors(tasks, batch_size=SEARCH_BATCH_SIZE):
+    """작업들의 검색 벡터 갱신 (담당자 이름 포함)
+
+    batch_size건씩 읽어 한 번의 UPDATE(bulk_update)로 저장한다.
+    """
+    queryset = tasks.select_related("assignee").only(
+        "id",
+        "title",
+        "description",
+        "assignee__last_name",
+        "assignee__first_name",
+    )
+    count = 0
+    batch = []
+    for task in queryset.iterator(chunk_size=batch_size):
+        task.search_vector = search_vector(
+            task.title, full_name(task.assignee), task.description
+        )
+        batch.append(task)
+        if len(batch) == batch_size:
+            count += save_search_vectors(batch)
+            batch = []
+    return count + save_search_vectors(batch)
+
+
+def save_search_vectors(tasks):
+    if tasks:
+        type(tasks[0]).objects.bulk_update(tasks, ["search_vector"])
+    return len(tasks)
+
+
+def search_values(task):
+    return (task.title, task.description, task.assignee_id)
+
+
+def update_task_search_vector(
+    sender, instance, created=False, update_fields=None, **kwargs
+):
+    """작업 저장 시 검색 벡터 갱신 (검색 대상 필드가 바뀐 경우)"""
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    # 로드 시점과 제목/설명/담당자가 같으면 UPDATE 생략
+    values = search_values(instance)
+    if not created and getattr(instance, "_search_values", None) == values:
+        return
+    save_search_vector(instance)
+    instance._search_values = values
+    # 메모리의 이전 벡터 값이 다음 save()에서 다시 저장되지 않도록 지연 필드로
+    instance.__dict__.pop("search_vector", None)
+
+
+def update_assignee_search_vectors(
+    sender, instance, update_fields=None, **kwargs
+):
+    """사용자 이름 변경 시 담당 작업의 검색 벡터 갱신"""
+    if update_fields is not None and not NAME_FIELDS & set(update_fields):
+        return
+    if getattr(instance, "_search_name", None) == full_name(instance):
+        return
+    instance._search_name = full_name(instance)
+
+    from .models import Task
+
+    update_search_vectors(Task.objects.filter(assignee=instance))
+
+
+def remember_search_values(sender, instance, **kwargs):
+    """검색 대상 필드 변경 여부를 알 수 있도록 로드 시점 값 기록"""
+    # 일부 컬럼만 조회한(only/defer) 경우에는 기록하지 않음 (항상 갱신)
+    if TASK_VALUE_FIELDS <= instance.__dict__.keys():
+        instance._search_values = search_values(instance)
+
+
+def remember_search_name(sender, instance, **kwargs):
+    """이름 변경 여부를 알 수 있도록 로드 시점 이름 기록"""
+    # 이름 컬럼을 조회하지 않은(only/defer) 경우에는 추가 쿼리 없이 건너뜀
+    if NAME_FIELDS <= instance.__dict__.keys():
+        instance._search_name = full_name(instance)
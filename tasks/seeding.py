@@ -0,0 +1,478 @@
+"""조직/작업 합성 데이터 생성
+
+본부 → 팀 → 구성원 → 작업(선행 작업/코멘트/이력/시간 기록/평가/알림)
+순서로 bulk_create하며, 같은 seed와 옵션이면 항상 같은 데이터가 만들어진다.
+생성/수정 시각도 실행 시각이 아닌 기준일 기준으로 작업 기간에 걸쳐
+나눠 기록한다.
+작업은 batch_size 단위로 만들고 바로 저장하므로 수백만 건도 메모리에
+모두 올리지 않는다. (manage.py seed_org)
+
+성능 테스트와 벤치마크용이며 운영 DB에서는 사용하지 않는다.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from notifications.models import Notification
+from organizations.models import Department
+from organizations.scope import invalidate_department_tree
+from reports.cache import bump_department_versions
+from .models import (
+    Task,
+    TaskComment,
+    TaskEvaluation,
+    TaskHistory,
+    TaskTimeLog,
+    day_start,
+)
+from .search import full_name, search_vector
+
+User = get_user_model()
+
+SEED_PASSWORD = "seedpass123"
+
+# 생성하는 모델 (생성 후 통계 갱신 대상)
+SEEDED_MODELS = [
+    Department,
+    User,
+    Task,
+    Task.dependencies.through,
+    TaskComment,
+    TaskHistory,
+    TaskTimeLog,
+    TaskEvaluation,
+    Notification,
+]
+
+# 구성원 직급 분포 (팀장/본부장 제외)
+MEMBER_RANKS = [
+    ("STAFF", 40),
+    ("SENIOR", 25),
+    ("ASSISTANT_MANAGER", 20),
+    ("MANAGER", 10),
+    ("DEPUTY_GENERAL_MANAGER", 5),
+]
+STATUSES = [
+    ("TODO", 20),
+    ("IN_PROGRESS", 30),
+    ("REVIEW", 10),
+    ("DONE", 35),
+    ("HOLD", 5),
+]
+PRIORITIES = [("URGENT", 10), ("HIGH", 25), ("MEDIUM", 45), ("LOW", 20)]
+DIFFICULTIES = [("EASY", 25), ("MEDIUM", 45), ("HARD", 22), ("VERY_HARD", 8)]
+TASK_TOPICS = [
+    "배포 자동화",
+    "고객 요청 대응",
+    "주간 보고서 작성",
+    "API 성능 개선",
+    "신규 기능 설계",
+    "데이터 마이그레이션",
+    "보안 점검",
+    "장애 회고",
+    "문서 정리",
+    "코드 리뷰",
+]
+LAST_NAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+FIRST_NAMES = [
+    "민준",
+    "서연",
+    "도윤",
+    "지우",
+    "하준",
+    "서윤",
+    "시우",
+    "하은",
+    "지호",
+    "수아",
+]
+
+
+# 상태별 전환 이력 (TODO → ... → 현재 상태)
+TRANSITIONS = {
+    "IN_PROGRESS": ["TODO", "IN_PROGRESS"],
+    "REVIEW": ["TODO", "IN_PROGRESS", "REVIEW"],
+    "DONE": ["TODO", "IN_PROGRESS", "REVIEW", "DONE"],
+    "HOLD": ["TODO", "IN_PROGRESS", "HOLD"],
+}
+
+# 같은 팀의 앞선 작업을 선행 작업으로 지정하는 비율과 최대 개수
+DEPENDENCY_RATE = 0.3
+MAX_DEPENDENCIES = 2
+
+
+@dataclass
+class SeedOptions:
+    headquarters: int = 3
+    teams_per_headquarters: int = 4
+    members_per_team: int = 10
+    tasks_per_member: int = 5
+    comments_per_task: int = 2
+    time_logs_per_task: int = 3
+    seed: int = 0
+    # 사용자명/사번/부서코드 접두어 (기존 데이터와 겹치지 않도록)
+    prefix: str = "S"
+    batch_size: int = 2000
+    # 작업 일정의 기준일 (기본: 오늘)
+    base_date: date = None
+
+    @classmethod
+    def for_scale(cls, scale, **kwargs):
+        """규모 배율에 맞춘 옵션
+
+        scale=1이면 본부 10 × 팀 10 × 팀원 100 = 사용자 약 10,000명,
+        작업 200만 건. 본부 수와 팀원 수를 sqrt(scale)배로 조정한다.
+        """
+        factor = scale**0.5
+        options = {
+            "headquarters": max(1, round(10 * factor)),
+            "teams_per_headquarters": 10,
+            "members_per_team": max(1, round(100 * factor)),
+            "tasks_per_member": 200,
+        }
+        options.update(kwargs)
+        return cls(**options)
+
+    @property
+    def user_count(self):
+        teams = self.headquarters * self.teams_per_headquarters
+        # 관리자 1 + 본부장 + 팀장 + 팀원
+        return 1 + self.headquarters + teams * (1 + self.members_per_team)
+
+    @property
+    def task_count(self):
+        teams = self.headquarters * self.teams_per_headquarters
+        return teams * self.members_per_team * self.tasks_per_member
+
+
+def weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+class OrganizationSeeder:
+    """SeedOptions에 따라 조직과 작업 데이터를 생성"""
+
+    def __init__(self, options=None, progress=None):
+        self.options = options or SeedOptions()
+        self.rng = random.Random(self.options.seed)
+        # 기준일 09:00 (같은 기준일이면 날짜도 항상 같다)
+        self.now = day_start(
+            self.options.base_date or timezone.localdate()
+        ) + timedelta(hours=9)
+        self.password = make_password(SEED_PASSWORD)
+        # progress(모델 이름, 누적 생성 수): 진행 상황 출력용
+        self.progress = progress
+        self.user_count = 0
+        self.counts = {}
+
+    def run(self):
+        self.create_departments()
+        self.create_users()
+        for batch in self.task_batches():
+            self.create_task_batch(batch)
+        # bulk_create는 시그널을 보내지 않으므로 보고서 캐시를 직접 무효화
+        bump_department_versions([team.pk for team in self.teams])
+        return self.counts
+
+    def bulk_create(self, model, objects):
+        created = model.objects.bulk_create(
+            objects, batch_size=self.options.batch_size
+        )
+        self.restore_timestamps(model, created)
+        label = model._meta.model_name
+        self.counts[label] = self.counts.get(label, 0) + len(created)
+        if self.progress is not None:
+            self.progress(label, self.counts[label])
+        return created
+
+    def restore_timestamps(self, model, objects):
+        """생성 시 정한 시각(seed_times)으로 자동 시각 필드를 다시 기록
+
+        auto_now/auto_now_add 필드는 저장할 때 실행 시각으로 바뀌므로
+        생성 후 bulk_update로 되돌린다. (bulk_update는 값을 바꾸지 않음)
+        """
+        stamped = [obj for obj in objects if hasattr(obj, "seed_times")]
+        if not stamped:
+            return
+        for obj in stamped:
+            for field, value in obj.seed_times.items():
+                setattr(obj, field, value)
+        model.objects.bulk_update(
+            stamped,
+            list(stamped[0].seed_times),
+            batch_size=self.options.batch_size,
+        )
+
+    def between(self, start, end):
+        """start와 end 사이의 임의 시각 (분 단위)"""
+        minutes = max(0, int((end - start).total_seconds() // 60))
+        return start + timedelta(minutes=self.rng.randint(0, minutes))
+
+    def create_departments(self):
+        prefix = self.options.prefix
+        self.headquarters = self.bulk_create(
+            Department,
+            [
+                Department(name=f"{index}본부", code=f"{prefix}H{index:03d}")
+                for index in range(1, self.options.headquarters + 1)
+            ],
+        )
+        self.teams = self.bulk_create(
+            Department,
+            [
+                Department(
+                    name=f"{hq_index}본부 {index}팀",
+                    code=f"{prefix}T{hq_index:03d}{index:02d}",
+                    parent=headquarters,
+                )
+                for hq_index, headquarters in enumerate(
+                    self.headquarters, start=1
+                )
+                for index in range(
+                    1, self.options.teams_per_headquarters + 1
+                )
+            ],
+        )
+        # bulk_create는 시그널을 보내지 않으므로 부서 트리를 직접 무효화
+        invalidate_department_tree()
+
+    def new_user(self, department, role="EMPLOYEE", rank="STAFF"):
+        self.user_count += 1
+        number = self.user_count
+        prefix = self.options.prefix
+        return User(
+            username=f"{prefix.lower()}user{number}",
+            password=self.password,
+            email=f"{prefix.lower()}user{number}@example.com",
+            employee_id=f"{prefix}{number:07d}",
+            last_name=self.rng.choice(LAST_NAMES),
+            first_name=self.rng.choice(FIRST_NAMES),
+            department=department,
+            role=role,
+            rank=rank,
+        )
+
+    def create_users(self):
+        users = [self.new_user(self.headquarters[0], role="ADMIN")]
+        for headquarters in self.headquarters:
+            users.append(
+                self.new_user(headquarters, "MANAGER", "GENERAL_MANAGER")
+            )
+        for team in self.teams:
+            users.append(self.new_user(team, "MANAGER", "MANAGER"))
+            for _ in range(self.options.members_per_team):
+                users.append(
+                    self.new_user(team, rank=weighted(self.rng, MEMBER_RANKS))
+                )
+        users = self.bulk_create(User, users)
+
+        self.admin = users[0]
+        self.directors = [
+            user for user in users if user.rank == "GENERAL_MANAGER"
+        ]
+        self.managers = {}
+        self.members = {}
+        for user in users:
+            if user.role == "MANAGER" and user.rank == "MANAGER":
+                self.managers[user.department_id] = user
+            elif user.role == "EMPLOYEE":
+                self.members.setdefault(user.department_id, []).append(user)
+
+    def new_task(self, team, assignee):
+        status = weighted(self.rng, STATUSES)
+        start_date = self.now + timedelta(
+            days=self.rng.randint(-60, 30), hours=self.rng.randint(0, 8)
+        )
+        due_date = start_date + timedelta(days=self.rng.randint(1, 14))
+        estimated_hours = self.rng.choice([2, 4, 8, 16, 24, 40])
+        done = status == "DONE"
+        title = f"{self.rng.choice(TASK_TOPICS)} #{self.rng.randint(1, 9999)}"
+        description = f"{team.name} {full_name(assignee)} 담당 작업"
+
+        # 시작일(기준 시각 이후 시작이면 기준 시각) 전 일주일 사이에 생성
+        created_before = min(start_date, self.now)
+        created_at = self.between(
+            created_before - timedelta(days=7), created_before
+        )
+        completed_at = None
+        if done:
+            # 마감일 전후 3일 (시작일보다 앞서지 않도록)
+            completed_at = max(
+                due_date + timedelta(days=self.rng.randint(-3, 3)),
+                start_date + timedelta(hours=1),
+            )
+            updated_at = min(completed_at, self.now)
+        else:
+            updated_at = self.between(created_at, self.now)
+
+        task = Task(
+            title=title,
+            description=description,
+            status=status,
+            priority=weighted(self.rng, PRIORITIES),
+            difficulty=weighted(self.rng, DIFFICULTIES),
+            assignee=assignee,
+            reporter=self.managers[team.pk],
+            department=team,
+            start_date=start_date,
+            due_date=due_date,
+            completed_at=completed_at,
+            estimated_hours=estimated_hours,
+            actual_hours=(
+                round(estimated_hours * self.rng.uniform(0.6, 1.6), 1)
+                if done
+                else None
+            ),
+            # bulk_create는 시그널을 보내지 않으므로 검색 벡터를 직접 채운다
+            search_vector=search_vector(
+                title, full_name(assignee), description
+            ),
+        )
+        task.seed_times = {"created_at": created_at, "updated_at": updated_at}
+        return task
+
+    def task_batches(self):
+        """batch_size 단위의 (팀, 담당자) 목록 (팀 순서대로)"""
+        batch = []
+        for team in self.teams:
+            for member in self.members.get(team.pk, []):
+                for _ in range(self.options.tasks_per_member):
+                    batch.append((team, member))
+                    if len(batch) >= self.options.batch_size:
+                        yield batch
+                        batch = []
+        if batch:
+            yield batch
+
+    def create_task_batch(self, batch):
+        """작업 한 묶음과 관련 데이터 생성 (묶음이 끝나면 객체를 버린다)"""
+        tasks = self.bulk_create(
+            Task, [self.new_task(team, member) for team, member in batch]
+        )
+        self.create_dependencies(tasks)
+
+        comments = []
+        history = []
+        time_logs = []
+        evaluations = []
+        notifications = []
+        for task in tasks:
+            manager = self.managers[task.department_id]
+            comments.extend(self.new_comments(task, manager))
+            history.extend(self.new_history(task))
+            time_logs.extend(self.new_time_logs(task))
+            notification = Notification(
+                recipient=task.assignee,
+                notification_type="TASK_ASSIGNED",
+                task=task,
+                message=f"새 작업이 배정되었습니다: {task.title}",
+                is_read=self.rng.random() < 0.7,
+            )
+            # 배정 알림은 작업 생성 시각
+            notification.seed_times = {"created_at": task.created_at}
+            notifications.append(notification)
+            if task.status == "DONE":
+                evaluations.append(self.new_evaluation(task, manager))
+
+        self.bulk_create(TaskComment, comments)
+        self.bulk_create(TaskHistory, history)
+        self.bulk_create(TaskTimeLog, time_logs)
+        self.bulk_create(TaskEvaluation, evaluations)
+        self.bulk_create(Notification, notifications)
+
+    def create_dependencies(self, tasks):
+        """같은 묶음/같은 팀의 앞선 작업을 선행 작업으로 지정"""
+        Dependency = Task.dependencies.through
+        links = []
+        previous = {}
+        for task in tasks:
+            candidates = previous.setdefault(task.department_id, [])
+            if candidates and self.rng.random() < DEPENDENCY_RATE:
+                count = self.rng.randint(
+                    1, min(MAX_DEPENDENCIES, len(candidates))
+                )
+                for dependency in self.rng.sample(candidates[-20:], count):
+                    links.append(
+                        Dependency(from_task=task, to_task=dependency)
+                    )
+            candidates.append(task)
+        self.bulk_create(Dependency, links)
+
+    def new_evaluation(self, task, manager):
+        """완료 후 사흘 안에 작성한 평가"""
+        evaluation = TaskEvaluation(
+            task=task,
+            evaluator=manager,
+            difficulty=task.difficulty,
+            performance_score=self.rng.randint(1, 5),
+            feedback="수고하셨습니다.",
+        )
+        evaluation.seed_times = {
+            "created_at": min(
+                task.updated_at + timedelta(hours=self.rng.randint(1, 72)),
+                self.now,
+            )
+        }
+        return evaluation
+
+    def new_comments(self, task, manager):
+        """작업 생성부터 마지막 수정 사이에 남긴 코멘트"""
+        for index in range(
+            self.rng.randint(0, self.options.comments_per_task)
+        ):
+            comment = TaskComment(
+                task=task,
+                author=(task.assignee, manager)[index % 2],
+                content="진행 상황 공유드립니다.",
+            )
+            created_at = self.between(task.created_at, task.updated_at)
+            comment.seed_times = {
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+            yield comment
+
+    def new_history(self, task):
+        """상태 전환 이력 (작업 생성부터 마지막 수정까지 고르게 나눔)"""
+        transitions = TRANSITIONS.get(task.status, [])
+        steps = list(zip(transitions, transitions[1:]))
+        span = task.updated_at - task.created_at
+        for index, (previous, new) in enumerate(steps, start=1):
+            history = TaskHistory(
+                task=task,
+                changed_by=task.assignee,
+                previous_status=previous,
+                new_status=new,
+            )
+            history.seed_times = {
+                "created_at": task.created_at + span * index / len(steps)
+            }
+            yield history
+
+    def new_time_logs(self, task):
+        """진행한 적 있는 작업의 작업 시간 기록 (시작일 이후 하루 1건)"""
+        if task.status == "TODO":
+            return
+        for index in range(
+            self.rng.randint(1, self.options.time_logs_per_task)
+        ):
+            start_time = task.start_date + timedelta(days=index)
+            duration = timedelta(minutes=30 * self.rng.randint(1, 12))
+            yield TaskTimeLog(
+                task=task,
+                start_time=start_time,
+                end_time=start_time + duration,
+                duration=duration,
+                logged_by=task.assignee,
+            )
+
+
+def seed_organization(options=None, progress=None):
+    """합성 조직 데이터 생성 (생성된 모델별 행 수 반환)"""
+    return OrganizationSeeder(options, progress).run()
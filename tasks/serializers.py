@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from config.fieldsets import FieldsetSerializerMixin
+from .search import highlight
 from .models import (
     Task,
     TaskComment,
@@ -28,7 +30,7 @@ class TaskCommentSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "author", "created_at", "updated_at"]
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     assignee_name = serializers.CharField(
         source="assignee.username", read_only=True
     )
@@ -73,6 +75,14 @@ class TaskSerializer(serializers.ModelSerializer):
             "difficulty",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+        # 응답에 없으면 조회하지 않는 컬럼
+        # (마일스톤 설명/작업 시간/검색 벡터는 미노출)
+        deferrable_fields = [
+            "description",
+            "milestone_description",
+            "working_hours",
+            "search_vector",
+        ]
 
     def get_assignee_full_name(self, obj):
         if obj.assignee:
@@ -80,6 +90,44 @@ class TaskSerializer(serializers.ModelSerializer):
         return ""
 
 
+class TaskListSerializer(TaskSerializer):
+    """작업 목록용 직렬화 (코멘트 본문 대신 comment_count)
+
+    Task.objects.for_list()로 조회한 쿼리셋과 함께 사용하며,
+    ?expand=comments 이면 코멘트 목록도 포함한다 (comments 프리페치 필요).
+    검색 시(context["search_terms"]) 제목/설명 하이라이트를 함께 반환한다.
+    """
+
+    comment_count = serializers.IntegerField(read_only=True)
+
+    class Meta(TaskSerializer.Meta):
+        fields = [
+            field
+            for field in TaskSerializer.Meta.fields
+            if field != "comments"
+        ] + ["comment_count"]
+        expandable_fields = {
+            "comments": (
+                TaskCommentSerializer,
+                {"many": True, "read_only": True},
+            ),
+        }
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        terms = self.context.get("search_terms")
+        if terms:
+            # 응답에 포함된(조회된) 필드만 하이라이트
+            data["highlight"] = {
+                "title": highlight(instance.title, terms),
+            }
+            if "description" in self.fields:
+                data["highlight"]["description"] = highlight(
+                    instance.description, terms, snippet=True
+                )
+        return data
+
+
 class TaskAttachmentSerializer(serializers.ModelSerializer):
     uploaded_by_name = serializers.CharField(
         source="uploaded_by.username", read_only=True
@@ -139,11 +187,46 @@ class TaskTimeLogSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "duration", "logged_by"]
 
 
-class TaskEvaluationSerializer(serializers.ModelSerializer):
+class TaskSummarySerializer(serializers.ModelSerializer):
+    """다른 객체에 포함되는 작업 요약 (코멘트/설명 제외)"""
+
+    assignee_name = serializers.CharField(
+        source="assignee.username", read_only=True
+    )
+    is_delayed = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Task
+        fields = [
+            "id",
+            "title",
+            "status",
+            "priority",
+            "difficulty",
+            "assignee",
+            "assignee_name",
+            "department",
+            "start_date",
+            "due_date",
+            "completed_at",
+            "is_delayed",
+        ]
+        read_only_fields = fields
+
+
+class TaskEvaluationSerializer(
+    FieldsetSerializerMixin, serializers.ModelSerializer
+):
+    """작업 평가 직렬화
+
+    task는 기본적으로 요약(TaskSummarySerializer)으로,
+    ?expand=task 이면 전체 작업(TaskSerializer, 코멘트 포함)으로 반환한다.
+    """
+
     evaluator_name = serializers.CharField(
         source="evaluator.username", read_only=True
     )
-    task = TaskSerializer(read_only=True)
+    task = TaskSummarySerializer(read_only=True)
 
     class Meta:
         model = TaskEvaluation
@@ -158,6 +241,10 @@ class TaskEvaluationSerializer(serializers.ModelSerializer):
             "created_at",
         ]
         read_only_fields = ["id", "evaluator", "created_at"]
+        deferrable_fields = ["feedback"]
+        expandable_fields = {
+            "task": (TaskSerializer, {"read_only": True}),
+        }
 
     def create(self, validated_data):
         task_id = self.context["request"].data.get("task")
@@ -165,7 +252,9 @@ class TaskEvaluationSerializer(serializers.ModelSerializer):
         return TaskEvaluation.objects.create(task=task, **validated_data)
 
 
-class TaskCalendarSerializer(serializers.ModelSerializer):
+class TaskCalendarSerializer(
+    FieldsetSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Task
         fields = [
@@ -179,6 +268,12 @@ class TaskCalendarSerializer(serializers.ModelSerializer):
             "assignee",
             "is_delayed",
         ]
+        deferrable_fields = [
+            "description",
+            "milestone_description",
+            "working_hours",
+            "search_vector",
+        ]
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Task
+
+
+def count_tasks(queryset, **conditions):
+    """조건별 작업 수를 한 번의 조건부 집계 쿼리로 계산
+
+    조건 값이 None이면 전체 작업 수를 센다.
+    예) count_tasks(qs, total=None, done=Q(status="DONE"))
+    """
+    aggregates = {
+        name: Count("pk", filter=condition)
+        for name, condition in conditions.items()
+    }
+    return queryset.aggregate(**aggregates)
+
+
+def calculate_trend(current, previous):
+    """지난 기간 대비 증감률(%)"""
+    if previous == 0:
+        return 100 if current > 0 else 0
+    return round(((current - previous) / previous) * 100, 1)
+
+
+def task_summary(queryset, today=None):
+    """대시보드 요약 통계 (현재 수치와 지난주 대비 증감률)"""
+    today = today or timezone.now().date()
+    last_week = today - timedelta(days=7)
+
+    in_progress = Q(status="IN_PROGRESS")
+    completed = Q(status="DONE")
+    open_statuses = Q(status__in=["TODO", "IN_PROGRESS"])
+    last_week_created = Q(created_at__date__lte=last_week)
+
+    counts = count_tasks(
+        queryset,
+        total=None,
+        in_progress=in_progress,
+        completed=completed,
+        delayed=open_statuses & Q(due_date__date__lt=today),
+        last_week_total=last_week_created,
+        last_week_in_progress=last_week_created & in_progress,
+        last_week_completed=last_week_created & completed,
+        last_week_delayed=last_week_created
+        & open_statuses
+        & Q(due_date__date__lt=last_week),
+    )
+
+    return {
+        key: {
+            "count": counts[key],
+            "trend": calculate_trend(counts[key], counts[f"last_week_{key}"]),
+        }
+        for key in ["total", "in_progress", "completed", "delayed"]
+    }
+
+
+def priority_summary(queryset):
+    """우선순위별 작업 수와 비율"""
+    counts = count_tasks(
+        queryset,
+        total=None,
+        **{
+            priority: Q(priority=priority)
+            for priority, _ in Task.PRIORITY_CHOICES
+        },
+    )
+
+    total = counts["total"]
+    stats = []
+    for priority, _ in Task.PRIORITY_CHOICES:
+        count = counts[priority]
+        percentage = (count / total * 100) if total > 0 else 0
+        stats.append(
+            {
+                "priority": priority,
+                "count": count,
+                "percentage": round(percentage, 1),
+            }
+        )
+    return stats
@@ -1,10 +1,39 @@
-from django.test import TestCase
+import csv
+import json
+import threading
+import zipfile
+from datetime import datetime, timedelta
+from importlib import import_module
+from io import BytesIO, StringIO
+from xml.etree import ElementTree
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
+from django.utils import timezone
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from config.exports import xlsx_cell
+from config.versions import get_shared_cache
+from notifications.models import Notification
 from organizations.models import Department
-from .models import Task, TaskComment, TaskAttachment
+from .calendar_sync import REMOVAL_KEY
+from .dashboard import Dashboard, close_worker_connections
+from .models import (
+    Task,
+    TaskComment,
+    TaskAttachment,
+    TaskEvaluation,
+    TaskHistory,
+    TaskTimeLog,
+)
 
 User = get_user_model()
 
@@ -52,6 +81,27 @@ class TaskModelTest(TestCase):
         self.task.save()
         self.assertTrue(self.task.is_delayed)
 
+    def test_with_delay_matches_is_delayed(self):
+        Task.objects.create(
+            title="완료된 작업",
+            description="설명",
+            status="DONE",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+
+        with self.assertNumQueries(1):
+            tasks = list(Task.objects.with_delay())
+        for task in tasks:
+            self.assertEqual(task.delayed, task.status != "DONE")
+        self.assertEqual(
+            list(Task.objects.delayed().values_list("pk", flat=True)),
+            [self.task.pk],
+        )
+
 
 class TaskAPITest(APITestCase):
     def setUp(self):
@@ -88,6 +138,228 @@ class TaskAPITest(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["title"], "테스트 작업")
 
+    def test_filter_and_order_by_delay(self):
+        done = Task.objects.create(
+            title="완료된 작업",
+            description="설명",
+            status="DONE",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-19T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        url = reverse("task-list")
+
+        response = self.client.get(url, {"is_delayed": "true"})
+        self.assertEqual(
+            [task["id"] for task in response.data["results"]], [self.task.id]
+        )
+        self.assertTrue(response.data["results"][0]["is_delayed"])
+
+        response = self.client.get(url, {"ordering": "is_delayed"})
+        self.assertEqual(
+            [task["id"] for task in response.data["results"]],
+            [done.id, self.task.id],
+        )
+
+    def add_commented_task(self, index):
+        author = User.objects.create_user(
+            username=f"author{index}",
+            password="testpass123",
+            employee_id=f"AUT{index:03d}",
+        )
+        task = Task.objects.create(
+            title=f"작업 {index}",
+            description="설명",
+            assignee=self.user,
+            reporter=author,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        TaskComment.objects.create(task=task, author=author, content="1")
+        TaskComment.objects.create(task=task, author=self.user, content="2")
+
+    def test_list_query_count_constant(self):
+        url = reverse("task-list")
+        self.add_commented_task(1)
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(url)
+        with CaptureQueriesContext(connection) as small_expanded:
+            self.client.get(url, {"expand": "comments"})
+
+        for index in range(2, 8):
+            self.add_commented_task(index)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as large_expanded:
+            expanded = self.client.get(url, {"expand": "comments"})
+
+        self.assertEqual(len(large), len(small))
+        self.assertEqual(len(large_expanded), len(small_expanded))
+
+        task = next(
+            t for t in response.data["results"] if t["title"] == "작업 1"
+        )
+        self.assertNotIn("comments", task)
+        self.assertEqual(task["comment_count"], 2)
+        task = next(
+            t for t in expanded.data["results"] if t["title"] == "작업 1"
+        )
+        self.assertEqual(len(task["comments"]), 2)
+
+    def test_sparse_fieldsets(self):
+        url = reverse("task-list")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"fields": "id,title,status"})
+        task = response.data["results"][0]
+        self.assertEqual(set(task), {"id", "title", "status"})
+        # 응답에 없는 무거운 컬럼은 쿼리에서도 제외
+        select = next(
+            q["sql"] for q in queries if '"tasks_task"."title"' in q["sql"]
+        )
+        self.assertNotIn('"tasks_task"."description"', select)
+
+        response = self.client.get(url, {"omit": "description,comments"})
+        task = response.data["results"][0]
+        self.assertNotIn("description", task)
+        self.assertIn("title", task)
+
+        response = self.client.get(
+            reverse("task-detail", args=[self.task.id]),
+            {"fields": "id,description"},
+        )
+        self.assertEqual(set(response.data), {"id", "description"})
+
+        # 쓰기 요청에는 적용하지 않음 (검증/응답 모두 전체 필드)
+        response = self.client.patch(
+            reverse("task-detail", args=[self.task.id]) + "?omit=title",
+            {"title": "수정된 제목"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "수정된 제목")
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, "수정된 제목")
+
+    def test_evaluation_list_task_summary(self):
+        url = reverse("taskevaluation-list")
+
+        def evaluate_all():
+            for task in Task.objects.filter(evaluations__isnull=True):
+                TaskEvaluation.objects.create(
+                    task=task,
+                    evaluator=self.user,
+                    difficulty="MEDIUM",
+                    performance_score=4,
+                )
+
+        self.add_commented_task(1)
+        evaluate_all()
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(url)
+        with CaptureQueriesContext(connection) as small_expanded:
+            self.client.get(url, {"expand": "task"})
+
+        for index in range(2, 8):
+            self.add_commented_task(index)
+        evaluate_all()
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as large_expanded:
+            expanded = self.client.get(url, {"expand": "task"})
+
+        self.assertEqual(len(large), len(small))
+        self.assertEqual(len(large_expanded), len(small_expanded))
+
+        task = response.data["results"][0]["task"]
+        self.assertNotIn("comments", task)
+        self.assertNotIn("description", task)
+        self.assertEqual(task["assignee_name"], "testuser")
+        task = next(
+            e["task"]
+            for e in expanded.data["results"]
+            if e["task"]["title"] == "작업 1"
+        )
+        self.assertEqual(len(task["comments"]), 2)
+        self.assertEqual(task["reporter_name"], "author1")
+
+    def test_cursor_pagination(self):
+        url = reverse("task-list")
+        # 같은 시작일의 작업들도 id로 구분되어 누락/중복 없이 순회
+        for index in range(1, 8):
+            self.add_commented_task(index)
+        expected = list(
+            Task.objects.order_by("start_date", "id").values_list(
+                "id", flat=True
+            )
+        )
+
+        seen = []
+        pages = []
+        response = self.client.get(url, {"cursor": "", "page_size": 3})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            pages.append(response)
+            seen += [task["id"] for task in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+        self.assertEqual(seen, expected)
+        self.assertIsNone(pages[0].data["previous"])
+
+        # 이전 페이지 링크
+        response = self.client.get(pages[-1].data["previous"])
+        self.assertEqual(
+            [task["id"] for task in response.data["results"]],
+            expected[3:6],
+        )
+
+        response = self.client.get(url, {"cursor": "", "count": "true"})
+        self.assertEqual(response.data["count"], len(expected))
+
+        response = self.client.get(url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_count_strategies(self):
+        url = reverse("task-list")
+        cache.clear()
+
+        def count_queries(queries):
+            return sum(
+                1 for q in queries if q["sql"].startswith("SELECT COUNT(*)")
+            )
+
+        with override_settings(PAGINATION_COUNT_STRATEGY="cached"):
+            with CaptureQueriesContext(connection) as first:
+                response = self.client.get(url)
+            with CaptureQueriesContext(connection) as second:
+                self.client.get(url, {"page_size": 5})
+        self.assertEqual(count_queries(first), 1)
+        self.assertEqual(count_queries(second), 0)
+        self.assertEqual(response.data["count"], 1)
+        self.assertFalse(response.data["count_is_estimate"])
+
+        # 조건 없는 큰 테이블은 통계 추정치 사용 (관리자는 전체 조회)
+        self.user.role = "ADMIN"
+        self.user.save()
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE tasks_task")
+        with override_settings(
+            PAGINATION_COUNT_STRATEGY="auto", PAGINATION_ESTIMATE_MIN_ROWS=1
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(count_queries(queries), 0)
+            self.assertTrue(response.data["count_is_estimate"])
+
+            # 조건이 있으면 정확한 개수
+            response = self.client.get(url, {"status": "TODO"})
+            self.assertEqual(response.data["count"], 1)
+            self.assertFalse(response.data["count_is_estimate"])
+
     def test_create_task_comment(self):
         url = reverse("taskcomment-list")
         data = {
@@ -100,3 +372,880 @@ class TaskAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["content"], "테스트 코멘트")
         self.assertEqual(response.data["author"], self.user.id)
+
+    def test_stats_single_query(self):
+        url = reverse("task-stats")
+        # ETag 검증자 조회 1회 + 통계 집계 1회
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"]["count"], 1)
+        self.assertEqual(response.data["in_progress"]["count"], 0)
+        self.assertEqual(response.data["delayed"]["count"], 1)
+        self.assertEqual(response.data["total"]["trend"], 100)
+
+        # 변경이 없으면 검증자 조회만 하고 304
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                url, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_dashboard_selected_panels(self):
+        url = reverse("task-dashboard")
+        response = self.client.get(url, {"panels": "stats,priority-stats"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"stats", "priority_stats"})
+        self.assertEqual(response.data["stats"]["total"]["count"], 1)
+
+    def test_dashboard_all_panels(self):
+        url = reverse("task-dashboard")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data),
+            {
+                "stats",
+                "workload_stats",
+                "priority_stats",
+                "upcoming_deadlines",
+                "team_performance",
+                "recent",
+            },
+        )
+
+    def test_dashboard_unknown_panel(self):
+        url = reverse("task-dashboard")
+        response = self.client.get(url, {"panels": "stats,unknown"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_workload_stats_window(self):
+        from django.utils import timezone
+        from datetime import timedelta
+
+        today = timezone.now().date()
+        three_days_ago = timezone.now() - timedelta(days=3)
+        Task.objects.filter(pk=self.task.pk).update(
+            status="DONE",
+            start_date=three_days_ago,
+            completed_at=three_days_ago,
+            due_date=three_days_ago,
+        )
+        url = reverse("task-workload-stats")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"days": 30})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 30)
+        self.assertEqual(
+            response.data[-1]["date"],
+            (today - timedelta(days=1)).strftime("%Y-%m-%d"),
+        )
+        day = next(
+            row
+            for row in response.data
+            if row["date"] == three_days_ago.strftime("%Y-%m-%d")
+        )
+        self.assertEqual(day["total"], 1)
+        self.assertEqual(day["completed"], 1)
+        self.assertEqual(day["delayed"], 0)
+        self.assertEqual(sum(row["total"] for row in response.data), 1)
+
+    def test_workload_stats_invalid_days(self):
+        url = reverse("task-workload-stats")
+        response = self.client.get(url, {"days": 365})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TeamPerformanceTest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse("task-team-performance")
+
+    def add_member(self, index, done_count, score):
+        member = User.objects.create_user(
+            username=f"member{index}",
+            password="testpass123",
+            employee_id=f"EMP{index:03d}",
+            department=self.department,
+            role="EMPLOYEE",
+            rank="STAFF",
+        )
+        for i in range(2):
+            task = Task.objects.create(
+                title=f"작업 {index}-{i}",
+                description="설명",
+                status="DONE" if i < done_count else "TODO",
+                assignee=member,
+                reporter=self.manager,
+                department=self.department,
+                start_date="2024-03-20T00:00:00Z",
+                due_date="2024-03-21T00:00:00Z",
+            )
+            if task.status == "DONE":
+                TaskEvaluation.objects.create(
+                    task=task,
+                    evaluator=self.manager,
+                    difficulty="MEDIUM",
+                    performance_score=score,
+                    feedback="피드백",
+                )
+        return member
+
+    def test_query_count_independent_of_members(self):
+        first = self.add_member(1, done_count=1, score=4)
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(self.url)
+
+        for index in range(2, 8):
+            self.add_member(index, done_count=2, score=3)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(self.url)
+
+        self.assertEqual(len(small), 1)
+        self.assertEqual(len(large), len(small))
+
+        member = next(
+            m for m in response.data["members"] if m["user_id"] == first.id
+        )
+        self.assertEqual(member["task_count"], 2)
+        self.assertEqual(member["completion_rate"], 50.0)
+        self.assertEqual(member["average_score"], 4.0)
+
+    def test_ordering_and_pagination(self):
+        self.add_member(1, done_count=0, score=5)
+        best = self.add_member(2, done_count=2, score=5)
+        self.add_member(3, done_count=1, score=2)
+
+        response = self.client.get(
+            self.url, {"ordering": "-average_score", "page_size": 2}
+        )
+
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(response.data["total_pages"], 2)
+        self.assertEqual(len(response.data["members"]), 2)
+        self.assertEqual(response.data["members"][0]["user_id"], best.id)
+
+
+class WorkloadTest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse("task-workload")
+
+    def add_member(self, index):
+        member = User.objects.create_user(
+            username=f"member{index}",
+            password="testpass123",
+            employee_id=f"EMP{index:03d}",
+            department=self.department,
+            role="EMPLOYEE",
+            rank="STAFF",
+        )
+        Task.objects.create(
+            title=f"작업 {index}",
+            description="설명",
+            assignee=member,
+            reporter=self.manager,
+            department=self.department,
+            difficulty="HARD",
+            estimated_hours=4,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        return member
+
+    def test_heatmap_query_count_independent_of_users(self):
+        params = {"start_date": "2024-03-19", "end_date": "2024-03-22"}
+        first = self.add_member(1)
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(self.url, params)
+
+        for index in range(2, 8):
+            self.add_member(index)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(self.url, params)
+
+        self.assertEqual(len(large), len(small))
+        self.assertEqual(len(response.data["days"]), 4)
+        row = next(
+            r for r in response.data["results"] if r["user_id"] == first.id
+        )
+        self.assertEqual(row["tasks_count"], 1)
+        self.assertEqual(row["load"], [0, 1, 1, 0])
+
+    def test_weighted_load(self):
+        member = self.add_member(1)
+        params = {"start_date": "2024-03-20", "end_date": "2024-03-21"}
+
+        response = self.client.get(self.url, {**params, "weight": "hours"})
+        row = next(
+            r for r in response.data["results"] if r["user_id"] == member.id
+        )
+        self.assertEqual(row["load"], [2.0, 2.0])
+
+        response = self.client.get(
+            self.url, {**params, "weight": "difficulty"}
+        )
+        row = next(
+            r for r in response.data["results"] if r["user_id"] == member.id
+        )
+        self.assertEqual(row["load"], [3, 3])
+
+    def test_invalid_range(self):
+        response = self.client.get(
+            self.url, {"start_date": "2024-03-21", "end_date": "2024-03-20"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskSearchTest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="개발팀", code="DEV001"
+        )
+        self.user = User.objects.create_user(
+            username="admin",
+            password="testpass123",
+            employee_id="ADM001",
+            department=self.department,
+            role="ADMIN",
+        )
+        self.member = User.objects.create_user(
+            username="member",
+            password="testpass123",
+            employee_id="EMP001",
+            last_name="홍",
+            first_name="길동",
+            department=self.department,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def add_task(self, title, description=""):
+        return Task.objects.create(
+            title=title,
+            description=description,
+            assignee=self.member,
+            reporter=self.user,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+
+    def search(self, text):
+        response = self.client.get(reverse("task-list"), {"search": text})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["results"]
+
+    def test_search_korean_and_prefix(self):
+        self.add_task("작업관리 시스템 개선", "Deployment 자동화")
+        self.add_task("회의록 정리")
+
+        # 한글 단어 중간 부분, 영문 접두어, 담당자 이름
+        self.assertEqual(len(self.search("관리")), 1)
+        self.assertEqual(len(self.search("deploy")), 1)
+        self.assertEqual(len(self.search("홍길동")), 2)
+        self.assertEqual(len(self.search("관리 회의")), 0)
+        self.assertEqual(len(self.search("!!!")), 0)
+
+    def test_rank_and_highlight(self):
+        self.add_task("일정 검토", "배포 전 보고서 확인")
+        self.add_task("보고서 작성", "월간 보고서")
+
+        results = self.search("보고서")
+        self.assertEqual(results[0]["title"], "보고서 작성")
+        self.assertEqual(
+            results[0]["highlight"]["title"], "<mark>보고서</mark> 작성"
+        )
+        self.assertEqual(
+            results[1]["highlight"]["description"],
+            "배포 전 <mark>보고서</mark> 확인",
+        )
+
+    def test_vectors_follow_changes(self):
+        task = self.add_task("초기 제목")
+        task.title = "변경된 제목"
+        task.save()
+        self.assertEqual(len(self.search("변경")), 1)
+
+        self.member.last_name = "김"
+        self.member.save()
+        self.assertEqual(len(self.search("김길동")), 1)
+        self.assertEqual(len(self.search("홍길동")), 0)
+
+    def test_rename_updates_vectors_in_one_query(self):
+        for number in range(3):
+            self.add_task(f"작업 {number}")
+
+        self.member.last_name = "김"
+        with CaptureQueriesContext(connection) as queries:
+            self.member.save()
+        self.assertEqual(
+            len([query for query in queries if "to_tsvector" in query["sql"]]),
+            1,
+        )
+        self.assertEqual(len(self.search("김길동")), 3)
+
+    def test_migration_populates_same_vectors(self):
+        migration = import_module("tasks.migrations.0003_task_search_vector")
+        self.add_task("작업관리 시스템 개선", "Deployment 자동화")
+        expected = list(Task.objects.values_list("search_vector", flat=True))
+        Task.objects.update(search_vector=None)
+
+        migration.populate_search_vectors(apps, None)
+
+        self.assertEqual(
+            list(Task.objects.values_list("search_vector", flat=True)),
+            expected,
+        )
+
+    def test_unchanged_save_skips_vector_update(self):
+        created = self.add_task("보존 확인")
+        created.status = "IN_PROGRESS"
+        created.save()
+        self.assertEqual(len(self.search("보존")), 1)
+
+        task = Task.objects.get(pk=created.pk)
+        task.status = "DONE"
+        with CaptureQueriesContext(connection) as queries:
+            task.save()
+        self.assertFalse(
+            [query for query in queries if "to_tsvector" in query["sql"]]
+        )
+        self.assertEqual(len(self.search("보존")), 1)
+
+
+class ExplainQueriesCommandTest(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.admin = User.objects.create_user(
+            username="admin",
+            password="testpass123",
+            employee_id="ADM001",
+            department=self.department,
+            role="ADMIN",
+        )
+        Task.objects.create(
+            title="테스트 작업",
+            assignee=self.admin,
+            reporter=self.admin,
+            department=self.department,
+            start_date="2024-03-20T00:00:00Z",
+            due_date="2024-03-21T00:00:00Z",
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE tasks_task")
+
+    def test_reports_sequential_scans(self):
+        # 행이 거의 없는 테이블은 순차 스캔이 선택되므로 기준을 0으로
+        out = StringIO()
+        args = ["--endpoint", "/api/tasks/", "--min-rows", "0"]
+        call_command("explain_queries", *args, stdout=out)
+        self.assertIn("/api/tasks/ -> 200", out.getvalue())
+        self.assertIn("Seq Scan on tasks_task", out.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command("explain_queries", *args, "--fail", stdout=out)
+
+        # 기본 기준(1000행)에서는 작은 테이블을 보고하지 않음
+        out = StringIO()
+        call_command(
+            "explain_queries", "--endpoint", "/api/tasks/", stdout=out
+        )
+        self.assertIn("0 sequential scan(s) found", out.getvalue())
+
+
+class SeedOrgCommandTest(TestCase):
+    args = [
+        "--headquarters=1",
+        "--teams=2",
+        "--members=3",
+        "--tasks-per-member=4",
+        "--seed=7",
+        "--base-date=2026-01-05",
+    ]
+
+    def seed(self, prefix):
+        call_command(
+            "seed_org", *self.args, f"--prefix={prefix}", stdout=StringIO()
+        )
+        return list(
+            Task.objects.filter(department__code__startswith=prefix)
+            .order_by("id")
+            .values_list(
+                "title",
+                "status",
+                "start_date",
+                "assignee__rank",
+                "created_at",
+                "updated_at",
+                "completed_at",
+            )
+        )
+
+    def test_seed_org(self):
+        tasks = self.seed("A")
+        # 관리자 1 + 본부장 1 + 팀 2 × (팀장 1 + 팀원 3)
+        users = User.objects.filter(username__startswith="auser")
+        self.assertEqual(users.count(), 10)
+        self.assertEqual(len(tasks), 24)
+        self.assertFalse(
+            Task.objects.filter(search_vector__isnull=True).exists()
+        )
+        seeded = Task.objects.filter(department__code__startswith="A")
+        self.assertTrue(
+            seeded.filter(status="DONE", evaluations__isnull=False).exists()
+        )
+        self.assertTrue(seeded.filter(dependencies__isnull=False).exists())
+        self.assertTrue(seeded.filter(time_logs__isnull=False).exists())
+
+        # 생성/수정 시각은 실행 시각이 아닌 기준일(09:00) 이전에 나뉘어 기록
+        base = timezone.make_aware(datetime(2026, 1, 5, 9))
+        self.assertGreater(
+            seeded.values("created_at").distinct().count(), len(tasks) // 2
+        )
+        for model, lookup in [
+            (Task, "department__code__startswith"),
+            (TaskHistory, "task__department__code__startswith"),
+            (TaskComment, "task__department__code__startswith"),
+            (TaskEvaluation, "task__department__code__startswith"),
+            (Notification, "task__department__code__startswith"),
+        ]:
+            with self.subTest(model=model.__name__):
+                self.assertFalse(
+                    model.objects.filter(
+                        **{lookup: "A"}, created_at__gt=base
+                    ).exists()
+                )
+        self.assertFalse(
+            seeded.filter(updated_at__lt=F("created_at")).exists()
+        )
+        self.assertFalse(
+            seeded.filter(completed_at__lt=F("start_date")).exists()
+        )
+
+        # 같은 seed면 같은 데이터
+        self.assertEqual(self.seed("B"), tasks)
+
+        # 이미 사용한 접두어
+        with self.assertRaises(CommandError):
+            call_command(
+                "seed_org", *self.args, "--prefix=A", stdout=StringIO()
+            )
+
+
+class TaskExportTest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.employee = User.objects.create_user(
+            username="employee",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+            role="EMPLOYEE",
+        )
+        for assignee, title in [
+            (self.employee, "내 작업"),
+            (self.manager, "팀장 작업, \"따옴표\" <포함>"),
+        ]:
+            task = Task.objects.create(
+                title=title,
+                description="설명",
+                status="DONE",
+                assignee=assignee,
+                reporter=self.manager,
+                department=self.department,
+                start_date="2024-03-20T00:00:00Z",
+                due_date="2024-03-21T00:00:00Z",
+            )
+            TaskTimeLog.objects.create(
+                task=task,
+                logged_by=assignee,
+                start_time="2024-03-20T01:00:00Z",
+                end_time="2024-03-20T02:30:00Z",
+                duration=timedelta(minutes=90),
+            )
+            TaskEvaluation.objects.create(
+                task=task,
+                evaluator=self.manager,
+                difficulty="MEDIUM",
+                performance_score=4,
+                feedback="좋음",
+            )
+
+    def export(self, url_name, file_format, user, **params):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(
+            reverse(url_name), {"file_format": file_format, **params}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            f".{file_format}", response["Content-Disposition"]
+        )
+        return b"".join(response.streaming_content)
+
+    def test_csv_export_respects_scope(self):
+        body = self.export("task-export", "csv", self.manager).decode()
+        rows = list(csv.reader(StringIO(body.lstrip("\ufeff"))))
+        self.assertEqual(rows[0][:2], ["id", "title"])
+        self.assertCountEqual(
+            [row[1] for row in rows[1:]],
+            ["내 작업", "팀장 작업, \"따옴표\" <포함>"],
+        )
+
+        # 직원은 본인 작업만
+        body = self.export("task-export", "csv", self.employee).decode()
+        self.assertEqual(len(body.strip().splitlines()), 2)
+        body = self.export("tasktimelog-export", "csv", self.employee)
+        rows = list(csv.reader(StringIO(body.decode().lstrip("\ufeff"))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][rows[0].index("duration_seconds")], "5400.0")
+
+    def test_export_filters_stay_within_scope(self):
+        # 부서/담당자 필터로도 다른 사람의 작업은 내보낼 수 없음
+        for params in [
+            {"department": self.department.pk},
+            {"assignee": self.manager.pk},
+        ]:
+            body = self.export(
+                "task-export", "csv", self.employee, **params
+            ).decode()
+            rows = list(csv.reader(StringIO(body.lstrip("\ufeff"))))
+            self.assertNotIn(
+                "팀장 작업, \"따옴표\" <포함>", [row[1] for row in rows[1:]]
+            )
+
+    def test_ndjson_and_xlsx_export(self):
+        body = self.export("taskevaluation-export", "ndjson", self.manager)
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["performance_score"], 4)
+
+        body = self.export("task-export", "xlsx", self.manager)
+        with zipfile.ZipFile(BytesIO(body)) as archive:
+            self.assertIsNone(archive.testzip())
+            sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+        self.assertIn("내 작업", sheet)
+        self.assertIn('"따옴표" &lt;포함&gt;', sheet)
+
+    def test_formula_values_exported_as_text(self):
+        Task.objects.filter(title="내 작업").update(
+            title="=HYPERLINK(\"http://example.com\")"
+        )
+        body = self.export("task-export", "csv", self.employee).decode()
+        rows = list(csv.reader(StringIO(body.lstrip("\ufeff"))))
+        self.assertEqual(rows[1][1], "'=HYPERLINK(\"http://example.com\")")
+
+        # XLSX는 수식 셀이 아닌 인라인 텍스트 셀로 기록
+        body = self.export("task-export", "xlsx", self.employee)
+        with zipfile.ZipFile(BytesIO(body)) as archive:
+            sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+        self.assertIn(
+            '<c t="inlineStr"><is><t>=HYPERLINK("http://example.com")', sheet
+        )
+        self.assertNotIn("<f>", sheet)
+
+    def test_xlsx_is_valid_xml(self):
+        # 붙여넣은 제어 문자가 있어도 통합 문서가 열리도록 제거
+        Task.objects.filter(title="내 작업").update(title="제어\x0b문자\x01")
+        body = self.export("task-export", "xlsx", self.employee)
+        with zipfile.ZipFile(BytesIO(body)) as archive:
+            sheet = archive.read("xl/worksheets/sheet1.xml")
+        ElementTree.fromstring(sheet)
+        self.assertIn("제어문자", sheet.decode())
+
+        # 숫자 셀에 쓸 수 없는 값은 텍스트로
+        self.assertEqual(
+            xlsx_cell(float("nan")), '<c t="inlineStr"><is><t>nan</t></is></c>'
+        )
+        self.assertEqual(xlsx_cell(1.5), "<c><v>1.5</v></c>")
+
+    def test_invalid_file_format(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(
+            reverse("task-export"), {"file_format": "pdf"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class CalendarSyncTest(APITestCase):
+    def setUp(self):
+        get_shared_cache().clear()
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tasks = {}
+        for title, start, due in [
+            ("범위 안", "2024-03-10", "2024-03-12"),
+            ("범위 걸침", "2024-02-20", "2024-04-10"),
+            ("범위 밖", "2024-05-01", "2024-05-02"),
+        ]:
+            self.tasks[title] = Task.objects.create(
+                title=title,
+                description="설명",
+                assignee=self.user,
+                reporter=self.user,
+                department=self.department,
+                start_date=f"{start}T09:00:00Z",
+                due_date=f"{due}T09:00:00Z",
+            )
+        self.url = reverse("task-calendar")
+        self.params = {"start_date": "2024-03-01", "end_date": "2024-03-31"}
+
+    def get(self, **params):
+        response = self.client.get(self.url, {**self.params, **params})
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_overlapping_tasks(self):
+        response = self.get()
+        self.assertCountEqual(
+            [task["title"] for task in response.data],
+            ["범위 안", "범위 걸침"],
+        )
+        self.assertEqual(response["X-Sync-Full"], "true")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = Task.objects.overlapping(
+            self.tasks["범위 안"].start_date, self.tasks["범위 안"].due_date
+        ).explain()
+        self.assertIn("task_period_idx", plan)
+
+    def test_incremental_sync(self):
+        token = self.get()["X-Sync-Token"]
+        # 토큰 시각이 변경 시각보다 앞서도록 (SYNC_SKEW 이전 시각으로 기록)
+        Task.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+
+        response = self.get(sync_token=token)
+        self.assertEqual(response["X-Sync-Full"], "false")
+        self.assertEqual(response.data, [])
+
+        task = self.tasks["범위 안"]
+        task.title = "제목 변경"
+        task.save()
+        moved = self.tasks["범위 걸침"]
+        moved.start_date = moved.due_date = "2024-06-01T09:00:00Z"
+        moved.save()
+
+        response = self.get(sync_token=token)
+        self.assertEqual(response.data[0]["title"], "제목 변경")
+        self.assertEqual(response.data[1], {"id": moved.pk, "removed": True})
+        self.assertEqual(len(response.data), 2)
+
+        # 다른 기간의 토큰, 삭제 이후에는 전체 목록
+        response = self.get(sync_token=token, end_date="2024-04-30")
+        self.assertEqual(response["X-Sync-Full"], "true")
+        self.tasks["범위 밖"].delete()
+        response = self.get(sync_token=token)
+        self.assertEqual(response["X-Sync-Full"], "true")
+        self.assertEqual(len(response.data), 1)
+
+    def test_removal_marker_shared_across_processes(self):
+        token = self.get()["X-Sync-Token"]
+        Task.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+
+        # 다른 프로세스에서 삭제된 경우: shared 캐시의 표식만 바뀐다
+        get_shared_cache().set(REMOVAL_KEY, timezone.now().isoformat())
+        response = self.get(sync_token=token)
+        self.assertEqual(response["X-Sync-Full"], "true")
+
+        # 표식이 사라져도(캐시 초기화) 이전 토큰은 전체 동기화
+        token = response["X-Sync-Token"]
+        get_shared_cache().clear()
+        response = self.get(sync_token=token)
+        self.assertEqual(response["X-Sync-Full"], "true")
+
+    def test_conditional_get(self):
+        response = self.get()
+        etag = response["ETag"]
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        # 변경이 없으면 직렬화 없이 304
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.url, self.params, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(response.content)
+        # 검증자 집계 + 삭제 표식 (shared 캐시의 DB 캐시 테이블)
+        self.assertEqual(len(queries), 2)
+
+        # 기간을 벗어나는 변경도 ETag에 반영
+        moved = self.tasks["범위 걸침"]
+        moved.start_date = moved.due_date = "2024-06-01T09:00:00Z"
+        moved.save()
+        response = self.client.get(
+            self.url, self.params, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data), 1)
+
+
+class DashboardConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=self.department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        self.other = User.objects.create_user(
+            username="employee",
+            password="testpass123",
+            employee_id="EMP001",
+            department=self.department,
+            role="EMPLOYEE",
+        )
+        self.task = Task.objects.create(
+            title="작업",
+            description="설명",
+            assignee=self.user,
+            reporter=self.user,
+            department=self.department,
+            start_date=timezone.now(),
+            due_date=timezone.now() + timedelta(days=3),
+        )
+
+    def test_stats_not_modified(self):
+        for name in ["task-stats", "task-priority-stats"]:
+            url = reverse(name)
+            self.client.force_authenticate(user=self.user)
+            etag = self.client.get(url)["ETag"]
+
+            response = self.client.get(
+                url, HTTP_IF_NONE_MATCH=f'W/{etag}, "other"'
+            )
+            self.assertEqual(response.status_code, 304)
+
+            # 다른 사용자(권한 범위)는 같은 ETag로 304를 받지 않는다
+            self.client.force_authenticate(user=self.other)
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+
+            self.client.force_authenticate(user=self.user)
+            self.task.priority = "HIGH" if name == "task-stats" else "LOW"
+            self.task.save()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response["ETag"], etag)
+
+
+class DashboardThreadPoolTest(TransactionTestCase):
+    """패널 동시 실행 (작업 스레드가 커밋된 데이터를 보도록 트랜잭션 밖에서)"""
+
+    @classmethod
+    def tearDownClass(cls):
+        # 작업 스레드의 연결이 남아 있으면 테스트 DB를 지울 수 없다
+        close_worker_connections()
+        super().tearDownClass()
+
+    def setUp(self):
+        department = Department.objects.create(
+            name="테스트부서", code="TEST001"
+        )
+        self.user = User.objects.create_user(
+            username="manager",
+            password="testpass123",
+            employee_id="MGR001",
+            department=department,
+            role="MANAGER",
+            rank="MANAGER",
+        )
+        for priority in ["LOW", "HIGH"]:
+            Task.objects.create(
+                title=f"작업 {priority}",
+                description="설명",
+                assignee=self.user,
+                reporter=self.user,
+                department=department,
+                priority=priority,
+                start_date=timezone.now(),
+                due_date=timezone.now() + timedelta(days=3),
+            )
+
+    def test_panels_reuse_worker_connections(self):
+        calls = []
+
+        class RecordingDashboard(Dashboard):
+            def _run_panel(self, panel):
+                result = super()._run_panel(panel)
+                calls.append(
+                    (
+                        threading.current_thread().name,
+                        connection.connection.get_backend_pid(),
+                    )
+                )
+                return result
+
+        dashboard = RecordingDashboard(self.user)
+        expected = {
+            panel: getattr(dashboard, panel)() for panel in Dashboard.PANELS
+        }
+
+        for _ in range(3):
+            self.assertEqual(dashboard.build(), expected)
+
+        self.assertEqual(len(calls), 3 * len(Dashboard.PANELS))
+        self.assertTrue(
+            all(name.startswith("dashboard") for name, _ in calls)
+        )
+        # 요청마다 새로 연결하지 않고 작업 스레드의 연결을 계속 쓴다
+        self.assertLessEqual(
+            len({pid for _, pid in calls}), settings.DASHBOARD_MAX_WORKERS
+        )
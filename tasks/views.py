@@ -1,7 +1,8 @@
 from rest_framework import viewsets, filters
-from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import (
+    day_start,
+    delayed_condition,
     Task,
     TaskComment,
     TaskAttachment,
@@ -9,9 +10,14 @@ from .models import (
     TaskTimeLog,
     TaskEvaluation,
 )
-from organizations.models import Department
+from organizations.scope import (
+    get_subtree_ids,
+    get_visible_department_ids,
+    scope_queryset,
+)
 from .serializers import (
     TaskSerializer,
+    TaskListSerializer,
     TaskCommentSerializer,
     TaskAttachmentSerializer,
     TaskHistorySerializer,
@@ -20,87 +26,103 @@ from .serializers import (
     TaskCalendarSerializer,
 )
 from .filters import TaskFilter
+from config.conditional import conditional_response, queryset_validator
+from config.exports import ExportViewSetMixin
+from config.fieldsets import FieldsetViewSetMixin
+from config.pagination import StandardResultsSetPagination
+from .dashboard import Dashboard
+from .search import search_terms, search_tasks
+from .workload import MAX_WORKLOAD_DAYS, WEIGHTS, date_range, workload_matrix
+from .calendar_sync import (
+    decode_token,
+    encode_token,
+    mark_removal,
+    needs_full_sync,
+    new_issued_at,
+    removal_marker,
+)
 from datetime import datetime
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from notifications.models import Notification
+from notifications.stream import notify_users
 from datetime import timedelta
-from django.db.models import Q
+from django.db.models import Count, Prefetch, Q
 from django.contrib.auth import get_user_model
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Value, CharField
-from django.db.models.functions import Concat
-import math
-from django.db.models import Avg
 from rest_framework.permissions import IsAuthenticated
 from datetime import time
 
 User = get_user_model()
 
 
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = "page_size"
-    max_page_size = 100
-
-    def get_paginated_response(self, data):
-        # 전체 쿼리셋의 수를 사용
-        count = self.page.paginator.count
-        return Response(
-            {
-                "count": count,
-                "next": self.get_next_link(),
-                "previous": self.get_previous_link(),
-                "total_pages": math.ceil(count / self.page_size),
-                "current_page": self.page.number,
-                "results": data,
-            }
-        )
-
-
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(
+    ExportViewSetMixin, FieldsetViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     pagination_class = StandardResultsSetPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
-        filters.OrderingFilter,
     ]
-    filterset_fields = ["status", "priority", "assignee"]
-    ordering_fields = ["start_date", "due_date", "created_at", "priority"]
-    ordering = ["start_date"]
+    # 정렬(ordering)도 TaskFilter에서 처리 (지연 여부 정렬 포함)
+    filterset_class = TaskFilter
+    export_filename = "tasks"
+    export_fields = {
+        "id": "id",
+        "title": "title",
+        "status": "status",
+        "priority": "priority",
+        "difficulty": "difficulty",
+        "department": "department__name",
+        "assignee_employee_id": "assignee__employee_id",
+        "assignee_last_name": "assignee__last_name",
+        "assignee_first_name": "assignee__first_name",
+        "reporter_employee_id": "reporter__employee_id",
+        "start_date": "start_date",
+        "due_date": "due_date",
+        "completed_at": "completed_at",
+        "estimated_hours": "estimated_hours",
+        "actual_hours": "actual_hours",
+        "is_milestone": "is_milestone",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    }
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return TaskListSerializer
+        if self.action == "calendar":
+            return TaskCalendarSerializer
+        return TaskSerializer
 
     def get_queryset(self):
-        queryset = Task.objects.select_related("department", "assignee").all()
         user = self.request.user
 
-        # 단일 작업 조회 (retrieve)인 경우
-        if self.action == "retrieve":
-            # ADMIN은 모든 작업 접근 가능
-            if user.role == "ADMIN":
-                return queryset
+        # 목록은 코멘트 개수만(?expand=comments 시 코멘트 포함),
+        # 그 외에는 코멘트와 작성자를 미리 조회
+        # (목록/캘린더에서는 지연 여부도 DB에서 계산해 필터/정렬에 사용)
+        if self.action == "list":
+            queryset = Task.objects.for_list()
+            if "comments" in self.get_fieldset().expand:
+                queryset = queryset.with_comments()
+        elif self.action == "calendar":
+            queryset = Task.objects.with_delay()
+        elif self.action == "export":
+            # 내보내기는 필요한 컬럼만 values_list로 조회
+            queryset = Task.objects.all()
+        else:
+            queryset = Task.objects.for_detail()
 
-            # DIRECTOR/GENERAL_MANAGER는 본부 내 모든 작업 접근 가능
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                if user.department.parent is None:  # 본부장인 경우
-                    dept_ids = [user.department.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=user.department
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    return queryset.filter(department_id__in=dept_ids)
-                else:  # 팀장인 경우
-                    return queryset.filter(department=user.department)
-
-            # MANAGER는 팀 내 작업만 접근 가능
-            elif user.role == "MANAGER":
-                return queryset.filter(department=user.department)
+        # 응답에 포함되지 않는 무거운 컬럼은 조회하지 않음
+        queryset = self.prune_queryset(queryset)
 
-            # EMPLOYEE는 자신의 작업만 접근 가능
-            else:
-                return queryset.filter(assignee=user)
+        # 단일 작업 조회 (retrieve)인 경우
+        if self.action == "retrieve":
+            # ADMIN 전체, 본부장/이사 본부 전체, 팀장 팀, 직원 본인 작업
+            return scope_queryset(queryset, user)
 
         # 목록 조회 (list)인 경우
         department_id = self.request.query_params.get("department")
@@ -114,7 +136,7 @@ class TaskViewSet(viewsets.ModelViewSet):
                 return queryset
             # 팀장은 자신의 팀원의 작업만 볼 수 있음
             elif user.role == "MANAGER":
-                return queryset.filter(department=user.department)
+                return queryset.filter(department_id=user.department_id)
             # 일반 직원은 자신의 작업만 볼 수 있음
             else:
                 return queryset.filter(assignee=user)
@@ -122,60 +144,22 @@ class TaskViewSet(viewsets.ModelViewSet):
         # 부서 필터링
         if department_id:
             try:
-                department_id = int(department_id)
-                selected_dept = Department.objects.get(id=department_id)
-
-                if selected_dept.parent is None:  # 본부인 경우
-                    child_depts = Department.objects.filter(
-                        parent=department_id
-                    )
-                    dept_ids = [department_id] + list(
-                        child_depts.values_list("id", flat=True)
-                    )
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:
-                    queryset = queryset.filter(department_id=department_id)
-
-            except (Department.DoesNotExist, ValueError) as e:
-                print(f"Error: {e}")
+                # 선택한 부서와 모든 하위 부서
+                dept_ids = get_subtree_ids(int(department_id))
+            except ValueError:
+                return Task.objects.none()
+            if not dept_ids:
                 return Task.objects.none()
+            queryset = queryset.filter(department_id__in=dept_ids)
 
         # 일반적인 작업 목록 조회 (assignee_id가 없고 department_id도 없는 경우)
-        elif user.role != "ADMIN":
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                if (
-                    user.department.parent is None
-                ):  # 본부장/이사가 본부 소속인 경우
-                    dept_ids = [user.department.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=user.department
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:  # 팀 소속인 경우
-                    queryset = queryset.filter(department=user.department)
-            elif user.role == "MANAGER":
-                queryset = queryset.filter(department=user.department)
-            else:
-                queryset = queryset.filter(assignee=user)
+        else:
+            queryset = scope_queryset(queryset, user)
 
-        # 검색어 처리
+        # 검색어 처리 (제목/설명/담당자 이름 전문 검색, 관련도순 정렬)
         search = self.request.query_params.get("search", "")
         if search:
-            title_desc_search = Q(title__icontains=search) | Q(
-                description__icontains=search
-            )
-
-            queryset = queryset.annotate(
-                full_name=Concat(
-                    "assignee__last_name",
-                    "assignee__first_name",
-                    output_field=CharField(),
-                )
-            )
-
-            name_search = Q(full_name__icontains=search)
-            queryset = queryset.filter(title_desc_search | name_search)
+            queryset = search_tasks(queryset, search)
 
         # 나머지 필터링 로직
         status = self.request.query_params.get("status")
@@ -189,7 +173,8 @@ class TaskViewSet(viewsets.ModelViewSet):
         start_date = self.request.query_params.get("start_date")
         end_date = self.request.query_params.get("end_date")
 
-        if start_date and end_date:
+        # 캘린더는 기간과 겹치는 작업을 따로 조회 (calendar 참고)
+        if start_date and end_date and self.action != "calendar":
             # 날짜 문자열을 datetime 객체로 변환
             start_datetime = datetime.strptime(start_date, '%Y-%m-%d')
             end_datetime = datetime.strptime(end_date, '%Y-%m-%d')
@@ -198,63 +183,42 @@ class TaskViewSet(viewsets.ModelViewSet):
             start_datetime = timezone.make_aware(datetime.combine(start_datetime, time.min))
             end_datetime = timezone.make_aware(datetime.combine(end_datetime, time.max))
 
-            print(f"Filtering dates - Start: {start_datetime}, End: {end_datetime}")
-            print(f"Initial queryset count: {queryset.count()}")
-            
             queryset = queryset.filter(
                 start_date__range=[start_datetime, end_datetime],
                 due_date__range=[start_datetime, end_datetime]
             )
-            
-            print(f"After date filtering count: {queryset.count()}")
-            print(f"Generated SQL: {queryset.query}")
-
-        return queryset.distinct().order_by("start_date")
-
-    def list(self, request, *args, **kwargs):
-        # 1. 전체 쿼리셋 가져오기
-        queryset = self.filter_queryset(self.get_queryset())
 
-        # 2. 페이지네이션 적용 전의 전체 결과 저장
-        total_results = queryset.count()
+        ordering = ["-search_rank", "start_date"] if search else ["start_date"]
+        return queryset.distinct().order_by(*ordering)
 
-        # 3. 페이지네이션 적용
-        page = self.paginate_queryset(queryset)
+    def get_export_queryset(self):
+        # ?department= / ?assignee= 필터를 주어도 조회 범위 밖의 작업은
+        # 내보내지 않음 (목록 필터는 범위를 따로 적용하지 않는 분기가 있음)
+        return scope_queryset(super().get_export_queryset(), self.request.user)
 
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            # 4. 페이지네이션된 응답에 전체 결과 수 포함
-            return Response(
-                {
-                    "count": total_results,  # 전체 결과 수 (21)
-                    "next": self.paginator.get_next_link(),
-                    "previous": self.paginator.get_previous_link(),
-                    "total_pages": math.ceil(
-                        total_results / self.paginator.page_size
-                    ),
-                    "current_page": self.paginator.page.number,
-                    "results": serializer.data,
-                }
-            )
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
-    def paginate_queryset(self, queryset):
-        # 페이지네이션 결과 깅
-        page = super().paginate_queryset(queryset)
-        if page is not None:
-            print(f"Page size: {len(page)}")
-            print(f"Total pages: {self.paginator.page.paginator.num_pages}")
-        return page
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        search = self.request.query_params.get("search")
+        if self.action == "list" and search:
+            # 목록 응답에 검색어 하이라이트 포함
+            context["search_terms"] = search_terms(search)
+        return context
 
     def perform_update(self, serializer):
         old_instance = self.get_object()
         old_status = old_instance.status
         old_assignee = old_instance.assignee
         old_priority = old_instance.priority
+        old_department_id = old_instance.department_id
         instance = serializer.save()
 
+        # 담당자/부서가 바뀌면 이전 조회 범위의 캘린더는 전체 동기화 필요
+        if (
+            old_assignee != instance.assignee
+            or old_department_id != instance.department_id
+        ):
+            mark_removal()
+
         notifications = []
 
         # 상태 변경 알림
@@ -369,6 +333,9 @@ class TaskViewSet(viewsets.ModelViewSet):
         # 일괄 알림 생성
         if notifications:
             Notification.objects.bulk_create(notifications)
+            notify_users(
+                notification.recipient_id for notification in notifications
+            )
 
     def perform_create(self, serializer):
         task = serializer.save(reporter=self.request.user)
@@ -381,10 +348,16 @@ class TaskViewSet(viewsets.ModelViewSet):
                 task=task,
                 message=f"새로 업이 배정되었습다: {task.title}",
             )
+            notify_users([task.assignee_id])
 
     @action(detail=False, methods=["get"])
     def calendar(self, request):
-        """캘린더 뷰를 위한 작업 목록 조회"""
+        """캘린더 뷰를 위한 작업 목록 조회
+
+        start_date~end_date 기간과 겹치는 작업을 반환하고 X-Sync-Token 헤더로
+        동기화 토큰을 돌려준다. 같은 기간을 ?sync_token= 과 함께 요청하면
+        토큰 이후 변경된 작업만 반환한다. (tasks/calendar_sync.py)
+        """
         start_date = request.query_params.get("start_date")
         end_date = request.query_params.get("end_date")
         assignee = request.query_params.get("assignee")
@@ -392,30 +365,78 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         queryset = self.get_queryset()
 
-        if start_date and end_date:
-            # 시간대를 포함한 datetime으로 변환
-            start_datetime = timezone.make_aware(
-                datetime.strptime(
-                    f"{start_date} 00:00:00", "%Y-%m-%d %H:%M:%S"
-                )
-            )
-            end_datetime = timezone.make_aware(
-                datetime.strptime(f"{end_date} 23:59:59", "%Y-%m-%d %H:%M:%S")
-            )
-
-            queryset = queryset.filter(
-                Q(start_date__range=[start_datetime, end_datetime])
-                | Q(due_date__range=[start_datetime, end_datetime])
-            )
-
         # 담당자 또는 부서 기준 필터링
         if assignee:
             queryset = queryset.filter(assignee=assignee)
         elif department:
             queryset = queryset.filter(department=department)
 
-        serializer = TaskCalendarSerializer(queryset, many=True)
-        return Response(serializer.data)
+        start_datetime = end_datetime = None
+        if start_date and end_date:
+            try:
+                start_datetime = day_start(
+                    datetime.strptime(start_date, "%Y-%m-%d").date()
+                )
+                # 종료일 23:59:59.999999까지
+                end_datetime = day_start(
+                    datetime.strptime(end_date, "%Y-%m-%d").date()
+                ) + timedelta(days=1, microseconds=-1)
+            except ValueError:
+                return Response(
+                    {"detail": "날짜는 YYYY-MM-DD 형식이어야 합니다."}, status=400
+                )
+        in_range = (
+            queryset.overlapping(start_datetime, end_datetime)
+            if start_datetime
+            else queryset
+        )
+
+        # 기간 내 작업이 바뀌거나 지연 여부가 달라지거나 범위 밖으로 이동/삭제
+        # 되면 ETag가 달라진다 (sync_token도 쿼리 문자열로 ETag에 포함)
+        validator = queryset_validator(
+            in_range, delayed=Count("pk", filter=delayed_condition())
+        )
+        return conditional_response(
+            request,
+            [*validator, removal_marker()],
+            lambda: self.calendar_response(
+                queryset, in_range, start_datetime, end_datetime
+            ),
+        )
+
+    def calendar_response(
+        self, queryset, in_range, start_datetime, end_datetime
+    ):
+        """캘린더 응답 (전체 또는 sync_token 이후 변경분)"""
+        request = self.request
+        issued_at = new_issued_at()
+        since = None
+        token = request.query_params.get("sync_token")
+        if token:
+            since = decode_token(
+                token, request.user, start_datetime, end_datetime
+            )
+        full = since is None or needs_full_sync(since)
+
+        if full:
+            data = self.get_serializer(in_range, many=True).data
+        else:
+            changed = in_range.filter(updated_at__gt=since)
+            data = self.get_serializer(changed, many=True).data
+            # 변경되어 기간을 벗어난 작업
+            moved_out = (
+                queryset.filter(updated_at__gt=since)
+                .exclude(pk__in=in_range.values("pk"))
+                .values_list("pk", flat=True)
+            )
+            data += [{"id": pk, "removed": True} for pk in moved_out]
+
+        response = Response(data)
+        response["X-Sync-Token"] = encode_token(
+            request.user, start_datetime, end_datetime, issued_at
+        )
+        response["X-Sync-Full"] = "true" if full else "false"
+        return response
 
     @action(detail=True, methods=["post"])
     def update_dates(self, request, pk=None):
@@ -438,36 +459,104 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"])
     def workload(self, request):
-        """리소스 할당 상황 조회"""
-        date = request.query_params.get("date", datetime.now().date())
+        """리소스 할당 상황 조회 (사용자 x 일자 부하 히트맵)
+
+        start_date/end_date(또는 단일 date) 기간 동안 사용자별 일일 작업 부하를
+        반환한다. weight=count|hours|difficulty 로 가중치를 선택할 수 있으며
+        사용자 목록은 페이지 단위로 나뉜다.
+        """
+        today = timezone.now().date()
+        date = request.query_params.get("date")
+        start_date = request.query_params.get("start_date", date)
+        end_date = request.query_params.get("end_date", start_date)
+        weight = request.query_params.get("weight", "count")
         department_id = request.query_params.get("department")
 
-        queryset = User.objects.all()
-        if department_id:
-            queryset = queryset.filter(department_id=department_id)
-
-        workload_data = []
-        for user in queryset:
-            tasks_count = Task.objects.filter(
-                assignee=user, start_date__lte=date, due_date__gte=date
-            ).count()
-            workload_data.append(
+        try:
+            start_date = (
+                datetime.strptime(start_date, "%Y-%m-%d").date()
+                if start_date
+                else today
+            )
+            end_date = (
+                datetime.strptime(end_date, "%Y-%m-%d").date()
+                if end_date
+                else start_date
+            )
+        except ValueError:
+            return Response(
+                {"detail": "날짜는 YYYY-MM-DD 형식이어야 합니다."}, status=400
+            )
+        if not 0 <= (end_date - start_date).days < MAX_WORKLOAD_DAYS:
+            return Response(
                 {
-                    "user_id": user.id,
-                    "user_name": f"{user.first_name} {user.last_name}",
-                    "tasks_count": tasks_count,
-                }
+                    "detail": (
+                        "조회 기간은 시작일부터 최대"
+                        f" {MAX_WORKLOAD_DAYS}일까지 가능합니다."
+                    )
+                },
+                status=400,
+            )
+        if weight not in WEIGHTS:
+            return Response(
+                {"detail": f"weight는 {', '.join(WEIGHTS)} 중 하나여야 합니다."},
+                status=400,
             )
 
-        return Response(workload_data)
+        queryset = User.objects.filter(is_active=True)
+        dept_ids = get_visible_department_ids(request.user)
+        if dept_ids is not None:
+            queryset = queryset.filter(department_id__in=dept_ids)
+        if department_id:
+            try:
+                queryset = queryset.filter(
+                    department_id__in=get_subtree_ids(int(department_id))
+                )
+            except ValueError:
+                queryset = queryset.none()
+        queryset = queryset.order_by(
+            "department_id", "last_name", "first_name", "id"
+        )
+
+        page = self.paginate_queryset(queryset)
+        users = page if page is not None else list(queryset)
+        matrix = workload_matrix(
+            [user.id for user in users], start_date, end_date, weight=weight
+        )
+
+        workload_data = [
+            {
+                "user_id": user.id,
+                "user_name": f"{user.first_name} {user.last_name}",
+                "tasks_count": matrix[user.id]["tasks_count"],
+                "load": matrix[user.id]["load"],
+            }
+            for user in users
+        ]
+
+        if page is not None:
+            response = self.get_paginated_response(workload_data)
+        else:
+            response = Response({"results": workload_data})
+        response.data.update(
+            {
+                "start_date": start_date,
+                "end_date": end_date,
+                "weight": weight,
+                "days": date_range(start_date, end_date),
+            }
+        )
+        return response
 
     @action(detail=True, methods=["get"])
     def tasks_current(self, request, pk=None):
-        """사용자의 현재 진행중인 작업 목록 조회"""
-        user = self.get_object()
-        tasks = Task.objects.filter(
-            assignee=user, status="IN_PROGRESS"
-        ).order_by("-created_at")
+        """작업 담당자의 현재 진행중인 작업 목록 조회"""
+        task = self.get_object()
+        tasks = (
+            Task.objects.for_detail()
+            .filter(assignee_id=task.assignee_id, status="IN_PROGRESS")
+            .order_by("-created_at")
+        )
 
         serializer = TaskSerializer(tasks, many=True)
         return Response(serializer.data)
@@ -476,36 +565,23 @@ class TaskViewSet(viewsets.ModelViewSet):
     def today_tasks(self, request):
         """대시보드용 오늘의 작업 조회 API"""
         user = request.user
-        today = timezone.now().date()
+        today_start = day_start(timezone.now().date())
 
         # 기본 쿼리셋 (오늘이 시작일과 마감일 사이에 있는 작업)
-        queryset = Task.objects.filter(
-            start_date__date__lte=today,  # 시작일이 오늘이거나 이전
-            due_date__date__gte=today,  # 마감일이 오늘이거나 이후
+        # (__date 대신 범위 비교를 써야 인덱스를 사용할 수 있음)
+        queryset = Task.objects.for_detail().filter(
+            # 시작일이 오늘이거나 이전
+            start_date__lt=today_start + timedelta(days=1),
+            due_date__gte=today_start,  # 마감일이 오늘이거나 이후
             status__in=[
                 "TODO",
                 "IN_PROGRESS",
                 "REVIEW",
             ],  # 완료되지 않은 작업만
-        )
+        ).with_delay()
 
         # 권한에 따른 필터링
-        if user.role != "ADMIN":
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                dept = Department.objects.get(id=user.department.id)
-                if dept.parent is None:  # 본부인 경우
-                    dept_ids = [dept.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=dept
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:  # 팀인 경우
-                    queryset = queryset.filter(department=user.department)
-            elif user.role == "MANAGER":
-                queryset = queryset.filter(department=user.department)
-            else:
-                queryset = queryset.filter(assignee=user)
+        queryset = scope_queryset(queryset, user)
 
         serializer = TaskSerializer(queryset, many=True)
         return Response(serializer.data)
@@ -514,385 +590,134 @@ class TaskViewSet(viewsets.ModelViewSet):
     def delayed_tasks(self, request):
         """대시보드용 지연된 작업 조회 API"""
         user = request.user
-        today = timezone.now().date()
+        today_start = day_start(timezone.now().date())
 
         # 기본 쿼셋 (마감일 오늘 이전이고 아직 완료되지 않은 작업)
-        queryset = Task.objects.filter(
-            due_date__date__lt=today,  # 마감일이 오늘 이전인 작업
+        queryset = Task.objects.for_detail().filter(
+            due_date__lt=today_start,  # 마감일이 오늘 이전인 작업
             status__in=["TODO", "IN_PROGRESS", "REVIEW"],  # 완료되지 않은 작업
-        )
+        ).with_delay()
 
         # 권한에 따른 필터링
-        if user.role != "ADMIN":
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                dept = Department.objects.get(id=user.department.id)
-                if dept.parent is None:  # 본부인 경우
-                    dept_ids = [dept.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=dept
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:  # 팀인 경우
-                    queryset = queryset.filter(department=user.department)
-            elif user.role == "MANAGER":
-                queryset = queryset.filter(department=user.department)
-            else:
-                queryset = queryset.filter(assignee=user)
+        queryset = scope_queryset(queryset, user)
 
         serializer = TaskSerializer(queryset, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"], url_path="workload-stats")
     def workload_stats(self, request):
-        """작업 부하 통계"""
-        today = timezone.now().date()
-        start_date = today - timedelta(days=7)
+        """작업 부하 통계 (days=7~90, 기본 7일)"""
+        days, error_response = self.get_workload_days(request)
+        if error_response:
+            return error_response
 
-        # 권한에 따른 쿼리셋 필터링
-        if request.user.role == "ADMIN":
-            queryset = Task.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:  # 본부장인 경우
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = Task.objects.filter(department_id__in=dept_ids)
-            else:  # 팀장인 경우
-                queryset = Task.objects.filter(
-                    department=request.user.department
-                )
-        elif request.user.role == "MANAGER":
-            queryset = Task.objects.filter(department=request.user.department)
-        else:
-            queryset = Task.objects.filter(assignee=request.user)
-
-        # 일별 통계 계산
-        daily_stats = []
-        for i in range(7):
-            date = start_date + timedelta(days=i)
-            stats = {
-                "date": date.strftime("%Y-%m-%d"),
-                "total": queryset.filter(start_date__date=date).count(),
-                "completed": queryset.filter(
-                    completed_at__date=date, status="DONE"
-                ).count(),
-                "inProgress": queryset.filter(
-                    start_date__date=date, status="IN_PROGRESS"
-                ).count(),
-                "delayed": queryset.filter(
-                    due_date__date=date, status__in=["TODO", "IN_PROGRESS"]
-                ).count(),
-            }
-            daily_stats.append(stats)
-
-        return Response(daily_stats)
+        dashboard = Dashboard(request.user, workload_days=days)
+        return Response(dashboard.workload_stats())
 
     @action(detail=False, methods=["get"], url_path="priority-stats")
     def priority_stats(self, request):
         """우선순위별 작업 통계"""
-        # 권한에 따른 쿼리셋 필터링
-        if request.user.role == "ADMIN":
-            queryset = Task.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = Task.objects.filter(department_id__in=dept_ids)
-            else:
-                queryset = Task.objects.filter(
-                    department=request.user.department
-                )
-        elif request.user.role == "MANAGER":
-            queryset = Task.objects.filter(department=request.user.department)
-        else:
-            queryset = Task.objects.filter(assignee=request.user)
-
-        stats = []
-        total = queryset.count()
-        for priority, _ in Task.PRIORITY_CHOICES:
-            count = queryset.filter(priority=priority).count()
-            percentage = (count / total * 100) if total > 0 else 0
-            stats.append(
-                {
-                    "priority": priority,
-                    "count": count,
-                    "percentage": round(percentage, 1),
-                }
-            )
-        return Response(stats)
+        dashboard = Dashboard(request.user)
+        return conditional_response(
+            request,
+            queryset_validator(dashboard.tasks),
+            lambda: Response(dashboard.priority_stats()),
+        )
 
     @action(detail=False, methods=["get"], url_path="upcoming-deadlines")
     def upcoming_deadlines(self, request):
         """다가오는 마감일 작업"""
-        today = timezone.now().date()
-        end_date = today + timedelta(days=7)  # 일주일 이내 마감
-
-        # 권한에 따른 쿼리셋 필터링
-        if request.user.role == "ADMIN":
-            queryset = Task.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = Task.objects.filter(department_id__in=dept_ids)
-            else:
-                queryset = Task.objects.filter(
-                    department=request.user.department
-                )
-        elif request.user.role == "MANAGER":
-            queryset = Task.objects.filter(department=request.user.department)
-        else:
-            queryset = Task.objects.filter(assignee=request.user)
-
-        upcoming_tasks = queryset.filter(
-            due_date__date__range=[today, end_date],
-            status__in=["TODO", "IN_PROGRESS"],
-        ).order_by("due_date")[
-            :5
-        ]  # 상위 5개만
-
-        serializer = TaskSerializer(upcoming_tasks, many=True)
-        return Response(serializer.data)
+        return Response(Dashboard(request.user).upcoming_deadlines())
 
     @action(detail=False, methods=["get"], url_path="team-performance")
     def team_performance(self, request):
-        """팀 성과 통계"""
-        # 권한에 따른 팀원 목록 조회
-        if request.user.role == "ADMIN":
-            team_members = User.objects.filter(
-                is_active=True,
-                rank__in=[
-                    "STAFF",
-                    "SENIOR",
-                    "ASSISTANT_MANAGER",
-                    "MANAGER",
-                    "DEPUTY_GENERAL_MANAGER",
-                ],  # 본부장/이사 제외
-            )
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                team_members = User.objects.filter(
-                    department_id__in=dept_ids,
-                    is_active=True,
-                    rank__in=[
-                        "STAFF",
-                        "SENIOR",
-                        "ASSISTANT_MANAGER",
-                        "MANAGER",
-                        "DEPUTY_GENERAL_MANAGER",
-                    ],  # 본부장/이사 ���외
-                )
-            else:
-                team_members = User.objects.filter(
-                    department=request.user.department,
-                    is_active=True,
-                    rank__in=[
-                        "STAFF",
-                        "SENIOR",
-                        "ASSISTANT_MANAGER",
-                        "MANAGER",
-                        "DEPUTY_GENERAL_MANAGER",
-                    ],  # 본부장/이사 제외
-                )
-        else:
-            team_members = User.objects.filter(
-                department=request.user.department,
-                is_active=True,
-                rank__in=[
-                    "STAFF",
-                    "SENIOR",
-                    "ASSISTANT_MANAGER",
-                    "MANAGER",
-                    "DEPUTY_GENERAL_MANAGER",
-                ],  # 본부장/이사 제외
-            )
-
-        # 각 팀원별 성과 계산
-        performance_data = []
-        for member in team_members:
-            # 전체 작업 수와 완료된 작업 수 계
-            member_tasks = Task.objects.filter(assignee=member)
-            total_tasks = member_tasks.count()
-            completed_tasks = member_tasks.filter(status="DONE").count()
-            completion_rate = (
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-            )
+        """팀 성과 통계
 
-            # 평가 점수 계산 - 완료된 작업만 대상으로
-            completed_task_ids = member_tasks.filter(
-                status="DONE"
-            ).values_list("id", flat=True)
-            evaluations = TaskEvaluation.objects.filter(
-                task_id__in=completed_task_ids
+        ordering(name, task_count, completion_rate, average_score, "-" 내림차순)
+        과 page/page_size 파라미터로 팀원 목록을 정렬/분할할 수 있다.
+        """
+        try:
+            page = int(request.query_params.get("page", 1))
+            page_size = min(
+                int(request.query_params.get("page_size", 0)),
+                StandardResultsSetPagination.max_page_size,
             )
-            avg_score = (
-                evaluations.aggregate(Avg("performance_score"))[
-                    "performance_score__avg"
-                ]
-                or 0
+        except ValueError:
+            return Response(
+                {"detail": "page와 page_size는 정수여야 합니다."}, status=400
             )
 
-            performance_data.append(
-                {
-                    "user_id": member.id,
-                    "name": f"{member.last_name}{member.first_name}",
-                    "completion_rate": round(completion_rate, 1),
-                    "task_count": total_tasks,
-                    "average_score": round(avg_score, 1),
-                }
+        return Response(
+            Dashboard(request.user).team_performance(
+                ordering=request.query_params.get("ordering"),
+                page=page,
+                page_size=page_size,
             )
-
-        return Response({"members": performance_data})
+        )
 
     @action(detail=False, methods=["get"], url_path="recent")
     def recent_activities(self, request):
         """최근 작업 활동 내역"""
-        # 한에 따른 쿼리셋 터링
-        if request.user.role == "ADMIN":
-            queryset = TaskHistory.objects.all()
-        elif request.user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if request.user.department.parent is None:
-                dept_ids = [request.user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=request.user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                queryset = TaskHistory.objects.filter(
-                    task__department_id__in=dept_ids
-                )
-            else:
-                queryset = TaskHistory.objects.filter(
-                    task__department=request.user.department
-                )
-        else:
-            queryset = TaskHistory.objects.filter(
-                Q(task__assignee=request.user) | Q(changed_by=request.user)
-            )
+        return Response(Dashboard(request.user).recent())
 
-        recent_activities = queryset.select_related(
-            "task", "changed_by"
-        ).order_by("-created_at")[:10]
-
-        def get_status_text(status: str) -> str:
-            status_map = {
-                "TODO": "예정",
-                "IN_PROGRESS": "진행중",
-                "REVIEW": "검토중",
-                "DONE": "완료",
-                "HOLD": "보���",
-            }
-            return status_map.get(status, status)
+    @action(detail=False, methods=["get"], url_path="stats")
+    def stats(self, request):
+        """작업 전반적인 통계"""
+        dashboard = Dashboard(request.user)
+        # 지연/지난주 대비 수치는 날짜가 바뀌면 달라진다
+        return conditional_response(
+            request,
+            [*queryset_validator(dashboard.tasks), dashboard.today],
+            lambda: Response(dashboard.stats()),
+        )
 
-        activities_data = []
-        for activity in recent_activities:
-            activities_data.append(
+    @action(detail=False, methods=["get"])
+    def dashboard(self, request):
+        """대시보드 패널 통합 조회
+
+        panels 파라미터로 필요한 패널만 선택할 수 있다.
+        (예: ?panels=stats,priority_stats,recent)
+        """
+        try:
+            panels = Dashboard.parse_panels(request.query_params.get("panels"))
+        except ValueError as e:
+            return Response(
                 {
-                    "id": activity.id,
-                    "type": "STATUS_CHANGED",
-                    "description": (
-                        "작업 상태가"
-                        f" {get_status_text(activity.previous_status)}에서"
-                        f" {get_status_text(activity.new_status)}로"
-                        " 변경되었습니다."
-                    ),
-                    "created_at": activity.created_at,
-                    "task_id": activity.task.id,
-                    "task_title": activity.task.title,
-                }
+                    "detail": f"알 수 없는 패널입니다: {e}",
+                    "available_panels": Dashboard.PANELS,
+                },
+                status=400,
             )
 
-        return Response(activities_data)
+        days, error_response = self.get_workload_days(request)
+        if error_response:
+            return error_response
 
-    @action(detail=False, methods=["get"], url_path="stats")
-    def stats(self, request):
-        """작업 전반적인 통계"""
-        today = timezone.now().date()
-        last_week = today - timedelta(days=7)
+        dashboard = Dashboard(request.user, workload_days=days)
+        return Response(dashboard.build(panels))
 
-        # 권한에 따른 쿼리셋 필터링
-        queryset = Task.objects.all()
-        user = request.user
-
-        # ADMIN은 모든 작업 조회 가능
-        if user.role != "ADMIN":
-            if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-                if user.department.parent is None:  # 본부장인 경우
-                    dept_ids = [user.department.id]
-                    child_dept_ids = Department.objects.filter(
-                        parent=user.department
-                    ).values_list("id", flat=True)
-                    dept_ids.extend(child_dept_ids)
-                    queryset = queryset.filter(department_id__in=dept_ids)
-                else:  # 팀장인 경우
-                    queryset = queryset.filter(department=user.department)
-            elif user.role == "MANAGER":
-                queryset = queryset.filter(department=user.department)
-            else:
-                queryset = queryset.filter(assignee=user)
-
-        # 이번 주 통계
-        total_tasks = queryset.count()
-        in_progress_tasks = queryset.filter(status="IN_PROGRESS").count()
-        completed_tasks = queryset.filter(status="DONE").count()
-        delayed_tasks = queryset.filter(
-            due_date__date__lt=today, status__in=["TODO", "IN_PROGRESS"]
-        ).count()
-
-        # 지난 주 통계
-        last_week_queryset = queryset.filter(created_at__date__lte=last_week)
-        last_week_total = last_week_queryset.count()
-        last_week_in_progress = last_week_queryset.filter(
-            status="IN_PROGRESS"
-        ).count()
-        last_week_completed = last_week_queryset.filter(status="DONE").count()
-        last_week_delayed = last_week_queryset.filter(
-            due_date__date__lt=last_week, status__in=["TODO", "IN_PROGRESS"]
-        ).count()
-
-        # 증감률 계산
-        def calculate_trend(current, previous):
-            if previous == 0:
-                return 100 if current > 0 else 0
-            return round(((current - previous) / previous) * 100, 1)
+    def get_workload_days(self, request):
+        """작업 부하 통계 기간(days) 파라미터 검증
 
-        return Response(
-            {
-                "total": {
-                    "count": total_tasks,
-                    "trend": calculate_trend(total_tasks, last_week_total),
-                },
-                "in_progress": {
-                    "count": in_progress_tasks,
-                    "trend": calculate_trend(
-                        in_progress_tasks, last_week_in_progress
-                    ),
-                },
-                "completed": {
-                    "count": completed_tasks,
-                    "trend": calculate_trend(
-                        completed_tasks, last_week_completed
-                    ),
-                },
-                "delayed": {
-                    "count": delayed_tasks,
-                    "trend": calculate_trend(delayed_tasks, last_week_delayed),
+        (기간, None) 또는 잘못된 값인 경우 (None, 400 응답)을 반환한다.
+        """
+        try:
+            days = Dashboard.parse_workload_days(
+                request.query_params.get("days")
+            )
+        except ValueError:
+            return None, Response(
+                {
+                    "detail": (
+                        "days는 {}~{} 사이의 정수여야 합니다.".format(
+                            Dashboard.MIN_WORKLOAD_DAYS,
+                            Dashboard.MAX_WORKLOAD_DAYS,
+                        )
+                    )
                 },
-            }
-        )
+                status=400,
+            )
+        return days, None
 
 
 class TaskCommentViewSet(viewsets.ModelViewSet):
@@ -920,6 +745,7 @@ class TaskCommentViewSet(viewsets.ModelViewSet):
                     f" {comment.task.title}"
                 ),
             )
+            notify_users([comment.task.assignee_id])
 
 
 class TaskAttachmentViewSet(viewsets.ModelViewSet):
@@ -955,11 +781,24 @@ class TaskHistoryViewSet(viewsets.ModelViewSet):
         )
 
 
-class TaskTimeLogViewSet(viewsets.ModelViewSet):
+class TaskTimeLogViewSet(ExportViewSetMixin, viewsets.ModelViewSet):
     queryset = TaskTimeLog.objects.all()
     serializer_class = TaskTimeLogSerializer
     pagination_class = StandardResultsSetPagination
     filterset_fields = ["task"]
+    export_filename = "time-logs"
+    export_fields = {
+        "id": "id",
+        "task_id": "task_id",
+        "task_title": "task__title",
+        "department": "task__department__name",
+        "logged_by_employee_id": "logged_by__employee_id",
+        "logged_by_last_name": "logged_by__last_name",
+        "logged_by_first_name": "logged_by__first_name",
+        "start_time": "start_time",
+        "end_time": "end_time",
+        "duration_seconds": "duration",
+    }
 
     def get_queryset(self):
         queryset = TaskTimeLog.objects.select_related("logged_by")
@@ -968,6 +807,15 @@ class TaskTimeLogViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(task_id=task_id)
         return queryset.order_by("-start_time")
 
+    def get_export_queryset(self):
+        # 작업 목록과 같은 범위의 작업에 대한 기록만 내보냄
+        return scope_queryset(
+            super().get_export_queryset(),
+            self.request.user,
+            department_field="task__department",
+            assignee_field="task__assignee",
+        )
+
     def perform_create(self, serializer):
         data = self.request.data
         start_time = parse_datetime(data.get("start_time")) or timezone.now()
@@ -1004,19 +852,50 @@ class TaskTimeLogViewSet(viewsets.ModelViewSet):
             raise
 
 
-class TaskEvaluationViewSet(viewsets.ModelViewSet):
+class TaskEvaluationViewSet(
+    ExportViewSetMixin, FieldsetViewSetMixin, viewsets.ModelViewSet
+):
     queryset = TaskEvaluation.objects.all()
     serializer_class = TaskEvaluationSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = StandardResultsSetPagination
+    export_filename = "evaluations"
+    export_fields = {
+        "id": "id",
+        "task_id": "task_id",
+        "task_title": "task__title",
+        "department": "task__department__name",
+        "assignee_employee_id": "task__assignee__employee_id",
+        "evaluator_employee_id": "evaluator__employee_id",
+        "difficulty": "difficulty",
+        "performance_score": "performance_score",
+        "feedback": "feedback",
+        "created_at": "created_at",
+    }
 
     def get_queryset(self):
         queryset = TaskEvaluation.objects.select_related(
-            "task",
-            "evaluator",
-            "task__department",  # department 정보도 함께 로드
-            "task__assignee",  # assignee 정보도 함께 로드
+            "task", "evaluator", "task__assignee"
         )
+        if "task" in self.get_fieldset().expand:
+            # 전체 작업(TaskSerializer): 부서/보고자와 코멘트까지 미리 조회
+            queryset = queryset.select_related(
+                "task__department", "task__reporter"
+            ).prefetch_related(
+                Prefetch(
+                    "task__comments",
+                    queryset=TaskComment.objects.select_related("author"),
+                )
+            )
+        else:
+            # 작업 요약에는 본문 컬럼이 필요 없음
+            queryset = queryset.defer(
+                "task__description",
+                "task__milestone_description",
+                "task__working_hours",
+                "task__search_vector",
+            )
+        queryset = self.prune_queryset(queryset)
         user = self.request.user
         task_id = self.request.query_params.get("task")
 
@@ -1024,28 +903,13 @@ class TaskEvaluationViewSet(viewsets.ModelViewSet):
         if task_id:
             queryset = queryset.filter(task_id=task_id)
 
-        # ADMIN은 모든 평가 조회 가능
-        if user.role == "ADMIN":
-            return queryset
-
-        # DIRECTOR/GENERAL_MANAGER는 본부 내 평가만 조회 가능
-        if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if user.department.parent is None:  # 본부장인 경우
-                dept_ids = [user.department.id]
-                child_dept_ids = Department.objects.filter(
-                    parent=user.department
-                ).values_list("id", flat=True)
-                dept_ids.extend(child_dept_ids)
-                return queryset.filter(task__department_id__in=dept_ids)
-            else:  # 팀장인 경우
-                return queryset.filter(task__department=user.department)
-
-        # MANAGER는 팀 내 평가만 조회 가능
-        if user.role == "MANAGER":
-            return queryset.filter(task__department=user.department)
-
-        # EMPLOYEE는 자신의 작업에 대한 평가만 조회 가능
-        return queryset.filter(task__assignee=user)
+        # ADMIN 전체, 본부장/이사 본부 내, 팀장 팀 내, 직원 본인 작업 평가
+        return scope_queryset(
+            queryset,
+            user,
+            department_field="task__department",
+            assignee_field="task__assignee",
+        )
 
     def perform_create(self, serializer):
         user = self.request.user
@@ -1086,20 +950,11 @@ class TaskEvaluationViewSet(viewsets.ModelViewSet):
         if user.role == "ADMIN":
             return True
 
-        # DIRECTOR/GENERAL_MANAGER는 본부 내 작업 평가 가능
-        if user.rank in ["DIRECTOR", "GENERAL_MANAGER"]:
-            if user.department.parent is None:  # 본부장인 경우
-                return (
-                    task.department.id == user.department.id  # 직속 부서
-                    or task.department.parent_id
-                    == user.department.id  # 산하 팀
-                )
-            else:  # 팀장인 경우
-                return task.department.id == user.department.id
-
-        # MANAGER는 팀 내 작업만 평가 가능
-        if user.role == "MANAGER":
-            return task.department.id == user.department.id
+        # DIRECTOR/GENERAL_MANAGER는 본부 내, MANAGER는 팀 내 작업 평가 가능
+        if user.rank in ["DIRECTOR", "GENERAL_MANAGER"] or (
+            user.role == "MANAGER"
+        ):
+            return task.department_id in get_visible_department_ids(user)
 
         return False
 
@@ -0,0 +1,92 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Task
+
+# 난이도 가중치 (weight=difficulty)
+DIFFICULTY_WEIGHTS = {
+    "EASY": 1,
+    "MEDIUM": 2,
+    "HARD": 3,
+    "VERY_HARD": 4,
+}
+
+WEIGHTS = ["count", "hours", "difficulty"]
+
+# 한 번에 조회할 수 있는 최대 기간 (일)
+MAX_WORKLOAD_DAYS = 90
+
+
+def workload_matrix(user_ids, start_date, end_date, weight="count"):
+    """사용자 x 일자 작업 부하 행렬 계산
+
+    (담당자, 시작일, 마감일, 난이도) 단위로 묶은 한 번의 GROUP BY 결과를
+    기간 내 일자에 펼쳐서 사용자별 일일 부하와 작업 수를 반환한다.
+
+    - count: 해당 일에 진행 중인 작업 수
+    - hours: 예상 소요 시간을 작업 기간에 고르게 나눈 일일 시간
+    - difficulty: 난이도 가중치 합
+
+    반환값: {user_id: {"tasks_count": int, "load": [일자별 값]}}
+    """
+    days = (end_date - start_date).days + 1
+    range_start = timezone.make_aware(datetime.combine(start_date, time.min))
+    range_end = timezone.make_aware(
+        datetime.combine(end_date + timedelta(days=1), time.min)
+    )
+
+    groups = (
+        Task.objects.filter(
+            assignee_id__in=user_ids,
+            start_date__lt=range_end,
+            due_date__gte=range_start,
+        )
+        .annotate(
+            start_day=TruncDate("start_date"), due_day=TruncDate("due_date")
+        )
+        .values("assignee_id", "start_day", "due_day", "difficulty")
+        .annotate(task_count=Count("pk"), hours=Sum("estimated_hours"))
+        .order_by()
+    )
+
+    matrix = {
+        user_id: {"tasks_count": 0, "load": [0] * days}
+        for user_id in user_ids
+    }
+    for group in groups:
+        row = matrix[group["assignee_id"]]
+        row["tasks_count"] += group["task_count"]
+
+        span = max((group["due_day"] - group["start_day"]).days + 1, 1)
+        if weight == "hours":
+            daily = (group["hours"] or 0) / span
+        elif weight == "difficulty":
+            daily = (
+                DIFFICULTY_WEIGHTS.get(group["difficulty"], 1)
+                * group["task_count"]
+            )
+        else:
+            daily = group["task_count"]
+
+        first = max((group["start_day"] - start_date).days, 0)
+        last = min((group["due_day"] - start_date).days, days - 1)
+        for index in range(first, last + 1):
+            row["load"][index] += daily
+
+    if weight == "hours":
+        for row in matrix.values():
+            row["load"] = [round(value, 1) for value in row["load"]]
+
+    return matrix
+
+
+def date_range(start_date, end_date):
+    """start_date부터 end_date까지의 날짜 목록"""
+    return [
+        start_date + timedelta(days=i)
+        for i in range((end_date - start_date).days + 1)
+    ]
+